@@ -0,0 +1,345 @@
+########################################
+# ARBEITSHEFT-GENERATOR 📒
+########################################
+# Erstellt ein ganzes Heft mit hunderten Seiten als PDF:
+# - jede Seite: 20 nummerierte Kreise zum Ausmalen (wie im Ausmalbuch)
+#   und 20 Klammerrechnung-Aufgaben - das Ergebnis von Aufgabe 7 kommt
+#   in Kreis 7
+# - dazu ein eigenes Lösungsheft (<name>_loesungen.pdf)
+#
+# So bleibt es schnell und der Speicher flach:
+# - die Seiten werden in Teile zu SEITEN_PRO_TEIL Seiten zerlegt, jeder
+#   Teil wird in einem eigenen Prozess als kleines PDF gerendert
+# - die Aufgaben jeder Seite hängen nur von (seed, seite) ab - egal
+#   welcher Prozess die Seite rendert, das Lösungsheft rechnet sie
+#   einfach noch einmal aus, statt sie herumzureichen
+# - am Ende werden die Teile Teil für Teil in die fertige Datei kopiert
+#   (Objekte neu nummeriert, eine gemeinsame Seiten-Wurzel) - es liegt nie
+#   mehr als ein Teil im Speicher, egal wie viele Seiten das Heft hat
+#
+# Beispiele:
+#   python arbeitsheft.py 500 --seed 42 --ausgabe heft.pdf
+#   python arbeitsheft.py --benchmark 200
+########################################
+
+import os
+import re
+import shutil
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "subfuc"))
+from aufgaben_batch import QUESTS, als_text, erzeuge_aufgaben
+
+QUESTEN = ("klammer1", "klammer2", "klammer3")  # reihum, eine Art pro Seite
+SPALTEN, REIHEN = 5, 4
+AUFGABEN_PRO_SEITE = SPALTEN * REIHEN
+SEITEN_PRO_TEIL = 25      # Seiten pro Arbeits-Prozess-Auftrag (bestimmt den Speicher pro Prozess)
+BLAETTER_PRO_LOESUNG = 12  # so viele Arbeitsblätter passen auf eine Lösungsseite
+
+
+########################################
+# AUFGABEN PRO SEITE
+########################################
+
+def seiten_aufgaben(seite, seed=0, mana=10):
+    """
+    Die Aufgaben einer Seite - immer dieselben für (seed, seite).
+
+    Rückgabe:
+    - (quest, texte, loesungen)
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(seite,)))
+    quest = QUESTEN[seite % len(QUESTEN)]
+    operanden, loesungen = erzeuge_aufgaben(quest, AUFGABEN_PRO_SEITE, mana, rng)
+    return quest, als_text(quest, operanden), loesungen.tolist()
+
+
+########################################
+# SEITEN ZEICHNEN
+########################################
+
+def zeichne_arbeitsblatt(pdf_canvas, seite, seed, mana):
+    """Eine Seite: Kreise mit Nummern oben, Aufgaben unten."""
+    breite, hoehe = A4
+    quest, texte, _ = seiten_aufgaben(seite, seed, mana)
+
+    pdf_canvas.setFont("Helvetica-Bold", 16)
+    pdf_canvas.drawCentredString(breite / 2, hoehe - 50, QUESTS[quest]["titel"])
+    pdf_canvas.setFont("Helvetica", 10)
+    pdf_canvas.drawCentredString(breite / 2, hoehe - 70,
+                                 "Rechne aus, schreibe das Ergebnis in den Kreis mit derselben Nummer und male ihn aus!")
+
+    # Kreise zum Ausmalen (Nummer ÜBER dem Kreis)
+    pdf_canvas.setLineWidth(2)
+    pdf_canvas.setFont("Helvetica-Bold", 12)
+    for nummer in range(AUFGABEN_PRO_SEITE):
+        reihe, spalte = divmod(nummer, SPALTEN)
+        x = 100 + spalte * 100
+        y = hoehe - 140 - reihe * 80
+        pdf_canvas.circle(x, y, 24, stroke=1, fill=0)
+        pdf_canvas.drawCentredString(x, y + 29, str(nummer + 1))
+
+    # Aufgaben in zwei Spalten
+    pdf_canvas.setFont("Helvetica", 12)
+    for nummer, text in enumerate(texte):
+        spalte, zeile = divmod(nummer, AUFGABEN_PRO_SEITE // 2)
+        pdf_canvas.drawString(60 + spalte * 260, hoehe - 480 - zeile * 30, f"{nummer + 1:>2})  {text} = ________")
+
+    pdf_canvas.setFont("Helvetica", 9)
+    pdf_canvas.drawCentredString(breite / 2, 30, f"Seite {seite + 1}")
+
+def zeichne_loesungsseite(pdf_canvas, loesungs_seite, seiten, seed, mana):
+    """Lösungen für die Arbeitsblätter loesungs_seite * BLAETTER_PRO_LOESUNG ..."""
+    breite, hoehe = A4
+    pdf_canvas.setFont("Helvetica-Bold", 16)
+    pdf_canvas.drawCentredString(breite / 2, hoehe - 50, "Lösungen")
+    y = hoehe - 90
+    erste = loesungs_seite * BLAETTER_PRO_LOESUNG
+    for seite in range(erste, min(erste + BLAETTER_PRO_LOESUNG, seiten)):
+        _, _, loesungen = seiten_aufgaben(seite, seed, mana)
+        pdf_canvas.setFont("Helvetica-Bold", 10)
+        pdf_canvas.drawString(50, y, f"Seite {seite + 1}")
+        pdf_canvas.setFont("Helvetica", 10)
+        haelfte = AUFGABEN_PRO_SEITE // 2
+        for zeile in range(2):
+            teil = loesungen[zeile * haelfte:(zeile + 1) * haelfte]
+            pdf_canvas.drawString(110, y, "   ".join(f"{zeile * haelfte + nummer + 1}) {wert}"
+                                                   for nummer, wert in enumerate(teil)))
+            y -= 14
+        y -= 8
+
+def rendere_teil(auftrag):
+    """
+    Rendert einen Teil (ein Bereich von Seiten) in eine eigene PDF-Datei - läuft im Arbeits-Prozess.
+
+    Parameter:
+    - auftrag: (art, von, bis, seiten, seed, mana, pfad), art = "blatt" oder "loesung"
+    """
+    art, von, bis, seiten, seed, mana, pfad = auftrag
+    pdf_canvas = canvas.Canvas(pfad, pagesize=A4, invariant=1)  # invariant: gleiche Bytes bei gleichem Inhalt
+    for nummer in range(von, bis):
+        if art == "blatt":
+            zeichne_arbeitsblatt(pdf_canvas, nummer, seed, mana)
+        else:
+            zeichne_loesungsseite(pdf_canvas, nummer, seiten, seed, mana)
+        pdf_canvas.showPage()
+    pdf_canvas.save()
+    return pfad
+
+
+########################################
+# HEFT ZUSAMMENSETZEN
+########################################
+
+_OBJEKT = re.compile(rb"(\d+) 0 obj\r?\n")
+_VERWEIS = re.compile(rb"(\d+) 0 R\b")
+_STREAM = re.compile(rb"stream\r?\n")
+
+def _lies_teil(daten):
+    """
+    Objekte eines Teil-PDFs, so wie reportlab es schreibt (klassische xref-Tabelle,
+    keine Objekt-Streams).
+
+    Rückgabe:
+    - (objekte, trailer): objekte = [(nummer, start, ende)] in Datei-Reihenfolge,
+      start/ende umschließen den Inhalt zwischen "N 0 obj" und "endobj"
+    """
+    xref = int(daten[daten.rindex(b"startxref") + 9:].split()[0])
+    kopf, trailer = daten[xref:].split(b"trailer", 1)
+    zeilen = kopf.split(b"\n")
+    erste = int(zeilen[1].split()[0])
+    objekte = []
+    for nummer, zeile in enumerate(zeilen[2:], erste):
+        teile = zeile.split()
+        if len(teile) < 3 or teile[2] != b"n":
+            continue
+        kopf_treffer = _OBJEKT.match(daten, int(teile[0]))
+        start = kopf_treffer.end()
+        ende = daten.find(b"endobj", start)
+        stream = _STREAM.search(daten, start, ende)
+        if stream:
+            # "endobj" könnte auch in den Stream-Daten stehen: hinter /Length weitersuchen
+            laenge = int(re.search(rb"/Length (\d+)", daten[start:stream.start()]).group(1))
+            ende = daten.find(b"endobj", stream.end() + laenge)
+        objekte.append((nummer, start, ende))
+    return objekte, trailer
+
+def fuege_zusammen(teile, ziel):
+    """
+    Hängt die Teil-PDFs hintereinander und schreibt das Heft der Reihe nach.
+
+    Es wird immer nur ein Teil gelesen; von den fertigen Objekten bleibt nur
+    ihre Byte-Position (8 Bytes) im Speicher. Die Seiten-Wurzel jedes Teils
+    wird ein Kind der neuen Wurzel, Katalog und Info der Teile fallen weg.
+    """
+    positionen = array("q", [0, 0])  # Objekt 1: Katalog, Objekt 2: Seiten-Wurzel (kommen ans Ende)
+    kinder = []
+    seiten = 0
+    temp = ziel + ".tmp"
+    with open(temp, "wb") as datei:
+        datei.write(b"%PDF-1.3\n%\xe2\xe3\xcf\xd3\n")
+        for teil in teile:
+            with open(teil, "rb") as quelle:
+                daten = quelle.read()
+            objekte, trailer = _lies_teil(daten)
+            wurzel = int(re.search(rb"/Root (\d+) 0 R", trailer).group(1))
+            info = re.search(rb"/Info (\d+) 0 R", trailer)
+            weglassen = {wurzel, int(info.group(1)) if info else None}
+            katalog = next(daten[start:ende] for nummer, start, ende in objekte if nummer == wurzel)
+            seiten_knoten = int(re.search(rb"/Pages (\d+) 0 R", katalog).group(1))
+
+            neu = {}
+            for nummer, _, _ in objekte:
+                if nummer not in weglassen:
+                    neu[nummer] = len(positionen) + len(neu) + 1
+
+            def umnummern(treffer):
+                return b"%d 0 R" % neu[int(treffer.group(1))]
+
+            for nummer, start, ende in objekte:
+                if nummer in weglassen:
+                    continue
+                stream = _STREAM.search(daten, start, ende)
+                kopf = _VERWEIS.sub(umnummern, daten[start:stream.start() if stream else ende])
+                if nummer == seiten_knoten:
+                    seiten += int(re.search(rb"/Count (\d+)", kopf).group(1))
+                    kopf = kopf.replace(b"<<", b"<<\n/Parent 2 0 R", 1)
+                    kinder.append(neu[nummer])
+                positionen.append(datei.tell())
+                datei.write(b"%d 0 obj\n" % neu[nummer])
+                datei.write(kopf)
+                if stream:
+                    datei.write(daten[stream.start():ende])
+                datei.write(b"endobj\n")
+
+        positionen[0] = datei.tell()
+        datei.write(b"1 0 obj\n<<\n/Pages 2 0 R /Type /Catalog\n>>\nendobj\n")
+        positionen[1] = datei.tell()
+        datei.write(b"2 0 obj\n<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>\nendobj\n"
+                    % (seiten, b" ".join(b"%d 0 R" % kind for kind in kinder)))
+        xref = datei.tell()
+        datei.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(positionen) + 1))
+        for position in positionen:
+            datei.write(b"%010d 00000 n \n" % position)
+        datei.write(b"trailer\n<<\n/Root 1 0 R /Size %d\n>>\nstartxref\n%d\n%%%%EOF\n"
+                    % (len(positionen) + 1, xref))
+    os.replace(temp, ziel)
+
+def erstelle_arbeitsheft(dateiname, seiten, seed=0, mana=10, prozesse=None, loesungen=True,
+                         seiten_pro_teil=SEITEN_PRO_TEIL):
+    """
+    Erstellt das Heft (und das Lösungsheft) aus parallel gerenderten Teilen.
+
+    Parameter:
+    - dateiname: z.B. "arbeitsheft.pdf"
+    - seiten: Anzahl Arbeitsblätter
+    - seed: gleicher Seed = gleiche Aufgaben
+    - mana: Zahlen aus [-mana, mana]
+    - prozesse: Arbeits-Prozesse (None = alle Kerne, 1 = ohne Pool)
+    - loesungen: Lösungsheft dazu erstellen
+    - seiten_pro_teil: Seiten pro Teil-PDF
+
+    Rückgabe:
+    - Liste der fertigen PDF-Dateien
+    """
+    name = os.path.splitext(dateiname)[0]
+    ordner = name + "_teile"
+    os.makedirs(ordner, exist_ok=True)
+
+    hefte = {dateiname: ("blatt", seiten)}
+    if loesungen:
+        hefte[name + "_loesungen.pdf"] = ("loesung", -(-seiten // BLAETTER_PRO_LOESUNG))
+    auftraege = []
+    for heft, (art, anzahl) in hefte.items():
+        for von in range(0, anzahl, seiten_pro_teil):
+            pfad = os.path.join(ordner, f"{art}_{von:06d}.pdf")
+            auftraege.append((art, von, min(von + seiten_pro_teil, anzahl), seiten, seed, mana, pfad))
+
+    if prozesse == 1:
+        fertig = list(map(rendere_teil, auftraege))
+    else:
+        with ProcessPoolExecutor(prozesse) as pool:
+            fertig = list(pool.map(rendere_teil, auftraege))
+
+    for heft, (art, _) in hefte.items():
+        fuege_zusammen([pfad for (auftrag_art, *_), pfad in zip(auftraege, fertig) if auftrag_art == art], heft)
+    shutil.rmtree(ordner)
+    return list(hefte)
+
+
+########################################
+# BENCHMARK + START
+########################################
+
+def _heft_mit_speicher(auftrag):
+    """Läuft in einem frischen Prozess: Heft erstellen, eigene Speicher-Spitze in MB zurückgeben."""
+    import resource
+
+    pfad, seiten, prozesse = auftrag
+    erstelle_arbeitsheft(pfad, seiten, seed=42, prozesse=prozesse)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def benchmark(seiten=200):
+    import hashlib
+    import multiprocessing
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as ordner:
+        pruefsummen = {}
+        # Jeder Lauf in einem frischen Prozess - sonst zeigt ru_maxrss nur die Spitze des größten Laufs
+        for anzahl, prozesse in ((seiten, 1), (seiten, None), (seiten * 10, None)):
+            pfad = os.path.join(ordner, f"heft_{anzahl}_{prozesse}.pdf")
+            start = time.perf_counter()
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as messung:
+                spitze = messung.submit(_heft_mit_speicher, (pfad, anzahl, prozesse)).result()
+            dauer = time.perf_counter() - start
+            if anzahl == seiten:
+                with open(pfad, "rb") as datei:
+                    pruefsummen[prozesse] = hashlib.sha256(datei.read()).hexdigest()
+            print(f"📒 {anzahl} Seiten, {prozesse or os.cpu_count()} Prozesse: {dauer:6.2f} s, "
+                  f"{os.path.getsize(pfad) / 1e6:.1f} MB, Speicher-Spitze Haupt-Prozess {spitze:.0f} MB")
+    print(f"   {'✅ identisch' if pruefsummen[1] == pruefsummen[None] else '❌ VERSCHIEDEN'} (1 Prozess vs. alle)")
+
+def run():
+    """Fragt die Seitenzahl ab, erstellt Heft + Lösungen und öffnet das Heft."""
+    # Log-System aktivieren (hier und nicht beim Import - die Arbeits-Prozesse importieren dieses Modul auch)
+    import log
+    log.run()
+
+    from formen_als_pdf import oeffne_pdf_datei
+
+    print("📒 Arbeitsheft-Generator startet...")
+    eingabe = input("Wie viele Seiten? (Standard 50): ").strip()
+    seiten = int(eingabe) if eingabe.isdigit() else 50
+    dateien = erstelle_arbeitsheft("arbeitsheft.pdf", seiten)
+    print(f"✅ Fertig: {', '.join(dateien)}")
+    oeffne_pdf_datei(dateien[0])
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Arbeitsheft mit Kreisen und Klammer-Aufgaben als PDF")
+    parser.add_argument("seiten", type=int, nargs="?")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mana", type=int, default=10)
+    parser.add_argument("--prozesse", type=int, help="Standard: alle Kerne")
+    parser.add_argument("--ausgabe", default="arbeitsheft.pdf")
+    parser.add_argument("--ohne-loesungen", action="store_true")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=200, metavar="SEITEN")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    elif args.seiten:
+        for datei in erstelle_arbeitsheft(args.ausgabe, args.seiten, args.seed, args.mana,
+                                          args.prozesse, not args.ohne_loesungen):
+            print(f"✅ {datei}")
+    else:
+        run()
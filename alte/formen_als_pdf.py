@@ -7,13 +7,36 @@
 # - A4 Format (Hochformat)
 # - Schwarze Linien auf weißem Hintergrund
 # - Automatische PDF-Anzeige nach Erstellung
+#
+# Schnell auch bei tausenden Waben:
+# - die Seite ist eine Szene (szene.py): einmal angeordnet, danach als
+#   PDF, SVG oder HTML ausgebbar; die Ecken des Sechsecks (WABEN_ECKEN)
+#   werden dort einmal berechnet
+# - die Wabe ist ein PDF-Formular (Form-XObject): einmal definiert,
+#   danach pro Wabe nur noch "verschieben + zeichnen" (ein paar Bytes)
+# - Farben und Linienbreite werden einmal pro Seite gesetzt
+# - Positionen ohne Überschneidungen aus platzierung.py (Poisson-Disk)
+# - run() legt die PDF im Render-Cache ab (render_cache.py): jeder Start
+#   und "Neue PDF" ziehen einen frischen Seed (neue Waben); gleicher Seed =
+#   dieselbe Datei, sofort da, keine neue Kopie
+#
+# Benchmark:  python formen_als_pdf.py --benchmark 10000
 ########################################
 
 # Import der benötigten Module
-import time
 import os
 import platform
+import random
 import subprocess
+import time
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from platzierung import platziere
+from render_cache import cache_datei, neuer_seed
+from szene import WABEN_ECKEN, Szene, rendere_pdf
 
 # Log-System aktivieren (protokolliert Programm-Aufrufe)
 import log
@@ -23,15 +46,18 @@ log.run()
 # HAUPTPROGRAMM
 ########################################
 
-def run():
-    """Startet das PDF-Generator Programm - einfach und direkt."""
+def run(seed=None):
+    """
+    Startet das PDF-Generator Programm - einfach und direkt.
+
+    Parameter:
+    - seed: bestimmte Waben zeigen (None = jedes Mal neue)
+    """
     print("🔧 PDF-Generator startet...")
     
-    # PDF-Datei erstellen und sofort öffnen
-    pdf_name = "formen_als_pdf.pdf"
+    # PDF-Datei erstellen (oder fertig aus dem Render-Cache holen) und sofort öffnen
     print("� Erstelle PDF mit 100 sechseckigen Waben (wie Bienenwaben)...")
-    
-    erstelle_waben_pdf(pdf_name)  # PDF erstellen
+    pdf_name = waben_pdf_aus_cache(seed=seed)
     oeffne_pdf_datei(pdf_name)    # PDF öffnen
     
     print("✅ Fertig! PDF wurde erstellt und geöffnet.")
@@ -45,85 +71,91 @@ def run():
 # PDF-ERSTELLUNG FUNKTIONEN
 ########################################
 
-def erstelle_waben_pdf(dateiname):
+WABEN_LINIE = 2  # Linienbreite in Punkten
+WABEN_LUECKE = 4  # Mindestabstand zwischen zwei Waben in Punkten
+
+
+def waben_szene(anzahl_waben=100, waben_groesse=20, seed=None):
+    """
+    Ordnet die Waben einmal auf einer A4-Seite an (siehe szene.py).
+
+    Parameter:
+    - seed: gleicher Seed = gleiche Waben (None = jedes Mal andere)
+
+    Rückgabe:
+    - Szene - als PDF, SVG oder HTML ausgebbar, ohne neu zu rechnen
     """
-    Erstellt eine PDF-Datei mit 100 zufällig verteilten Waben.
+    seiten_breite, seiten_hoehe = A4
+    szene = Szene(seiten_breite, seiten_hoehe, titel=f"{anzahl_waben} Waben")
+
+    # Zufällige Positionen ohne Überschneidungen (Poisson-Disk, siehe platzierung.py), 50 Punkte Rand
+    rand = 50
+    positionen = platziere(anzahl_waben, seiten_breite - 2 * rand, seiten_hoehe - 2 * rand,
+                           form_breite=2 * waben_groesse + WABEN_LINIE, luecke=WABEN_LUECKE,
+                           zufall=random.Random(seed))
+    if len(positionen) < anzahl_waben:
+        print(f"⚠️ Nur {len(positionen)} von {anzahl_waben} Waben passen ohne Überschneidung auf die Seite")
+    for x_position, y_position in positionen:
+        szene.form("wabe", rand + x_position, rand + y_position, waben_groesse, linie=WABEN_LINIE)
+    return szene
+
+def erstelle_waben_pdf(dateiname, anzahl_waben=100, waben_groesse=20, seed=None, melden=True):
+    """
+    Erstellt eine PDF-Datei mit zufällig verteilten Waben, die sich nicht überschneiden.
     
     Parameter:
     - dateiname: Name der zu erstellenden PDF-Datei
+    - anzahl_waben: Anzahl der Waben (Standard 100)
+    - waben_groesse: Größe einer Wabe in Punkten
+    - seed: gleicher Seed = gleiche Waben (None = jedes Mal andere)
+    - melden: Erfolg mit Dateinamen ausgeben (False im Render-Cache: dort ist es nur die .tmp-Datei)
     """
-    # Importiere benötigte PDF-Module
-    import random
-    from reportlab.lib.pagesizes import A4
-    from reportlab.pdfgen import canvas
-    from reportlab.lib import colors
+    # Alle Waben auf einmal zeichnen (eine Vorlage, viele Kopien)
+    rendere_pdf(waben_szene(anzahl_waben, waben_groesse, seed), dateiname)
+    if melden:
+        print(f"✅ PDF '{dateiname}' erfolgreich erstellt!")
 
-    # PDF-Canvas erstellen (A4 Hochformat)
-    pdf_canvas = canvas.Canvas(dateiname, pagesize=A4)
-    seiten_breite, seiten_hoehe = A4
+def waben_pdf_aus_cache(anzahl_waben=100, waben_groesse=20, seed=None):
+    """
+    Wie erstelle_waben_pdf, aber über den Render-Cache: gleiche Parameter und gleicher
+    Seed liefern sofort die schon erzeugte Datei.
 
-    # 100 Waben an zufälligen Positionen zeichnen
-    anzahl_waben = 100
-    for wabe_nummer in range(anzahl_waben):
-        # Zufällige Position auf der Seite bestimmen
-        zufalls_x = random.randint(50, int(seiten_breite - 50))  # Mit Rand
-        zufalls_y = random.randint(50, int(seiten_hoehe - 50))   # Mit Rand
-        
-        # Einzelne Wabe an dieser Position zeichnen
-        zeichne_einzelne_wabe(pdf_canvas, zufalls_x, zufalls_y)
+    Parameter:
+    - seed: None = neue Zufalls-Waben (frischer Seed, siehe render_cache.neuer_seed)
 
-    # PDF-Datei speichern und schließen
-    pdf_canvas.save()
-    print(f"✅ PDF '{dateiname}' erfolgreich erstellt!")
+    Rückgabe:
+    - Pfad der PDF-Datei im Cache-Ordner
+    """
+    if seed is None:
+        seed = neuer_seed()
+    parameter = {"anzahl_waben": anzahl_waben, "waben_groesse": waben_groesse, "seed": seed}
+    return cache_datei("waben", parameter,
+                       lambda ziel: erstelle_waben_pdf(ziel, anzahl_waben, waben_groesse, seed, melden=False))
 
-def zeichne_einzelne_wabe(canvas_objekt, x_position, y_position, waben_groesse=20):
+def zeichne_einzelne_wabe(canvas_objekt, x_position, y_position, waben_groesse=20, stil_setzen=True):
     """
     Zeichnet eine perfekte sechseckige Wabe (Hexagon) - wie echte Bienenwaben! 🐝
+    Für viele Waben ist eine Szene (szene.rendere_pdf) schneller und das PDF kleiner.
     
     Parameter:
     - canvas_objekt: Das PDF-Canvas zum Zeichnen
     - x_position: X-Koordinate der Wabe
     - y_position: Y-Koordinate der Wabe  
     - waben_groesse: Größe der Wabe in Punkten
+    - stil_setzen: Farben/Linie setzen (False, wenn sie für die Seite schon gesetzt sind)
     """
-    # Importiere Farben für die Wabe
-    from reportlab.lib import colors
-    import math
-    
-    # Setze Farben für die schöne Wabe
-    canvas_objekt.setStrokeColor(colors.black)  # Schwarzer Rand
-    canvas_objekt.setFillColor(colors.white)    # Weißer Inhalt (zum Ausmalen!)
-    canvas_objekt.setLineWidth(2)               # Etwas dickere Linie für schöne Waben
-    
-    # Berechne die 6 Eckpunkte eines perfekten Sechsecks (Hexagon)
-    eckpunkte = []
-    
-    for ecke in range(6):
-        # Winkel für diese Ecke berechnen (Start bei 0°, dann alle 60°)
-        winkel_grad = ecke * 60  # 0°, 60°, 120°, 180°, 240°, 300°
-        winkel_radians = math.radians(winkel_grad)
-        
-        # X- und Y-Koordinate dieser Ecke berechnen
-        ecke_x = x_position + waben_groesse * math.cos(winkel_radians)
-        ecke_y = y_position + waben_groesse * math.sin(winkel_radians)
-        
-        eckpunkte.append((ecke_x, ecke_y))
-    
-    # EINFACHE Methode: Zeichne das Sechseck mit Linien
-    canvas_objekt.setFillColor(colors.white)  # Weißer Hintergrund
+    if stil_setzen:
+        # Schwarzer Rand, weißer Inhalt (zum Ausmalen!), dickere Linie
+        canvas_objekt.setStrokeColor(colors.black)
+        canvas_objekt.setFillColor(colors.white)
+        canvas_objekt.setLineWidth(WABEN_LINIE)
     
-    # Beginne neuen Pfad
+    # Die 6 Eckpunkte: vorberechnete Ecken, nur noch skalieren und verschieben
     pfad = canvas_objekt.beginPath()
-    
-    # Gehe zum ersten Punkt
-    pfad.moveTo(eckpunkte[0][0], eckpunkte[0][1])
-    
-    # Zeichne Linien zu allen anderen Punkten
-    for i in range(1, 6):
-        pfad.lineTo(eckpunkte[i][0], eckpunkte[i][1])
-    
-    # Schließe das Sechseck (zurück zum ersten Punkt)
-    pfad.closePath()
+    pfad.moveTo(x_position + waben_groesse * WABEN_ECKEN[0][0], y_position + waben_groesse * WABEN_ECKEN[0][1])
+    for ecke_x, ecke_y in WABEN_ECKEN[1:]:
+        pfad.lineTo(x_position + waben_groesse * ecke_x, y_position + waben_groesse * ecke_y)
+    pfad.close()
     
     # Zeichne das gefüllte und umrandete Sechseck
     canvas_objekt.drawPath(pfad, stroke=1, fill=1)  # stroke=Rand, fill=Füllung
@@ -164,14 +196,14 @@ def oeffne_ordner_im_explorer(ordner_pfad):
 # BENUTZER-INTERFACE FUNKTIONEN
 ########################################
 
-def zeige_einfache_optionen(pdf_name):
+def zeige_einfache_optionen(pdf_dateiname):
     """
     Zeigt ein interaktives Menü mit Optionen für die erstellte PDF-Datei.
     
     Parameter:
     - pdf_dateiname: Name der PDF-Datei für die Optionen
     """
-    aktueller_ordner = os.getcwd()  # Aktuelles Arbeitsverzeichnis ermitteln
+    aktueller_ordner = os.path.dirname(os.path.abspath(pdf_dateiname))  # Ordner der PDF-Datei
     
     # Schöne Menü-Anzeige
     print("\n" + "="*60)
@@ -205,7 +237,7 @@ def zeige_einfache_optionen(pdf_name):
             
         elif benutzer_wahl == "3":
             print("🔄 Erstelle neue PDF mit anderen Zufalls-Waben...")
-            erstelle_waben_pdf(pdf_dateiname)  # Neue PDF erstellen
+            pdf_dateiname = waben_pdf_aus_cache()  # frischer Seed = andere Waben
             oeffne_pdf_datei(pdf_dateiname)    # Sofort öffnen
             print("✅ Neue PDF erstellt und geöffnet!")
             break
@@ -221,9 +253,45 @@ def zeige_einfache_optionen(pdf_name):
 # PROGRAMM-START
 ########################################
 
+def benchmark(anzahl_waben=10000, waben_groesse=8):
+    """Vergleicht einzelne Pfade (wie früher) mit der Szene (eine Waben-Vorlage): Zeit und Dateigröße."""
+    import tempfile
+
+    seiten_breite, seiten_hoehe = A4
+    zufall = random.Random(42)
+    positionen = [(zufall.uniform(20, seiten_breite - 20), zufall.uniform(20, seiten_hoehe - 20))
+                  for wabe_nummer in range(anzahl_waben)]
+
+    with tempfile.TemporaryDirectory() as ordner:
+        ergebnisse = {}
+        for art in ("einzeln", "vorlage"):
+            dateiname = os.path.join(ordner, f"waben_{art}.pdf")
+            start = time.perf_counter()
+            if art == "einzeln":
+                pdf_canvas = canvas.Canvas(dateiname, pagesize=A4)
+                for x_position, y_position in positionen:
+                    zeichne_einzelne_wabe(pdf_canvas, x_position, y_position, waben_groesse)
+                pdf_canvas.save()
+            else:
+                szene = Szene(seiten_breite, seiten_hoehe)
+                for x_position, y_position in positionen:
+                    szene.form("wabe", x_position, y_position, waben_groesse, linie=WABEN_LINIE)
+                rendere_pdf(szene, dateiname)
+            ergebnisse[art] = (time.perf_counter() - start, os.path.getsize(dateiname))
+
+    print(f"🐝 {anzahl_waben:,} Waben")
+    for art, (dauer, groesse) in ergebnisse.items():
+        print(f"   {art:8s} {dauer * 1000:8.1f} ms  {groesse / 1024:8.1f} KB")
+
 if __name__ == "__main__":
     """
     Startet das Programm nur wenn diese Datei direkt ausgeführt wird.
     (Nicht wenn sie als Modul importiert wird)
     """
-    run()
\ No newline at end of file
+    import sys
+
+    if "--benchmark" in sys.argv:
+        stelle = sys.argv.index("--benchmark")
+        benchmark(int(sys.argv[stelle + 1]) if len(sys.argv) > stelle + 1 else 10000)
+    else:
+        run()
\ No newline at end of file
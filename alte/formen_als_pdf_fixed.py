@@ -6,6 +6,10 @@
 # - Nummern von oben nach unten (1-50)
 # - Nummern stehen ÜBER den Kreisen (nicht drin!)
 # - A4 Format, perfekt zum Ausdrucken und Ausmalen!
+# - Kreise und Nummern kommen aus szene.py: Nummern nach der echten
+#   Schriftbreite zentriert, die Seite auch als SVG/HTML ausgebbar
+# - die PDF liegt im Render-Cache (render_cache.py): einmal erstellt,
+#   danach sofort da - keine neue Kopie pro Aufruf
 ########################################
 
 import time
@@ -13,6 +17,9 @@ import os
 import platform
 import subprocess
 
+from render_cache import cache_datei
+from szene import Szene, rendere_pdf
+
 # Log-System aktivieren
 import log
 log.run()
@@ -25,17 +32,11 @@ def run():
     """Startet das Ausmalbuch-Generator Programm."""
     print("🎨 Ausmalbuch-Generator startet...")
     
-    # Eindeutigen Dateinamen erstellen
-    import datetime
-    zeitstempel = datetime.datetime.now().strftime("%H%M%S")
-    pdf_name = f"ausmalbuch_{zeitstempel}.pdf"
-    
-    print(f"📄 Erstelle Ausmalbuch: {pdf_name}")
+    # PDF aus dem Render-Cache holen (nur beim ersten Mal wirklich erstellt)
+    pdf_name = ausmalbuch_aus_cache()
     
-    # PDF erstellen
-    erfolg = erstelle_kreise_pdf(pdf_name)
-    
-    if erfolg:
+    if pdf_name:
+        print(f"📄 Ausmalbuch: {pdf_name}")
         # PDF öffnen
         oeffne_pdf_datei(pdf_name)
         print("✅ Ausmalbuch wurde erstellt und geöffnet!")
@@ -50,55 +51,52 @@ def run():
 # PDF-ERSTELLUNG (VEREINFACHT)
 ########################################
 
-def erstelle_kreise_pdf(dateiname):
+def ausmalbuch_szene():
+    """
+    Ordnet die 50 Kreise mit ihren Nummern einmal an (siehe szene.py).
+
+    Rückgabe:
+    - Szene - als PDF, SVG oder HTML ausgebbar, ohne neu zu rechnen
+    """
+    from reportlab.lib.pagesizes import A4
+
+    breite, hoehe = A4
+    szene = Szene(breite, hoehe, titel="Ausmalbuch")
+
+    # Kreise in Reihen anordnen (von oben nach unten)
+    kreise_pro_reihe = 5  # 5 Kreise pro Reihe
+    reihen = 10           # 10 Reihen = 50 Kreise total
+    radius = 25           # Größere Kreise zum einfacheren Ausmalen
+
+    kreis_nummer = 1
+    for reihe in range(reihen):
+        for spalte in range(kreise_pro_reihe):
+            # Position berechnen (gleichmäßig verteilt, y von oben gezählt)
+            x = 100 + spalte * 100
+            y = 100 + reihe * 70
+            # WEISSER Kreis, Nummer ÜBER dem Kreis - zentriert nach der echten
+            # Breite der Ziffern (damit man den Kreis frei ausmalen kann)
+            szene.form("kreis", x, y, radius, beschriftung=kreis_nummer, linie=1,
+                       schrift="Helvetica-Bold", schriftgroesse=14)
+            kreis_nummer += 1
+    return szene
+
+def erstelle_kreise_pdf(dateiname, melden=True):
     """
     Erstellt eine PDF-Datei mit weißen Kreisen zum Ausmalen.
     Nummern sind von oben nach unten sortiert - perfekt zum Ausmalen!
+
+    Parameter:
+    - melden: Dateinamen ausgeben (False im Render-Cache: dort ist es nur die .tmp-Datei)
     """
     try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.pdfgen import canvas
-        from reportlab.lib import colors
-
-        print(f"📝 Erstelle Ausmalbuch-PDF: {dateiname}")
-        
-        # PDF erstellen
-        pdf_canvas = canvas.Canvas(dateiname, pagesize=A4)
-        breite, hoehe = A4
-        
+        if melden:
+            print(f"📝 Erstelle Ausmalbuch-PDF: {dateiname}")
         print("🎨 Zeichne 50 weiße Kreise zum Ausmalen...")
+        rendere_pdf(ausmalbuch_szene(), dateiname)
 
-        # Kreise in Reihen anordnen (von oben nach unten)
-        kreise_pro_reihe = 5  # 5 Kreise pro Reihe
-        reihen = 10           # 10 Reihen = 50 Kreise total
-        
-        kreis_nummer = 1
-        radius = 25           # Größere Kreise zum einfacheren Ausmalen
-        
-        for reihe in range(reihen):
-            for spalte in range(kreise_pro_reihe):
-                # Position berechnen (gleichmäßig verteilt)
-                x = 100 + spalte * 100  # Horizontal verteilt
-                y = hoehe - 100 - reihe * 70  # Von oben nach unten
-                
-                # WEISSEN Kreis zeichnen (perfekt zum Ausmalen!)
-                pdf_canvas.setStrokeColor(colors.black)  # Schwarzer Rand
-                pdf_canvas.setFillColor(colors.white)    # WEIßER Inhalt zum Ausmalen!
-                pdf_canvas.circle(x, y, radius, stroke=2, fill=1)  # Dickerer Rand
-                
-                # Nummer AUSSERHALB des Kreises schreiben (damit man den Kreis frei ausmalen kann)
-                pdf_canvas.setFillColor(colors.black)
-                pdf_canvas.setFont("Helvetica-Bold", 14)  # Größere, gut lesbare Schrift
-                
-                # Nummer ÜBER dem Kreis platzieren
-                text_x = x - 7  # Zentriert
-                text_y = y + radius + 5  # ÜBER dem Kreis
-                pdf_canvas.drawString(text_x, text_y, str(kreis_nummer))
-                
-                kreis_nummer += 1
-
-        pdf_canvas.save()
-        print(f"✅ Ausmalbuch-PDF '{dateiname}' mit 50 weißen Kreisen erstellt!")
+        if melden:
+            print(f"✅ Ausmalbuch-PDF '{dateiname}' mit 50 weißen Kreisen erstellt!")
         print("🖍️  Kreise sind weiß und bereit zum Ausmalen!")
         print("🔢 Nummern sind von oben nach unten angeordnet (1-50)")
         return True
@@ -107,6 +105,16 @@ def erstelle_kreise_pdf(dateiname):
         print(f"❌ Fehler beim Erstellen der PDF: {fehler}")
         return False
 
+def ausmalbuch_aus_cache():
+    """
+    Ausmalbuch über den Render-Cache: das Ausmalbuch ist immer gleich, also gibt es
+    genau eine Datei statt einer neuen ausmalbuch_HHMMSS.pdf pro Aufruf.
+
+    Rückgabe:
+    - Pfad der PDF-Datei im Cache-Ordner (None bei Fehler)
+    """
+    return cache_datei("ausmalbuch", {"kreise": 50}, lambda ziel: erstelle_kreise_pdf(ziel, melden=False))
+
 ########################################
 # DATEI-FUNKTIONEN
 ########################################
@@ -148,7 +156,7 @@ def zeige_einfache_optionen(pdf_name):
     
     if wahl == "1":
         print("📁 Öffne Ordner zum Drucken...")
-        oeffne_ordner_im_explorer(os.getcwd())
+        oeffne_ordner_im_explorer(os.path.dirname(os.path.abspath(pdf_name)))
         print("💡 Tipp: Rechtsklick auf PDF → Drucken!")
         
     elif wahl == "2":
@@ -157,10 +165,8 @@ def zeige_einfache_optionen(pdf_name):
         
     elif wahl == "3":
         print("🔄 Erstelle neues Ausmalbuch...")
-        import datetime
-        neue_zeit = datetime.datetime.now().strftime("%H%M%S")
-        neuer_name = f"ausmalbuch_{neue_zeit}.pdf"
-        if erstelle_kreise_pdf(neuer_name):
+        neuer_name = ausmalbuch_aus_cache()
+        if neuer_name:
             oeffne_pdf_datei(neuer_name)
             print("✅ Neues Ausmalbuch erstellt!")
         
@@ -0,0 +1,205 @@
+########################################
+# PLATZIERUNG: zufällig verteilte Formen OHNE Überschneidungen 🎯
+########################################
+# Bisher bekam jede Form (Wabe im PDF, Kreis in der Timeline) eine
+# unabhängige Zufallsposition - die Formen lagen übereinander, oder es
+# wurde so lange neu gewürfelt, bis nichts mehr passte.
+#
+# Jetzt: Poisson-Disk-Verteilung (Bridson). Punkte wachsen von einem
+# Startpunkt aus nach außen; jeder neue Punkt liegt mindestens "abstand"
+# vom nächsten entfernt. Ob ein Kandidat frei ist, sagt ein Gitter
+# (Spatial Hash): jede Zelle hat höchstens einen Punkt, geprüft werden
+# nur die Nachbarzellen - kein Vergleich mit allen anderen Formen, also
+# insgesamt etwa O(n).
+#
+# Zwei Arten von Formen:
+# - rund (Kreise, Waben): Mittelpunkte mindestens Durchmesser + Lücke auseinander
+# - eckig (HTML-Elemente breite x hoehe): Rechtecke dürfen sich nicht
+#   überlappen (in y gestaucht, dann Abstand als max(|dx|, |dy|))
+#
+# Wenn weniger Formen gewünscht sind, als auf die Fläche passen, wird
+# die volle Verteilung berechnet und zufällig ausgedünnt - die Formen
+# liegen dann gleichmäßig über die ganze Fläche.
+#
+# Beispiele:
+#   punkte = platziere(100, 495, 742, form_breite=42)             # runde Formen
+#   punkte = platziere(50, 820, 620, form_breite=66, form_hoehe=88)  # HTML-Boxen
+#   python platzierung.py --benchmark
+########################################
+
+import math
+import random
+
+VERSUCHE = 16  # Kandidaten pro aktivem Punkt
+
+
+class Gitter:
+    """Spatial Hash: Zellen der Seitenlänge zelle, höchstens ein Punkt pro Zelle."""
+
+    def __init__(self, breite, hoehe, abstand, eckig=False):
+        """
+        Parameter:
+        - breite, hoehe: Fläche
+        - abstand: kleinster erlaubter Abstand zweier Punkte
+        - eckig: Abstand als max(|dx|, |dy|) statt Luftlinie
+        """
+        self.abstand = abstand
+        self.eckig = eckig
+        # Zelle so klein, dass zwei Punkte darin immer zu nah wären
+        self.zelle = abstand if eckig else abstand / math.sqrt(2)
+        reichweite = 1 if eckig else 2  # so viele Nachbarzellen in jede Richtung prüfen
+        # Rand aus leeren Zellen rundherum: beim Nachschauen keine Grenzen prüfen
+        self.rand = reichweite
+        self.spalten = math.ceil(breite / self.zelle) + 2 * reichweite + 1
+        self.zeilen = math.ceil(hoehe / self.zelle) + 2 * reichweite + 1
+        self.zellen = [None] * (self.spalten * self.zeilen)
+        # Versatz zu allen Nachbarzellen, die einen zu nahen Punkt enthalten können
+        # (bei Luftlinie nicht die 4 äußersten Ecken: die sind mindestens abstand weg)
+        self.nachbarn = [z * self.spalten + s
+                         for z in range(-reichweite, reichweite + 1)
+                         for s in range(-reichweite, reichweite + 1)
+                         if eckig or abs(z) + abs(s) < 4]
+
+    def _stelle(self, x, y):
+        return (int(y / self.zelle) + self.rand) * self.spalten + int(x / self.zelle) + self.rand
+
+    def frei(self, x, y):
+        """True, wenn kein Punkt näher als abstand liegt (x, y innerhalb der Fläche)."""
+        stelle = self._stelle(x, y)
+        zellen = self.zellen
+        abstand = self.abstand
+        if self.eckig:
+            for versatz in self.nachbarn:
+                punkt = zellen[stelle + versatz]
+                if punkt is not None and -abstand < punkt[0] - x < abstand and -abstand < punkt[1] - y < abstand:
+                    return False
+            return True
+        abstand_quadrat = abstand * abstand
+        for versatz in self.nachbarn:
+            punkt = zellen[stelle + versatz]
+            if punkt is not None:
+                dx, dy = punkt[0] - x, punkt[1] - y
+                if dx * dx + dy * dy < abstand_quadrat:
+                    return False
+        return True
+
+    def lege(self, x, y):
+        self.zellen[self._stelle(x, y)] = (x, y)
+
+
+def poisson_punkte(breite, hoehe, abstand, zufall=None, eckig=False, versuche=VERSUCHE):
+    """
+    Bridson: möglichst dichte Zufallspunkte mit Mindestabstand.
+
+    Parameter:
+    - breite, hoehe: Fläche, Punkte liegen in [0, breite) x [0, hoehe)
+    - abstand: Mindestabstand
+    - zufall: random.Random (für wiederholbare Ergebnisse)
+    - eckig: Abstand als max(|dx|, |dy|)
+    - versuche: Kandidaten pro aktivem Punkt
+
+    Rückgabe:
+    - Liste von (x, y)
+    """
+    zufall = zufall or random.Random()
+    gitter = Gitter(breite, hoehe, abstand, eckig)
+    radius = abstand * (1 + 1e-7)
+    erster = (zufall.random() * breite, zufall.random() * hoehe)
+    gitter.lege(*erster)
+    punkte = [erster]
+    aktiv = [0]
+
+    while aktiv:
+        stelle = zufall.randrange(len(aktiv))
+        x, y = punkte[aktiv[stelle]]
+        start_winkel = zufall.random() * 2 * math.pi
+        for versuch in range(versuche):
+            # Kandidat knapp außerhalb des Mindestabstands (dichter als der ganze Ring,
+            # siehe Roberts' Variante von Bridson), Richtungen gleichmäßig reihum
+            winkel = start_winkel + versuch * 2 * math.pi / versuche
+            dx, dy = math.cos(winkel), math.sin(winkel)
+            if eckig:
+                dx, dy = dx / max(abs(dx), abs(dy)), dy / max(abs(dx), abs(dy))  # auf den Quadrat-Rand
+            dx, dy = dx * radius, dy * radius
+            neu_x, neu_y = x + dx, y + dy
+            if 0 <= neu_x < breite and 0 <= neu_y < hoehe and gitter.frei(neu_x, neu_y):
+                gitter.lege(neu_x, neu_y)
+                aktiv.append(len(punkte))
+                punkte.append((neu_x, neu_y))
+                break
+        else:
+            # kein Platz mehr um diesen Punkt: aus der aktiven Liste nehmen (mit dem letzten tauschen)
+            aktiv[stelle] = aktiv[-1]
+            aktiv.pop()
+    return punkte
+
+
+def platziere(anzahl, breite, hoehe, form_breite, form_hoehe=None, luecke=0, zufall=None):
+    """
+    Mittelpunkte für anzahl Formen, die sich nicht überschneiden.
+
+    Parameter:
+    - anzahl: gewünschte Anzahl Formen
+    - breite, hoehe: Fläche für die Mittelpunkte
+    - form_breite: Durchmesser (runde Formen) bzw. Breite (eckige Formen)
+    - form_hoehe: Höhe eckiger Formen (None = runde Form)
+    - luecke: zusätzlicher Abstand zwischen zwei Formen
+    - zufall: random.Random (für wiederholbare Ergebnisse)
+
+    Rückgabe:
+    - Liste von (x, y), höchstens anzahl - weniger, wenn nicht mehr auf die Fläche passen
+    """
+    zufall = zufall or random.Random()
+    if anzahl <= 0:
+        return []
+    if form_hoehe is None:
+        punkte = poisson_punkte(breite, hoehe, form_breite + luecke, zufall)
+    else:
+        # y so stauchen, dass aus dem Rechteck ein Quadrat wird
+        faktor = (form_breite + luecke) / (form_hoehe + luecke)
+        punkte = [(x, y / faktor) for x, y in
+                  poisson_punkte(breite, hoehe * faktor, form_breite + luecke, zufall, eckig=True)]
+    if len(punkte) > anzahl:
+        punkte = zufall.sample(punkte, anzahl)
+    else:
+        zufall.shuffle(punkte)
+    return punkte
+
+
+########################################
+# BENCHMARK
+########################################
+
+def _paarweise(anzahl, breite, hoehe, abstand, zufall, versuche=100):
+    """Wie früher: würfeln und gegen ALLE bisherigen Formen prüfen."""
+    punkte = []
+    abstand_quadrat = abstand * abstand
+    for _ in range(anzahl):
+        for _ in range(versuche):
+            x, y = zufall.random() * breite, zufall.random() * hoehe
+            if all((x - px) ** 2 + (y - py) ** 2 >= abstand_quadrat for px, py in punkte):
+                punkte.append((x, y))
+                break
+    return punkte
+
+
+def benchmark():
+    import time
+
+    print("🎯 Platzierung, Fläche 1000 x 1000")
+    for anzahl in (500, 2_000, 20_000):
+        abstand = 1000 / math.sqrt(anzahl * 1.4)  # so dass etwa anzahl Formen passen
+        zufall = random.Random(1)
+        start = time.perf_counter()
+        punkte = platziere(anzahl, 1000, 1000, abstand, zufall=zufall)
+        dauer = time.perf_counter() - start
+        zeile = f"   {anzahl:6,} Formen: Poisson {dauer * 1000:8.1f} ms ({len(punkte):,} platziert)"
+        if anzahl <= 2_000:
+            start = time.perf_counter()
+            alt = _paarweise(anzahl, 1000, 1000, abstand, random.Random(1))
+            zeile += f", paarweise {(time.perf_counter() - start) * 1000:8.1f} ms ({len(alt):,} platziert)"
+        print(zeile)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,313 @@
+########################################
+# RENDER-CACHE: gleiche Anfrage -> dieselbe fertige Datei ♻️
+########################################
+# Bisher schreibt jeder Generator bei jedem Aufruf eine neue Datei
+# (ausmalbuch_HHMMSS.pdf, timeline_..._HHMMSS.html) - der Ordner füllt
+# sich mit fast gleichen Kopien, und "nochmal erstellen" rechnet alles neu.
+#
+# Jetzt:
+# - Schlüssel = sha256 über Generator-Name + alle Parameter (inklusive
+#   Seed für den Zufall) + CACHE_VERSION
+# - gibt es die Datei schon, kommt sofort ihr Pfad zurück, sonst wird sie
+#   einmal erzeugt (in eine .tmp-Datei, dann umbenannt)
+# - index.json im Cache-Ordner kennt alle Dateien mit Größe, in der
+#   Reihenfolge der letzten Benutzung - nachschauen liest nie den Ordner
+# - mehr als MAX_BYTES: die am längsten unbenutzten Dateien fliegen raus (LRU)
+# - mehrere Prozesse (z.B. zwei Menüs): jede Änderung liest den Index unter
+#   einer Datei-Sperre (index.lock) neu ein und schreibt ihn dann zurück -
+#   kein Prozess überschreibt die Einträge eines anderen
+#
+# Zufall: wer "etwas Neues" will, zieht mit neuer_seed() einen frischen
+# Seed - der kommt in den Schlüssel, gleiche Seeds treffen den Cache.
+#
+# Beispiele:
+#   pfad = cache_datei("waben", {"anzahl": 100, "seed": 1}, lambda ziel: erstelle_waben_pdf(ziel, 100, seed=1))
+#   python render_cache.py --liste
+#   python render_cache.py --leeren
+#   python render_cache.py --benchmark
+########################################
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl   # Linux / macOS
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows
+
+PROJEKT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_ORDNER = os.environ.get("AKADEMY_RENDER_CACHE", os.path.join(PROJEKT, "render_cache"))
+MAX_BYTES = 200 * 1024 * 1024
+CACHE_VERSION = 2  # erhöhen, wenn sich die Ausgabe der Generatoren ändert
+INDEX_NAME = "index.json"
+SPERR_NAME = "index.lock"
+
+
+def neuer_seed():
+    """Frischer Seed für eine neue Zufalls-Datei (32 Bit, passt in JSON und random.Random)."""
+    return random.SystemRandom().getrandbits(32)
+
+def _schreibe_atomar(pfad, text):
+    """Erst in eine Nachbar-Datei schreiben, dann umbenennen - nie ein halber Index."""
+    temporaer = f"{pfad}.tmp{os.getpid()}"
+    with open(temporaer, "w", encoding="utf-8") as datei:
+        datei.write(text)
+    os.replace(temporaer, pfad)
+
+def _entferne(pfad):
+    try:
+        os.remove(pfad)
+    except FileNotFoundError:
+        pass
+
+
+class RenderCache:
+    def __init__(self, ordner=CACHE_ORDNER, max_bytes=MAX_BYTES, melden=True):
+        """
+        Parameter:
+        - ordner: Cache-Ordner (wird angelegt)
+        - max_bytes: Obergrenze für alle Dateien zusammen
+        - melden: fertige Dateien mit Pfad ausgeben
+        """
+        self.ordner = ordner
+        self.max_bytes = max_bytes
+        self.melden = melden
+        self.index_pfad = os.path.join(ordner, INDEX_NAME)
+        os.makedirs(ordner, exist_ok=True)
+        self._sperr_fd = None
+        self._thread_sperre = threading.Lock()  # flock sperrt nur zwischen Prozessen, nicht zwischen Threads
+        # schluessel -> {"datei", "bytes", "generator", "parameter"}; älteste zuerst
+        self.eintraege = self._lade_index()
+
+    @contextmanager
+    def _sperre(self):
+        """
+        Exklusive Sperre über alle Prozesse und Threads. Darin: Index neu lesen,
+        ändern, zurückschreiben - self.eintraege ist danach auf dem neuesten Stand.
+        """
+        with self._thread_sperre:
+            if self._sperr_fd is None:
+                self._sperr_fd = os.open(os.path.join(self.ordner, SPERR_NAME), os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl:
+                fcntl.flock(self._sperr_fd, fcntl.LOCK_EX)
+            else:
+                os.lseek(self._sperr_fd, 0, os.SEEK_SET)
+                while True:
+                    try:
+                        msvcrt.locking(self._sperr_fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        pass  # LK_LOCK gibt nach ~10 Sekunden auf -> weiter warten
+            try:
+                self.eintraege = self._lade_index(alte_loeschen=True)
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(self._sperr_fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(self._sperr_fd, 0, os.SEEK_SET)
+                    msvcrt.locking(self._sperr_fd, msvcrt.LK_UNLCK, 1)
+
+    def _lade_index(self, alte_loeschen=False):
+        """
+        Einträge aus index.json. Ein Index einer anderen CACHE_VERSION zählt als leer.
+
+        Parameter:
+        - alte_loeschen: dann auch seine Dateien löschen und einen leeren Index
+          schreiben - sonst liegen sie außerhalb von MAX_BYTES herum.
+          Nur innerhalb von _sperre()!
+        """
+        try:
+            with open(self.index_pfad, encoding="utf-8") as datei:
+                daten = json.load(datei)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            print("⚠️ Render-Cache: index.json ist kaputt - fange leer an")
+            return {}
+        if daten.get("version") != CACHE_VERSION:
+            if alte_loeschen:
+                for eintrag in daten.get("eintraege", {}).values():
+                    _entferne(os.path.join(self.ordner, eintrag["datei"]))
+                self.eintraege = {}
+                self._speichere_index()
+            return {}
+        return daten["eintraege"]
+
+    def _speichere_index(self):
+        _schreibe_atomar(self.index_pfad, json.dumps({"version": CACHE_VERSION, "eintraege": self.eintraege},
+                                                     ensure_ascii=False, indent=1))
+
+    @staticmethod
+    def schluessel(generator, parameter):
+        """sha256 (hex) über Generator, Parameter und CACHE_VERSION - unabhängig von der Reihenfolge."""
+        text = json.dumps([CACHE_VERSION, generator, parameter], sort_keys=True, ensure_ascii=False,
+                          separators=(",", ":"))
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def hole(self, generator, parameter):
+        """
+        Pfad der fertigen Datei oder None.
+
+        Ein Treffer wird zum zuletzt benutzten Eintrag.
+        """
+        schluessel = self.schluessel(generator, parameter)
+        with self._sperre():
+            eintrag = self.eintraege.pop(schluessel, None)
+            if eintrag is None:
+                return None
+            pfad = os.path.join(self.ordner, eintrag["datei"])
+            if not os.path.exists(pfad):
+                # von Hand gelöscht: Eintrag vergessen
+                self._speichere_index()
+                return None
+            self.eintraege[schluessel] = eintrag
+            self._speichere_index()
+        return pfad
+
+    def datei(self, generator, parameter, erzeuge, endung=".pdf"):
+        """
+        Fertige Datei für diese Parameter - aus dem Cache oder frisch erzeugt.
+
+        Parameter:
+        - generator: Name, z.B. "waben" (auch Anfang des Dateinamens)
+        - parameter: dict mit allen Eingaben, die die Ausgabe bestimmen (JSON-fähig, inkl. Seed)
+        - erzeuge: Funktion(ziel_pfad), die die Datei schreibt; gibt sie False zurück,
+          wird nichts gespeichert. ziel_pfad ist eine .tmp-Datei - den fertigen Pfad
+          meldet datei() selbst, die Funktion sollte ihn also nicht ausgeben
+        - endung: Datei-Endung
+
+        Rückgabe:
+        - Pfad der Datei oder None, wenn erzeuge fehlschlägt
+        """
+        pfad = self.hole(generator, parameter)
+        if pfad is not None:
+            if self.melden:
+                print(f"♻️ Schon fertig: '{pfad}'")
+            return pfad
+
+        schluessel = self.schluessel(generator, parameter)
+        name = f"{generator}_{schluessel[:16]}{endung}"
+        pfad = os.path.join(self.ordner, name)
+        temporaer = f"{pfad}.tmp{os.getpid()}"
+        try:
+            if erzeuge(temporaer) is False or not os.path.exists(temporaer):
+                _entferne(temporaer)
+                return None
+        except BaseException:
+            _entferne(temporaer)
+            raise
+        # Erzeugt wird ohne Sperre (kann dauern); erst der Eintrag in den Index ist gesperrt
+        with self._sperre():
+            os.replace(temporaer, pfad)
+            self.eintraege.pop(schluessel, None)  # ein anderer Prozess war evtl. schneller
+            self.eintraege[schluessel] = {"datei": name, "bytes": os.path.getsize(pfad),
+                                          "generator": generator, "parameter": parameter}
+            self._raeume_auf()
+            self._speichere_index()
+        if self.melden:
+            print(f"✅ '{pfad}' erstellt")
+        return pfad
+
+    def groesse(self):
+        """Bytes aller Dateien laut Index."""
+        return sum(eintrag["bytes"] for eintrag in self.eintraege.values())
+
+    def _raeume_auf(self):
+        """
+        Älteste Dateien löschen, bis alles unter max_bytes liegt (die neueste bleibt immer).
+        Nur innerhalb von _sperre() aufrufen!
+        """
+        gesamt = self.groesse()
+        while gesamt > self.max_bytes and len(self.eintraege) > 1:
+            schluessel = next(iter(self.eintraege))
+            eintrag = self.eintraege.pop(schluessel)
+            _entferne(os.path.join(self.ordner, eintrag["datei"]))
+            gesamt -= eintrag["bytes"]
+
+    def leeren(self):
+        """Alle Dateien aus dem Index löschen."""
+        with self._sperre():
+            for eintrag in self.eintraege.values():
+                _entferne(os.path.join(self.ordner, eintrag["datei"]))
+            self.eintraege = {}
+            self._speichere_index()
+
+
+_standard = None
+
+def standard_cache():
+    """Der gemeinsame Cache in CACHE_ORDNER (ein Objekt pro Prozess, der Index wird bei jeder Änderung neu gelesen)."""
+    global _standard
+    if _standard is None:
+        _standard = RenderCache()
+    return _standard
+
+def cache_datei(generator, parameter, erzeuge, endung=".pdf"):
+    """Kurzform für standard_cache().datei(...)."""
+    return standard_cache().datei(generator, parameter, erzeuge, endung)
+
+
+########################################
+# BENCHMARK
+########################################
+
+def benchmark(anzahl=2000, wiederholungen=20):
+    import random
+    import tempfile
+
+    from platzierung import platziere
+    from szene import Szene, rendere_pdf
+
+    def erzeuge(ziel, seed):
+        szene = Szene(595, 842)
+        for x, y in platziere(anzahl, 575, 822, 10, luecke=1, zufall=random.Random(seed)):
+            szene.form("wabe", 10 + x, 10 + y, 5, linie=1)
+        rendere_pdf(szene, ziel)
+
+    with tempfile.TemporaryDirectory() as ordner:
+        cache = RenderCache(ordner, melden=False)
+        parameter = {"anzahl": anzahl, "seed": 1}
+        start = time.perf_counter()
+        cache.datei("waben", parameter, lambda ziel: erzeuge(ziel, 1))
+        dauer_neu = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(wiederholungen):
+            cache.datei("waben", parameter, lambda ziel: erzeuge(ziel, 1))
+        dauer_treffer = (time.perf_counter() - start) / wiederholungen
+
+        # LRU: Platz für etwa drei Dateien, zehn verschiedene Seeds
+        cache.max_bytes = 3.5 * cache.groesse()
+        for seed in range(2, 12):
+            cache.datei("waben", {"anzahl": anzahl, "seed": seed}, lambda ziel, seed=seed: erzeuge(ziel, seed))
+        dateien = len([name for name in os.listdir(ordner) if name not in (INDEX_NAME, SPERR_NAME)])
+
+    print(f"♻️ {anzahl:,} Waben als PDF")
+    print(f"   neu erzeugt: {dauer_neu * 1000:8.1f} ms")
+    print(f"   aus Cache:   {dauer_treffer * 1000:8.2f} ms")
+    print(f"   LRU: 11 Anfragen, Platz für 3 -> {len(cache.eintraege)} im Index, {dateien} Dateien im Ordner")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        benchmark()
+    elif "--leeren" in sys.argv:
+        cache = standard_cache()
+        anzahl = len(cache.eintraege)
+        cache.leeren()
+        print(f"🧹 {anzahl} Dateien aus {cache.ordner} gelöscht")
+    else:
+        cache = standard_cache()
+        print(f"♻️ Render-Cache {cache.ordner}: {len(cache.eintraege)} Dateien, "
+              f"{cache.groesse() / 1024 / 1024:.1f} von {cache.max_bytes / 1024 / 1024:.0f} MB")
+        for eintrag in reversed(list(cache.eintraege.values())):
+            print(f"   {eintrag['datei']:40s} {eintrag['bytes'] / 1024:8.1f} KB  {eintrag['parameter']}")
@@ -0,0 +1,442 @@
+########################################
+# SZENE: einmal anordnen, als PDF, HTML oder SVG ausgeben 🖼️
+########################################
+# Kreise, Waben und Texte wurden bisher in jedem Generator einzeln
+# berechnet (reportlab-Sechsecke in formen_als_pdf.py, Kreise mit
+# "x - 7" für die Nummer in formen_als_pdf_fixed.py, CSS-Kreise in den
+# Timeline-Seiten). Jetzt gibt es eine Szene im Speicher:
+#   szene = Szene(595, 842)
+#   szene.form("kreis", x, y, 25, beschriftung="7")
+#   szene.text(x, y, "Titel", ausrichtung="mitte")
+# und drei Ausgaben dafür:
+#   rendere_pdf([szene, ...], "datei.pdf")   # eine Seite pro Szene
+#   rendere_html(szene, "datei.html")        # wie die Timeline-Seiten
+#   rendere_svg(szene, "datei.svg")
+#
+# - Koordinaten: Ursprung oben links, y nach unten (wie HTML/SVG) -
+#   das PDF dreht nur um
+# - Beschriftungen werden beim Anordnen einmal zentriert: die Breite kommt
+#   aus einer Tabelle der Helvetica-Zeichenbreiten (mit Cache), nicht aus
+#   einer Schätzung wie "x - 7"
+# - gleiche Formen werden einmal definiert und dann nur noch eingesetzt
+#   (PDF: Form-XObject, SVG: <g> in <defs> + <use>)
+# - HTML und SVG werden Element für Element in die Datei geschrieben -
+#   auch riesige Szenen werden nie ein einziger großer String
+#
+# Benchmark:  python szene.py --benchmark 50000
+########################################
+
+import math
+from collections import namedtuple
+from functools import lru_cache
+from html import escape
+
+# Die 6 Ecken eines Sechsecks mit Radius 1 (0°, 60°, ..., 300°) - einmal berechnet
+WABEN_ECKEN = tuple((math.cos(math.radians(ecke * 60)), math.sin(math.radians(ecke * 60)))
+                    for ecke in range(6))
+
+# Zeichenbreiten in 1/1000 der Schriftgröße (Adobe-Metriken der PDF-Standardschriften)
+_ASCII = "".join(chr(zeichen) for zeichen in range(32, 127)) + "äöüÄÖÜß€"
+_BREITEN_TEXT = {
+    "Helvetica": [
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278, 556, 556, 556, 556,
+        556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556, 1015, 667, 667, 722, 722, 667, 611, 778,
+        722, 278, 500, 667, 556, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278,
+        278, 278, 469, 556, 333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+        556, 556, 556, 667, 778, 722, 611, 556],
+    "Helvetica-Bold": [
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278, 556, 556, 556, 556,
+        556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611, 975, 722, 722, 722, 722, 667, 611, 778,
+        722, 278, 556, 722, 611, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333,
+        278, 333, 584, 556, 333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+        611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+        556, 611, 611, 722, 778, 722, 611, 556],
+}
+ZEICHEN_BREITEN = {schrift: dict(zip(_ASCII, breiten)) for schrift, breiten in _BREITEN_TEXT.items()}
+
+
+@lru_cache(maxsize=65536)
+def textbreite(text, schrift="Helvetica", groesse=12):
+    """
+    Breite eines Textes in Punkten (bzw. Pixeln).
+
+    Zeichen, die nicht in der Tabelle stehen, fragt reportlab (wenn installiert),
+    sonst zählen sie wie eine Ziffer.
+    """
+    tabelle = ZEICHEN_BREITEN[schrift]
+    summe = 0
+    for zeichen in text:
+        breite = tabelle.get(zeichen)
+        if breite is None:
+            try:
+                from reportlab.pdfbase.pdfmetrics import stringWidth
+                breite = stringWidth(zeichen, schrift, 1000)
+            except ImportError:
+                breite = 556
+        summe += breite
+    return summe * groesse / 1000
+
+
+########################################
+# DIE SZENE
+########################################
+
+# art: "kreis" oder "wabe", groesse: Radius; Beschriftung schon fertig angeordnet
+Form = namedtuple("Form", "art x y groesse linie beschriftung schrift schriftgroesse text_x text_y")
+# x: linker Rand des Textes (nach der Ausrichtung), y: Grundlinie
+Text = namedtuple("Text", "x y text schrift schriftgroesse breite")
+
+BESCHRIFTUNG_ABSTAND = 5  # Punkte zwischen Form und Beschriftung darüber
+
+
+class Szene:
+    def __init__(self, breite, hoehe, titel="", ueberschrift=""):
+        """
+        Parameter:
+        - breite, hoehe: Größe in Punkten (PDF) bzw. Pixeln (HTML/SVG)
+        - titel: Dokument-Titel (HTML <title>, PDF-Metadaten)
+        - ueberschrift: sichtbare Überschrift über der Zeichenfläche (HTML)
+        """
+        self.breite = breite
+        self.hoehe = hoehe
+        self.titel = titel
+        self.ueberschrift = ueberschrift
+        self.formen = []
+        self.texte = []
+
+    def form(self, art, x, y, groesse, beschriftung=None, linie=2, schrift="Helvetica-Bold", schriftgroesse=14):
+        """
+        Kreis oder Wabe mit Mittelpunkt (x, y), optional mit zentrierter Beschriftung darüber.
+
+        Parameter:
+        - art: "kreis" oder "wabe"
+        - groesse: Radius
+        - beschriftung: z.B. die Nummer
+        - linie: Linienbreite
+        """
+        text_x = text_y = None
+        if beschriftung is not None:
+            beschriftung = str(beschriftung)
+            text_x = x - textbreite(beschriftung, schrift, schriftgroesse) / 2
+            text_y = y - groesse - BESCHRIFTUNG_ABSTAND
+        self.formen.append(Form(art, x, y, groesse, linie, beschriftung, schrift, schriftgroesse, text_x, text_y))
+
+    def text(self, x, y, text, schrift="Helvetica", schriftgroesse=12, ausrichtung="links"):
+        """Text mit Grundlinie y; ausrichtung "links", "mitte" oder "rechts" bezogen auf x."""
+        breite = textbreite(text, schrift, schriftgroesse)
+        if ausrichtung == "mitte":
+            x -= breite / 2
+        elif ausrichtung == "rechts":
+            x -= breite
+        self.texte.append(Text(x, y, text, schrift, schriftgroesse, breite))
+
+    def __len__(self):
+        return len(self.formen) + len(self.texte)
+
+
+def _zahl(wert):
+    """Kurze Zahl für SVG/HTML: 12.0 -> "12", 12.3456 -> "12.35"."""
+    return f"{wert:.2f}".rstrip("0").rstrip(".")
+
+
+########################################
+# PDF (reportlab)
+########################################
+
+def _pdf_vorlage(pdf_canvas, name, art, groesse, linie):
+    """Form einmal als Form-XObject um (0, 0) anlegen."""
+    rand = groesse + linie
+    pdf_canvas.beginForm(name, lowerx=-rand, lowery=-rand, upperx=rand, uppery=rand)
+    pdf_canvas.setLineWidth(linie)
+    if art == "kreis":
+        pdf_canvas.circle(0, 0, groesse, stroke=1, fill=1)
+    else:
+        pfad = pdf_canvas.beginPath()
+        pfad.moveTo(groesse * WABEN_ECKEN[0][0], groesse * WABEN_ECKEN[0][1])
+        for ecke_x, ecke_y in WABEN_ECKEN[1:]:
+            pfad.lineTo(groesse * ecke_x, groesse * ecke_y)
+        pfad.close()
+        pdf_canvas.drawPath(pfad, stroke=1, fill=1)
+    pdf_canvas.endForm()
+
+def rendere_pdf(szenen, dateiname):
+    """
+    Schreibt Szenen als PDF, eine Seite pro Szene.
+
+    Parameter:
+    - szenen: eine Szene oder mehrere (Liste/Generator)
+    - dateiname: Ziel-Datei
+    """
+    from reportlab.lib import colors
+    from reportlab.pdfgen import canvas
+
+    if isinstance(szenen, Szene):
+        szenen = [szenen]
+    pdf_canvas = None
+    vorlagen = {}  # (art, groesse, linie) -> Name, gilt für das ganze Dokument
+    for szene in szenen:
+        if pdf_canvas is None:
+            pdf_canvas = canvas.Canvas(dateiname, pagesize=(szene.breite, szene.hoehe))
+            if szene.titel:
+                pdf_canvas.setTitle(szene.titel)
+        else:
+            pdf_canvas.setPageSize((szene.breite, szene.hoehe))
+        hoehe = szene.hoehe
+
+        # Stil einmal pro Seite: schwarzer Rand, weißer Inhalt zum Ausmalen
+        pdf_canvas.setStrokeColor(colors.black)
+        pdf_canvas.setFillColor(colors.white)
+        for form in szene.formen:
+            schluessel = (form.art, form.groesse, form.linie)
+            name = vorlagen.get(schluessel)
+            if name is None:
+                # Name nur aus dem Zähler - gerundete Maße könnten zwei Formen gleich benennen
+                name = vorlagen[schluessel] = f"{form.art}_{len(vorlagen)}"
+                _pdf_vorlage(pdf_canvas, name, *schluessel)
+            pdf_canvas.saveState()
+            pdf_canvas.translate(form.x, hoehe - form.y)
+            pdf_canvas.doForm(name)
+            pdf_canvas.restoreState()
+
+        pdf_canvas.setFillColor(colors.black)
+        schrift = None
+        for form in szene.formen:
+            if form.beschriftung is not None:
+                if schrift != (form.schrift, form.schriftgroesse):
+                    schrift = (form.schrift, form.schriftgroesse)
+                    pdf_canvas.setFont(*schrift)
+                pdf_canvas.drawString(form.text_x, hoehe - form.text_y, form.beschriftung)
+        for text in szene.texte:
+            if schrift != (text.schrift, text.schriftgroesse):
+                schrift = (text.schrift, text.schriftgroesse)
+                pdf_canvas.setFont(*schrift)
+            pdf_canvas.drawString(text.x, hoehe - text.y, text.text)
+        pdf_canvas.showPage()
+    if pdf_canvas is not None:
+        pdf_canvas.save()
+
+
+########################################
+# SVG
+########################################
+
+def _oeffne(ziel):
+    """Dateiname oder offene Datei -> (datei, selbst_geoeffnet)."""
+    if hasattr(ziel, "write"):
+        return ziel, False
+    return open(ziel, "w", encoding="utf-8"), True
+
+def rendere_svg(szene, ziel):
+    """
+    Schreibt die Szene als SVG - Element für Element.
+
+    Parameter:
+    - ziel: Dateiname oder offene Text-Datei
+    """
+    datei, selbst = _oeffne(ziel)
+    try:
+        schreibe = datei.write
+        schreibe(f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+                 f'width="{_zahl(szene.breite)}" height="{_zahl(szene.hoehe)}" '
+                 f'viewBox="0 0 {_zahl(szene.breite)} {_zahl(szene.hoehe)}">\n')
+        if szene.titel:
+            schreibe(f"<title>{escape(szene.titel)}</title>\n")
+
+        # Vorlagen: jede Form-Art/Größe einmal
+        vorlagen = {}
+        schreibe("<defs>\n")
+        for form in szene.formen:
+            schluessel = (form.art, form.groesse, form.linie)
+            if schluessel in vorlagen:
+                continue
+            name = vorlagen[schluessel] = f"{form.art}_{len(vorlagen)}"
+            if form.art == "kreis":
+                figur = f'<circle r="{_zahl(form.groesse)}"/>'
+            else:
+                ecken = " ".join(f"{_zahl(form.groesse * ecke_x)},{_zahl(-form.groesse * ecke_y)}"
+                                 for ecke_x, ecke_y in WABEN_ECKEN)
+                figur = f'<polygon points="{ecken}"/>'
+            schreibe(f'<g id="{name}" stroke="black" fill="white" stroke-width="{_zahl(form.linie)}">'
+                     f'{figur}</g>\n')
+        schreibe("</defs>\n")
+
+        for form in szene.formen:
+            schreibe(f'<use xlink:href="#{vorlagen[form.art, form.groesse, form.linie]}" '
+                     f'x="{_zahl(form.x)}" y="{_zahl(form.y)}"/>\n')
+        for form in szene.formen:
+            if form.beschriftung is not None:
+                schreibe(_svg_text(form.text_x, form.text_y, form.beschriftung, form.schrift, form.schriftgroesse))
+        for text in szene.texte:
+            schreibe(_svg_text(text.x, text.y, text.text, text.schrift, text.schriftgroesse))
+        schreibe("</svg>\n")
+    finally:
+        if selbst:
+            datei.close()
+
+def _svg_text(x, y, text, schrift, groesse):
+    fett = ' font-weight="bold"' if schrift.endswith("-Bold") else ""
+    return (f'<text x="{_zahl(x)}" y="{_zahl(y)}" font-family="Helvetica, Arial, sans-serif" '
+            f'font-size="{_zahl(groesse)}"{fett}>{escape(text)}</text>\n')
+
+
+########################################
+# HTML (wie die Timeline-Seiten)
+########################################
+
+# Maße aus dem Stylesheet: Kreis/Wabe 60px + 3px Rand, Nummer (14px + 5px Abstand) darüber
+HTML_RADIUS = 30
+HTML_RAND = 3
+HTML_NUMMER_HOEHE = 21
+
+HTML_KOPF = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>{titel}</title>
+    <style>
+        body {{ 
+            font-family: Arial, sans-serif; 
+            margin: 0;
+            padding: 20px;
+            background: white;
+            position: relative;
+        }}
+        .titel {{ 
+            text-align: center; 
+            font-size: 28px; 
+            margin-bottom: 30px;
+            color: black;
+            font-weight: bold;
+        }}
+        .timeline-container {{
+            position: relative;
+            width: {breite}px;
+            height: {hoehe}px;
+            margin: 0 auto;
+            border: 2px solid #ccc;
+            background: #f9f9f9;
+        }}
+        .kreis-element {{
+            position: absolute;
+            text-align: center;
+        }}
+        .nummer {{
+            font-size: 14px;
+            font-weight: bold;
+            margin-bottom: 5px;
+            color: black;
+        }}
+        .kreis {{
+            width: 60px;
+            height: 60px;
+            border: 3px solid black;
+            border-radius: 50%;
+            background-color: white;
+            display: inline-block;
+        }}
+        .wabe {{
+            width: 60px;
+            height: 60px;
+            border: 3px solid black;
+            background-color: white;
+            display: inline-block;
+            clip-path: polygon(25% 0%, 75% 0%, 100% 50%, 75% 100%, 25% 100%, 0% 50%);
+        }}
+        @media print {{
+            body {{ margin: 0; padding: 10px; }}
+            .timeline-container {{ width: 95%; height: 90vh; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="titel">{ueberschrift}</div>
+    <div class="timeline-container">
+"""
+
+HTML_FORM = """        <div class="kreis-element" style="left: {links}px; top: {oben}px;">
+            <div class="nummer">{nummer}</div>
+            <div class="{art}"{groesse}></div>
+        </div>
+"""
+
+HTML_FUSS = """    </div>
+</body>
+</html>"""
+
+def html_ecke(x, y, radius=HTML_RADIUS):
+    """Mittelpunkt einer Form -> left/top ihres .kreis-element (Nummer darüber, Rand drumherum)."""
+    return x - radius - HTML_RAND, y - radius - HTML_RAND - HTML_NUMMER_HOEHE
+
+def rendere_html(szene, ziel):
+    """
+    Schreibt die Szene als HTML-Seite im Stil der Timeline - Element für Element.
+
+    Parameter:
+    - ziel: Dateiname oder offene Text-Datei
+    """
+    datei, selbst = _oeffne(ziel)
+    try:
+        schreibe = datei.write
+        schreibe(HTML_KOPF.format(titel=escape(szene.titel), ueberschrift=escape(szene.ueberschrift),
+                                  breite=_zahl(szene.breite), hoehe=_zahl(szene.hoehe)))
+        for form in szene.formen:
+            links, oben = html_ecke(form.x, form.y, form.groesse)
+            groesse = ""
+            if form.groesse != HTML_RADIUS:
+                seite = _zahl(2 * form.groesse)
+                groesse = f' style="width: {seite}px; height: {seite}px;"'
+            schreibe(HTML_FORM.format(links=_zahl(links), oben=_zahl(oben), art=form.art, groesse=groesse,
+                                      nummer=escape(form.beschriftung or "")))
+        for text in szene.texte:
+            fett = " font-weight: bold;" if text.schrift.endswith("-Bold") else ""
+            schreibe(f'        <div style="position: absolute; white-space: nowrap; left: {_zahl(text.x)}px; '
+                     f'top: {_zahl(text.y - text.schriftgroesse)}px; '
+                     f'font-size: {_zahl(text.schriftgroesse)}px;{fett}">{escape(text.text)}</div>\n')
+        schreibe(HTML_FUSS)
+    finally:
+        if selbst:
+            datei.close()
+
+
+########################################
+# BENCHMARK
+########################################
+
+def benchmark(anzahl=50_000):
+    import os
+    import random
+    import tempfile
+    import time
+    import tracemalloc
+
+    zufall = random.Random(1)
+    start = time.perf_counter()
+    szene = Szene(2000, 2000, titel=f"{anzahl} Formen")
+    for nummer in range(anzahl):
+        szene.form(zufall.choice(("kreis", "wabe")), zufall.uniform(20, 1980), zufall.uniform(20, 1980), 8,
+                   beschriftung=nummer + 1, schriftgroesse=6, linie=1)
+    dauer_anordnen = time.perf_counter() - start
+
+    print(f"🖼️ {anzahl:,} Formen mit Nummern, angeordnet in {dauer_anordnen * 1000:.0f} ms")
+    with tempfile.TemporaryDirectory() as ordner:
+        for endung, ausgabe in (("pdf", rendere_pdf), ("svg", rendere_svg), ("html", rendere_html)):
+            pfad = os.path.join(ordner, f"szene.{endung}")
+            start = time.perf_counter()
+            ausgabe(szene, pfad)
+            dauer = time.perf_counter() - start
+            # Speicher extra messen - tracemalloc bremst stark
+            tracemalloc.start()
+            ausgabe(szene, pfad)
+            _, spitze = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"   {endung:4s} {dauer * 1000:8.0f} ms  {os.path.getsize(pfad) / 1e6:6.1f} MB Datei, "
+                  f"Speicher-Spitze {spitze / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        stelle = sys.argv.index("--benchmark")
+        benchmark(int(sys.argv[stelle + 1]) if len(sys.argv) > stelle + 1 else 50_000)
@@ -0,0 +1,125 @@
+########################################
+# TIMELINE-GENERATOR (HTML) 📅
+########################################
+# Erstellt eine Timeline als HTML-Seite: nummerierte Kreise (oder Waben)
+# zum Ausmalen, zufällig verteilt in einem 1000 x 800 Kasten.
+# - Dateiname wie bisher: timeline_<name>_<anzahl>kreise_<uhrzeit>.html
+# - Positionen kommen aus platzierung.py (Poisson-Disk) - die Kreise
+#   überschneiden sich nie, auch bei vielen Kreisen nicht
+# - die Seite ist eine Szene (szene.py) und wird Element für Element in
+#   die Datei geschrieben; dieselbe Szene geht auch als PDF oder SVG
+# - run() legt die Seite im Render-Cache ab (render_cache.py): jeder Start
+#   zieht einen neuen Seed (neue Anordnung); gleiche Eingaben mit gleichem
+#   Seed = dieselbe Datei, keine neue Kopie mit Uhrzeit im Namen
+#
+# Beispiel:
+#   erstelle_timeline_html("mathe", 6)
+#   python timeline_html.py
+########################################
+
+import datetime
+import os
+import random
+import webbrowser
+
+from platzierung import platziere
+from render_cache import cache_datei, neuer_seed
+from szene import HTML_NUMMER_HOEHE, HTML_RADIUS, HTML_RAND, Szene, rendere_html
+
+# Log-System aktivieren
+import log
+log.run()
+
+# Maße aus dem Stylesheet in szene.py (Kreis 60px + 3px Rand, Nummer darüber)
+ELEMENT_BREITE = 66
+ELEMENT_HOEHE = 88
+LUECKE = 10
+KASTEN_BREITE, KASTEN_HOEHE = 1000, 800
+# Bereich für left/top im Kasten (mit Rand)
+LINKS_MIN, LINKS_MAX = 80, 900
+OBEN_MIN, OBEN_MAX = 80, 700
+
+########################################
+# HTML-ERSTELLUNG
+########################################
+
+def timeline_positionen(anzahl, zufall=None):
+    """
+    left/top für anzahl Elemente ohne Überschneidungen (in zufälliger Reihenfolge).
+
+    Rückgabe:
+    - Liste von (left, top) in Pixeln (weniger als anzahl, wenn nicht alle passen)
+    """
+    mitten = platziere(anzahl, LINKS_MAX - LINKS_MIN, OBEN_MAX - OBEN_MIN,
+                       ELEMENT_BREITE, ELEMENT_HOEHE, LUECKE, zufall)
+    return [(LINKS_MIN + round(x), OBEN_MIN + round(y)) for x, y in mitten]
+
+def erstelle_timeline_html(name, anzahl, form="kreis", dateiname=None, zufall=None):
+    """
+    Schreibt eine Timeline-Seite.
+
+    Parameter:
+    - name: Titel der Timeline (auch im Dateinamen)
+    - anzahl: Anzahl der Kreise/Waben
+    - form: "kreis" oder "wabe"
+    - dateiname: Ziel-Datei (Standard: timeline_<name>_<anzahl>kreise_<uhrzeit>.html)
+    - zufall: random.Random (für wiederholbare Seiten)
+
+    Rückgabe:
+    - Name der geschriebenen Datei
+    """
+    if dateiname is None:
+        sauber = "".join(zeichen for zeichen in name if zeichen.isalnum() or zeichen in " -_").strip()[:20]
+        zeitstempel = datetime.datetime.now().strftime("%H%M%S")
+        dateiname = f"timeline_{sauber}_{anzahl}kreise_{zeitstempel}.html"
+
+    positionen = timeline_positionen(anzahl, zufall or random.Random())
+    if len(positionen) < anzahl:
+        print(f"⚠️ Nur {len(positionen)} von {anzahl} passen ohne Überschneidung in den Kasten")
+
+    titel = f"{name} - {anzahl} {'Waben' if form == 'wabe' else 'Kreise'}"
+    szene = Szene(KASTEN_BREITE, KASTEN_HOEHE, titel=titel, ueberschrift=titel)
+    for nummer, (links, oben) in enumerate(positionen, 1):
+        # left/top des Elements -> Mittelpunkt der Form
+        szene.form(form, links + HTML_RAND + HTML_RADIUS, oben + HTML_NUMMER_HOEHE + HTML_RAND + HTML_RADIUS,
+                   HTML_RADIUS, beschriftung=nummer)
+    rendere_html(szene, dateiname)
+    return dateiname
+
+def timeline_aus_cache(name, anzahl, form="kreis", seed=None):
+    """
+    Wie erstelle_timeline_html, aber über den Render-Cache: gleicher Name, gleiche
+    Anzahl, Form und Seed liefern sofort die schon erzeugte Seite.
+
+    Parameter:
+    - seed: None = neue Anordnung (frischer Seed, siehe render_cache.neuer_seed)
+
+    Rückgabe:
+    - Pfad der HTML-Datei im Cache-Ordner
+    """
+    if seed is None:
+        seed = neuer_seed()
+    parameter = {"name": name, "anzahl": anzahl, "form": form, "seed": seed}
+    return cache_datei("timeline", parameter,
+                       lambda ziel: erstelle_timeline_html(name, anzahl, form, ziel, random.Random(seed)),
+                       endung=".html")
+
+
+########################################
+# HAUPTPROGRAMM
+########################################
+
+def run():
+    """Fragt Name, Anzahl und Form ab und öffnet die Timeline im Browser."""
+    print("📅 Timeline-Generator startet...")
+    name = input("Name der Timeline: ").strip() or "Timeline"
+    eingabe = input("Wie viele Kreise? (Standard 6): ").strip()
+    anzahl = int(eingabe) if eingabe.isdigit() else 6
+    form = "wabe" if input("Waben statt Kreise? (j/n): ").strip().lower() == "j" else "kreis"
+
+    dateiname = timeline_aus_cache(name, anzahl, form)
+    print(f"✅ Timeline '{dateiname}' erstellt!")
+    webbrowser.open("file://" + os.path.abspath(dateiname))
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,92 @@
+########################################
+# BENCHMARK: KALTSTART DES MENÜS
+########################################
+# Misst, wie lange ein frischer Python-Prozess braucht, bis das Menü
+# (die Spieleliste) steht - einmal mit der Registry (Spiele werden nicht
+# importiert) und einmal "wie früher" (alle Spiel-Module werden importiert).
+# Dafür werden N Spiel-Module erzeugt, die beim Import wie die echten
+# Spiele etwas tun (hier: 2 ms Arbeit statt log.run()).
+#
+# Aufruf:  python bench_menu_start.py [N1 N2 ...]
+########################################
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+haupt_ordner = os.path.dirname(os.path.abspath(__file__))
+
+KIND_PROZESS = """
+import sys, time
+sys.path.insert(0, {haupt_ordner!r})
+import spiele_registry
+for i in range({anzahl}):
+    spiele_registry.registriere(f"Spiel {{i}}", f"spiel_{{i}}", {ordner!r})
+spiele = spiele_registry.liste_spiele()
+if {alle_importieren}:
+    for spiel in spiele[-{anzahl}:]:
+        spiele_registry.lade_spiel(spiel)
+print(spiele_registry.startzeit_ms())
+"""
+
+SPIEL_MODUL = """
+import time
+ende = time.perf_counter() + 0.002   # Import-Nebenwirkung wie log.run()
+while time.perf_counter() < ende:
+    pass
+
+def run():
+    print("Spiel läuft")
+"""
+
+
+def kaltstart(ordner, anzahl, alle_importieren, wiederholungen=5):
+    """Bester Wert aus mehreren frischen Prozessen: (gesamt_ms, menü_ms)."""
+    code = KIND_PROZESS.format(haupt_ordner=haupt_ordner, anzahl=anzahl,
+                               ordner=ordner, alle_importieren=alle_importieren)
+    bester = None
+    for _ in range(wiederholungen):
+        start = time.perf_counter()
+        ausgabe = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        gesamt = (time.perf_counter() - start) * 1000
+        menu = float(ausgabe.stdout.strip().splitlines()[-1])
+        if bester is None or gesamt < bester[0]:
+            bester = (gesamt, menu)
+    return bester
+
+
+def main():
+    anzahlen = [int(zahl) for zahl in sys.argv[1:]] or [5, 50, 500]
+    sys.path.insert(0, haupt_ordner)
+    import spiele_registry
+    budget = spiele_registry.STARTZEIT_BUDGET_MS
+
+    print(f"{'Spiele':>7} | {'Registry gesamt':>15} | {'Registry Menü':>13} | {'alle importieren':>16}")
+    print("-" * 62)
+    menu_zeiten = []
+    for anzahl in anzahlen:
+        with tempfile.TemporaryDirectory() as ordner:
+            for nummer in range(anzahl):
+                with open(os.path.join(ordner, f"spiel_{nummer}.py"), "w", encoding="utf-8") as file:
+                    file.write(SPIEL_MODUL)
+            gesamt_lazy, menu_lazy = kaltstart(ordner, anzahl, False)
+            gesamt_alle, _ = kaltstart(ordner, anzahl, True, wiederholungen=2)
+        menu_zeiten.append(menu_lazy)
+        print(f"{anzahl:>7} | {gesamt_lazy:>12.1f} ms | {menu_lazy:>10.2f} ms | {gesamt_alle:>13.1f} ms")
+
+    fehler = False
+    if max(menu_zeiten) > budget:
+        print(f"❌ Menü-Start über dem Budget von {budget} ms")
+        fehler = True
+    if menu_zeiten[-1] > max(5 * menu_zeiten[0], 1.0):
+        print("❌ Menü-Start wächst mit der Anzahl der Spiele")
+        fehler = True
+    if fehler:
+        sys.exit(1)
+    print(f"✅ Menü-Start im Budget ({budget} ms) und unabhängig von der Anzahl der Spiele")
+
+
+if __name__ == "__main__":
+    main()
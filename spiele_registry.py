@@ -0,0 +1,158 @@
+########################################
+# SPIELE-REGISTRY 🎮
+########################################
+# Liste aller Spiele als reine Daten (Name, Modul, Ordner, Startfunktion).
+# Das Menü zeigt nur diese Liste an - ein Spiel-Modul wird erst importiert,
+# wenn es wirklich gestartet wird. Damit laufen auch die log.run()-Aufrufe,
+# die in den Spielen beim Import passieren, nur für das gewählte Spiel.
+#
+# Neues Spiel? Einfach einen Eintrag in SPIELE ergänzen (oder registriere()).
+#
+# Startzeit: Die Zeit vom Import dieser Datei bis das Menü steht, wird
+# gemessen. Ist sie größer als STARTZEIT_BUDGET_MS, gibt es eine Warnung.
+# bench_menu_start.py prüft, dass der Kaltstart nicht mit der Anzahl der
+# Spiele wächst.
+########################################
+
+import time
+
+_start = time.perf_counter()
+
+import importlib
+import os
+import sys
+
+haupt_ordner = os.path.dirname(os.path.abspath(__file__))
+
+STARTZEIT_BUDGET_MS = 50  # so lange darf es vom Start bis zum fertigen Menü höchstens dauern
+
+SPIELE = [
+    {
+        "name": "Ausmalbuch",
+        "beschreibung": "50 nummerierte Kreise zum Ausmalen als PDF",
+        "ordner": "alte",
+        "modul": "formen_als_pdf_fixed",
+        "start": "run",
+    },
+    {
+        "name": "Waben-PDF",
+        "beschreibung": "100 Bienenwaben als PDF (ohne Überschneidungen)",
+        "ordner": "alte",
+        "modul": "formen_als_pdf",
+        "start": "run",
+    },
+    {
+        "name": "Arbeitsheft",
+        "beschreibung": "Viele Seiten Kreise + Klammer-Aufgaben, mit Lösungsheft",
+        "ordner": "alte",
+        "modul": "arbeitsheft",
+        "start": "run",
+    },
+    {
+        "name": "Timeline",
+        "beschreibung": "Nummerierte Kreise/Waben als HTML-Seite",
+        "ordner": "alte",
+        "modul": "timeline_html",
+        "start": "run",
+    },
+    {
+        "name": "Klammerrechnung",
+        "beschreibung": "(a+b)*e, (a+b)*(e+f), (a+b)*a",
+        "ordner": "subfuc",
+        "modul": "klammerrechnung",
+        "start": "run",
+    },
+    {
+        "name": "Minus vor der Klammer",
+        "beschreibung": "-(a+b) und -(a-b*c)",
+        "ordner": "subfuc",
+        "modul": "minus_vor_der_klammer",
+        "start": "run",
+    },
+    {
+        "name": "Klammer-Spiel 1x1",
+        "beschreibung": "Klammern auflösen mit Variablen (Typ a-d)",
+        "ordner": os.path.join("subfuc", "luh"),
+        "modul": "luh1a1",
+        "start": "main",
+    },
+]
+
+
+def registriere(name, modul, ordner, start="run", beschreibung=""):
+    """
+    Fügt ein Spiel zur Liste hinzu (ohne es zu importieren).
+
+    Parameter:
+    - name: Anzeigename im Menü
+    - modul: Modulname (Dateiname ohne .py)
+    - ordner: Ordner des Moduls, relativ zum Hauptordner (oder absolut)
+    - start: Name der Funktion, die das Spiel startet
+    - beschreibung: Kurzer Text fürs Menü
+    """
+    SPIELE.append({"name": name, "beschreibung": beschreibung,
+                   "ordner": ordner, "modul": modul, "start": start})
+
+
+def liste_spiele():
+    """Alle Spiele als Metadaten - es wird dabei NICHTS importiert."""
+    return list(SPIELE)
+
+
+def lade_spiel(spiel):
+    """
+    Importiert das Modul eines Spiels (erst jetzt laufen dessen Import-Nebenwirkungen).
+
+    Parameter:
+    - spiel: Eintrag aus SPIELE oder dessen Name
+
+    Rückgabe:
+    - die Startfunktion des Spiels
+    """
+    if isinstance(spiel, str):
+        spiel = next(eintrag for eintrag in SPIELE if eintrag["name"] == spiel)
+    ordner = os.path.join(haupt_ordner, spiel["ordner"])
+    for pfad in (haupt_ordner, ordner):  # Spiele erwarten log.py im Hauptordner
+        if pfad not in sys.path:
+            sys.path.insert(0, pfad)
+    modul = importlib.import_module(spiel["modul"])
+    return getattr(modul, spiel["start"])
+
+
+def starte_spiel(spiel):
+    """Lädt ein Spiel und startet es."""
+    lade_spiel(spiel)()
+
+
+def startzeit_ms():
+    """Millisekunden seit dem Import dieser Datei."""
+    return (time.perf_counter() - _start) * 1000
+
+
+def zeige_menu():
+    """Zeigt das Spiele-Menü und startet das gewählte Spiel."""
+    spiele = liste_spiele()
+    print("\n" + "=" * 50)
+    print("🎮 AKADEMY - SPIELE")
+    print("=" * 50)
+    for nummer, spiel in enumerate(spiele, 1):
+        print(f"{nummer} - {spiel['name']}: {spiel['beschreibung']}")
+    print("0 - 👋 Beenden")
+
+    dauer = startzeit_ms()
+    if dauer > STARTZEIT_BUDGET_MS:
+        print(f"⚠️  Menü-Start dauerte {dauer:.0f} ms (Budget: {STARTZEIT_BUDGET_MS} ms)")
+
+    while True:
+        wahl = input(f"\n➤ Ihre Wahl (0-{len(spiele)}): ").strip()
+        if wahl == "0":
+            print("👋 Auf Wiedersehen!")
+            return
+        if wahl.isdigit() and 1 <= int(wahl) <= len(spiele):
+            starte_spiel(spiele[int(wahl) - 1])
+            return
+        print(f"❌ Bitte eine Zahl von 0 bis {len(spiele)} eingeben!")
+
+
+if __name__ == "__main__":
+    zeige_menu()
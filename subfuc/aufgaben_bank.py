@@ -0,0 +1,280 @@
+########################################
+# AUFGABEN-BANK: alle Aufgaben einmal vorberechnet 🏦
+########################################
+# Mana geht in den Spielen nur von 1 bis 20 - es gibt also nur endlich
+# viele Aufgaben pro Typ (Typ c/d: 40^4). Die Bank zählt sie einmal auf
+# und speichert sie als .npy-Dateien, die per Memory-Map gelesen werden.
+#
+# Sortiert wird nach (Mana-Stufe, Null in der Lösung, Vorzeichen-Muster,
+# Betrag der Lösung). Dadurch ist jede Kombination aus Stufe, Null und
+# Vorzeichen ein zusammenhängender Bereich, und "Betrag < 100" ist ein
+# Anfang dieses Bereichs. Eine Ziehung wie
+#   "Typ c, Mana 7, keine Null-Koeffizienten, |Lösung| < 100"
+# ist damit nur noch ein Nachschlagen in einer kleinen Tabelle plus
+# ein Zufalls-Index - kein Erzeugen und Wegwerfen mehr.
+#
+# - Mana-Stufe: größter Betrag eines Operanden (Aufgabe passt zu allen Mana >= Stufe)
+# - Null: ein Koeffizient (bzw. die Lösung) ist 0
+# - Vorzeichen-Muster: Bit j gesetzt = Koeffizient j ist negativ
+# - Betrag: größter Betrag eines Koeffizienten (bzw. der Lösung)
+#
+# Beispiele:
+#   python aufgaben_bank.py baue                 # alle Quest-Typen (einmalig)
+#   python aufgaben_bank.py zieh luh_c --mana 7 --ohne-null --betrag-unter 100 -n 5
+#   python aufgaben_bank.py benchmark
+#
+#   bank = lade_bank("luh_c")
+#   stapel = bank.ziehe(1000, mana=7, ohne_null=True, betrag_unter=100)
+########################################
+
+import json
+import os
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "luh"))
+import luh1a1_batch
+from aufgaben_batch import QUESTS
+
+MAX_MANA = 20
+VERSION = 1
+BANK_ORDNER = os.environ.get(
+    "AKADEMY_BANK_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "aufgaben_bank"),
+)
+
+# luh1a1-Typen: Operanden ohne 0, Lösung = Koeffizienten; Klammer-Quests: Operanden mit 0
+BANK_TYPEN = {f"luh_{typ}": {"luh_typ": typ} for typ in luh1a1_batch.TYPEN}
+BANK_TYPEN.update({quest: {"quest": quest} for quest in QUESTS})
+
+
+def _werte_der_zahlen(quest):
+    """Alle möglichen Operanden-Werte eines Quest-Typs (bei Mana 20)."""
+    werte = np.arange(-MAX_MANA, MAX_MANA + 1, dtype=np.int8)
+    if "luh_typ" in BANK_TYPEN[quest]:
+        werte = werte[werte != 0]
+    return werte
+
+
+def _anzahl_operanden(quest):
+    spec = BANK_TYPEN[quest]
+    if "luh_typ" in spec:
+        return luh1a1_batch.TYPEN[spec["luh_typ"]]["operanden"]
+    return len(QUESTS[spec["quest"]]["operanden"])
+
+
+def _loesungen(quest, operanden):
+    """Lösungs-Spalten (N, m) für alle Operanden-Zeilen."""
+    spec = BANK_TYPEN[quest]
+    breit = operanden.astype(np.int32)
+    if "luh_typ" in spec:
+        return luh1a1_batch.koeffizienten(spec["luh_typ"], breit)
+    return QUESTS[spec["quest"]]["loesung"](*breit.T)[:, None]
+
+
+def baue_bank(quest, ordner=BANK_ORDNER):
+    """
+    Zählt alle Aufgaben eines Quest-Typs auf, sortiert sie und schreibt die Bank.
+
+    Dateien in <ordner>/<quest>/:
+    - operanden.npy  (N, k) int8
+    - loesungen.npy  (N, m) int16
+    - praefix.npy    Start jedes Bereichs (Stufe, Null, Vorzeichen, Betrag)
+    - info.json      Größen der Tabelle
+    """
+    werte = _werte_der_zahlen(quest)
+    k = _anzahl_operanden(quest)
+    gitter = np.meshgrid(*([werte] * k), indexing="ij")
+    operanden = np.stack([achse.ravel() for achse in gitter], axis=1)
+    loesungen = _loesungen(quest, operanden)
+
+    stufe = np.abs(operanden.astype(np.int16)).max(axis=1)
+    null = (loesungen == 0).any(axis=1).astype(np.int64)
+    vorzeichen = ((loesungen < 0) << np.arange(loesungen.shape[1])).sum(axis=1)
+    betrag = np.abs(loesungen).max(axis=1)
+
+    form = (MAX_MANA + 1, 2, 2 ** loesungen.shape[1], int(betrag.max()) + 1)
+    bereich = np.ravel_multi_index((stufe, null, vorzeichen, betrag), form)
+    reihenfolge = np.argsort(bereich, kind="stable")
+    praefix = np.zeros(int(np.prod(form)) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(bereich, minlength=praefix.size - 1), out=praefix[1:])
+
+    ziel = os.path.join(ordner, quest)
+    os.makedirs(ziel, exist_ok=True)
+    np.save(os.path.join(ziel, "operanden.npy"), operanden[reihenfolge])
+    np.save(os.path.join(ziel, "loesungen.npy"), loesungen[reihenfolge].astype(np.int16))
+    np.save(os.path.join(ziel, "praefix.npy"), praefix)
+    with open(os.path.join(ziel, "info.json"), "w", encoding="utf-8") as file:
+        json.dump({"quest": quest, "version": VERSION, "max_mana": MAX_MANA,
+                   "form": form, "anzahl": len(operanden)}, file)
+    lade_bank.cache_clear()
+    return len(operanden)
+
+
+class AufgabenBank:
+    def __init__(self, quest, ordner=BANK_ORDNER):
+        """
+        Öffnet eine gebaute Bank (Operanden und Lösungen bleiben auf der Platte).
+
+        Parameter:
+        - quest: Schlüssel aus BANK_TYPEN, z.B. "luh_c" oder "klammer2"
+        """
+        ziel = os.path.join(ordner, quest)
+        with open(os.path.join(ziel, "info.json"), "r", encoding="utf-8") as file:
+            info = json.load(file)
+        if info["version"] != VERSION:
+            raise ValueError(f"Bank {quest} ist veraltet - bitte neu bauen")
+        self.quest = quest
+        self.form = tuple(info["form"])
+        self.operanden = np.load(os.path.join(ziel, "operanden.npy"), mmap_mode="r")
+        self.loesungen = np.load(os.path.join(ziel, "loesungen.npy"), mmap_mode="r")
+        self.praefix = np.load(os.path.join(ziel, "praefix.npy"))
+        self._bereiche = lru_cache(maxsize=256)(self._berechne_bereiche)
+
+    def _berechne_bereiche(self, mana, ohne_null, vorzeichen, betrag_unter):
+        stufen, _, muster, betraege = self.form
+        obergrenze = betraege if betrag_unter is None else max(0, min(betrag_unter, betraege))
+        nullen = (0, 1) if ohne_null is None else ((0,) if ohne_null else (1,))
+        alle_muster = range(muster) if vorzeichen is None else vorzeichen
+
+        starts, enden = [], []
+        for stufe in range(min(mana, stufen - 1) + 1):
+            for null in nullen:
+                for bits in alle_muster:
+                    anfang = np.ravel_multi_index((stufe, null, bits, 0), self.form)
+                    starts.append(self.praefix[anfang])
+                    enden.append(self.praefix[anfang + obergrenze])
+        starts = np.array(starts, dtype=np.int64)
+        summen = np.cumsum(np.array(enden, dtype=np.int64) - starts)
+        vorher = np.concatenate(([0], summen[:-1]))  # Nummern vor jedem Bereich
+        return starts, vorher, summen
+
+    def anzahl(self, mana, ohne_null=None, vorzeichen=None, betrag_unter=None):
+        """Wie viele Aufgaben passen zu den Bedingungen?"""
+        _, _, summen = self._bereiche(mana, ohne_null, _als_tupel(vorzeichen), betrag_unter)
+        return int(summen[-1]) if len(summen) else 0
+
+    def ziehe(self, anzahl, mana, ohne_null=None, vorzeichen=None, betrag_unter=None, rng=None,
+              mit_text=True):
+        """
+        Zieht gleichverteilt aus allen passenden Aufgaben (mit Zurücklegen).
+
+        Parameter:
+        - anzahl: Wie viele Aufgaben
+        - mana: Alle Operanden in [-mana, mana]
+        - ohne_null: True = kein Koeffizient 0, False = mindestens einer 0, None = egal
+        - vorzeichen: Liste erlaubter Vorzeichen-Muster (Bit j = Koeffizient j negativ), None = alle
+        - betrag_unter: Alle Koeffizienten mit |wert| < betrag_unter, None = egal
+        - rng: numpy.random.Generator
+        - mit_text: False -> bei luh-Typen keine Texte bauen
+
+        Rückgabe (dict):
+        - operanden, loesungen: Arrays (anzahl, k) und (anzahl, m)
+        - für luh-Typen zusätzlich typ, variablen, koeffizienten, aufgaben, loesungstexte
+          (passt zu luh1a1_batch.erwartungen_aus_stapel)
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        starts, vorher, summen = self._bereiche(mana, ohne_null, _als_tupel(vorzeichen), betrag_unter)
+        if not len(summen) or summen[-1] == 0:
+            raise ValueError("Keine Aufgabe passt zu diesen Bedingungen")
+
+        nummer = rng.integers(0, summen[-1], size=anzahl)
+        bereich = np.searchsorted(summen, nummer, side="right")
+        zeilen = starts[bereich] + nummer - vorher[bereich]
+        stapel = {"operanden": np.asarray(self.operanden[zeilen], dtype=np.int64),
+                  "loesungen": np.asarray(self.loesungen[zeilen], dtype=np.int64)}
+
+        luh_typ = BANK_TYPEN[self.quest].get("luh_typ")
+        if luh_typ:
+            spec = luh1a1_batch.TYPEN[luh_typ]
+            stapel["typ"] = luh_typ
+            stapel["koeffizienten"] = stapel["loesungen"]
+            stapel["variablen"] = spec["auswahl"][rng.integers(0, len(spec["auswahl"]),
+                                                               size=(anzahl, spec["variablen"]))]
+            if mit_text:
+                stapel["aufgaben"], stapel["loesungstexte"] = luh1a1_batch.baue_texte(
+                    luh_typ, stapel["operanden"], stapel["variablen"], stapel["koeffizienten"])
+        return stapel
+
+
+def _als_tupel(vorzeichen):
+    return None if vorzeichen is None else tuple(sorted(vorzeichen))
+
+
+@lru_cache(maxsize=None)
+def lade_bank(quest, ordner=BANK_ORDNER):
+    """Öffnet eine Bank (einmal pro Prozess) und baut sie, falls sie noch fehlt."""
+    if not os.path.exists(os.path.join(ordner, quest, "info.json")):
+        print(f"🏗️  Baue Aufgaben-Bank {quest} ...")
+        baue_bank(quest, ordner)
+    return AufgabenBank(quest, ordner)
+
+
+########################################
+# KOMMANDOZEILE
+########################################
+
+def benchmark(anzahl=10_000):
+    """Bank-Ziehung vs. Erzeugen und Wegwerfen für "Typ c, Mana 7, ohne Null, |Lösung| < 100"."""
+    import time
+
+    bank = lade_bank("luh_c")
+    rng = np.random.default_rng(0)
+
+    start = time.perf_counter()
+    gefunden = 0
+    versuche = 0
+    while gefunden < anzahl:
+        stapel = luh1a1_batch.erzeuge_stapel("c", anzahl, 7, rng, mit_text=False)
+        koeff = stapel["koeffizienten"]
+        gut = (koeff != 0).all(axis=1) & (np.abs(koeff).max(axis=1) < 100)
+        gefunden += int(gut.sum())
+        versuche += anzahl
+    verwerfen = time.perf_counter() - start
+
+    bank.ziehe(1, 7, ohne_null=True, betrag_unter=100, rng=rng)  # Bereiche berechnen
+    start = time.perf_counter()
+    bank.ziehe(anzahl, 7, ohne_null=True, betrag_unter=100, rng=rng, mit_text=False)
+    ziehen = time.perf_counter() - start
+    print(f"{anzahl:,} Aufgaben, davon passen {bank.anzahl(7, True, None, 100):,} von {bank.anzahl(20):,}")
+    print(f"Erzeugen + Wegwerfen: {verwerfen * 1000:7.1f} ms ({versuche:,} Versuche)")
+    print(f"Bank:                 {ziehen * 1000:7.1f} ms")
+
+
+def main(argumente=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Vorberechnete Aufgaben-Bank")
+    befehle = parser.add_subparsers(dest="befehl", required=True)
+    baue = befehle.add_parser("baue", help="Bank bauen")
+    baue.add_argument("quests", nargs="*", help="Standard: alle")
+    zieh = befehle.add_parser("zieh", help="Aufgaben ziehen")
+    zieh.add_argument("quest", choices=sorted(BANK_TYPEN))
+    zieh.add_argument("--mana", type=int, default=5)
+    zieh.add_argument("--ohne-null", action="store_true")
+    zieh.add_argument("--betrag-unter", type=int)
+    zieh.add_argument("-n", type=int, default=10)
+    befehle.add_parser("benchmark", help="Bank vs. Erzeugen und Wegwerfen")
+    args = parser.parse_args(argumente)
+
+    if args.befehl == "baue":
+        for quest in args.quests or BANK_TYPEN:
+            print(f"✅ {quest}: {baue_bank(quest):,} Aufgaben")
+    elif args.befehl == "zieh":
+        bank = lade_bank(args.quest)
+        stapel = bank.ziehe(args.n, args.mana, ohne_null=args.ohne_null or None,
+                            betrag_unter=args.betrag_unter)
+        texte = stapel.get("aufgaben")
+        for i in range(args.n):
+            if texte is not None:
+                print(f"{texte[i]} = {stapel['loesungstexte'][i]}")
+            else:
+                print(f"{stapel['operanden'][i].tolist()} -> {stapel['loesungen'][i].tolist()}")
+    else:
+        benchmark()
+
+
+if __name__ == "__main__":
+    main()
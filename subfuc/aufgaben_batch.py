@@ -0,0 +1,118 @@
+########################################
+# AUFGABEN IN GROSSEN MENGEN (NumPy) 📚
+########################################
+# Erzeugt Klammerrechnung- und Minus-vor-der-Klammer-Aufgaben für
+# Arbeitsblätter - nicht eine nach der anderen mit random.randint,
+# sondern N Stück auf einmal als NumPy-Arrays:
+# - operanden: Array (N, Anzahl Operanden), z.B. Spalten a, b, e
+# - loesungen: Array (N,)
+#
+# Für sehr große Mengen liefert aufgaben_stream() Blöcke, damit nie
+# alles gleichzeitig im Speicher liegt.
+#
+# Beispiel:
+#   operanden, loesungen = erzeuge_aufgaben("klammer2", 100_000, mana=10)
+#   for operanden, loesungen in aufgaben_stream("minus2", 5_000_000, mana=7):
+#       ...
+########################################
+
+import numpy as np
+
+# Alle Quest-Typen: Operanden-Namen, Text wie im Spiel und die Lösung (auf ganzen Spalten)
+QUESTS = {
+    "klammer1": {
+        "titel": "s1.1 - Klammer 1 - (a+b)*e",
+        "operanden": ("a", "b", "e"),
+        "text": "({a} + {b}) * {e}",
+        "loesung": lambda a, b, e: (a + b) * e,
+    },
+    "klammer2": {
+        "titel": "s1.2 - Klammer 2 - (a+b)*(e+f)",
+        "operanden": ("a", "b", "e", "f"),
+        "text": "({a} + {b}) * ({e} + {f})",
+        "loesung": lambda a, b, e, f: (a + b) * (e + f),
+    },
+    "klammer3": {
+        "titel": "s1.3 - Klammer 3 - (a+b)*a",
+        "operanden": ("a", "b"),
+        "text": "({a} + {b}) * {a}",
+        "loesung": lambda a, b: (a + b) * a,
+    },
+    "minus1": {
+        "titel": "Minus vor der Klammer 1 - -(a+b)",
+        "operanden": ("a", "b"),
+        "text": "-({a} + {b})",
+        "loesung": lambda a, b: -(a + b),
+    },
+    "minus2": {
+        "titel": "Minus vor der Klammer 2",
+        "operanden": ("a", "b", "c"),
+        "text": "-({a} - {b} * {c})",
+        "loesung": lambda a, b, c: -(a - b * c),
+    },
+}
+
+BLOCK_GROESSE = 65536  # Aufgaben pro Block in aufgaben_stream()
+
+
+def erzeuge_aufgaben(quest, anzahl, mana, rng=None):
+    """
+    Erzeugt `anzahl` Aufgaben eines Quest-Typs mit einem einzigen Zufalls-Aufruf.
+
+    Parameter:
+    - quest: Schlüssel aus QUESTS, z.B. "klammer1"
+    - anzahl: Wie viele Aufgaben
+    - mana: Zahlen kommen aus [-mana, mana] (wie in den Spielen; bei "minus1"
+      bleibt das Mana fest, im Spiel steigt es nach jeder Frage)
+    - rng: numpy.random.Generator (None = neuer, zufällig geseedet)
+
+    Rückgabe:
+    - (operanden, loesungen): int64-Arrays der Form (anzahl, k) und (anzahl,)
+    """
+    spec = QUESTS[quest]
+    rng = rng if rng is not None else np.random.default_rng()
+    operanden = rng.integers(-mana, mana, size=(anzahl, len(spec["operanden"])),
+                             endpoint=True, dtype=np.int64)
+    loesungen = spec["loesung"](*operanden.T)
+    return operanden, loesungen
+
+
+def aufgaben_stream(quest, anzahl, mana, block_groesse=BLOCK_GROESSE, rng=None):
+    """
+    Wie erzeuge_aufgaben(), aber in Blöcken - der Speicher bleibt konstant,
+    egal wie groß `anzahl` ist.
+
+    Liefert:
+    - (operanden, loesungen) für je höchstens `block_groesse` Aufgaben
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    rest = anzahl
+    while rest > 0:
+        groesse = min(block_groesse, rest)
+        yield erzeuge_aufgaben(quest, groesse, mana, rng)
+        rest -= groesse
+
+
+def als_text(quest, operanden):
+    """
+    Macht aus Operanden-Zeilen die Aufgaben-Texte wie im Spiel, z.B. "(3 + -2) * 5".
+
+    Parameter:
+    - quest: Schlüssel aus QUESTS
+    - operanden: Array (N, k) aus erzeuge_aufgaben()
+    """
+    spec = QUESTS[quest]
+    namen = spec["operanden"]
+    vorlage = spec["text"]
+    return [vorlage.format(**dict(zip(namen, zeile))) for zeile in operanden.tolist()]
+
+
+if __name__ == "__main__":
+    import time
+
+    for quest in QUESTS:
+        start = time.perf_counter()
+        operanden, loesungen = erzeuge_aufgaben(quest, 1_000_000, mana=10)
+        dauer = time.perf_counter() - start
+        beispiel = als_text(quest, operanden[:1])[0]
+        print(f"{quest:<9} 1.000.000 Aufgaben in {dauer * 1000:6.1f} ms  z.B. {beispiel} = {loesungen[0]}")
@@ -0,0 +1,202 @@
+########################################
+# AUFGABEN-DIENST: viele Aufgaben auf allen Kernen, immer gleich 🏭
+########################################
+# Verteilt eine große Bestellung ("500.000 gemischte Aufgaben") auf einen
+# Prozess-Pool - und das Ergebnis ist trotzdem Bit für Bit gleich, egal
+# mit wie vielen Prozessen gerechnet wird:
+# - die Arbeit wird in Blöcke fester Größe zerlegt (nicht pro Prozess!)
+# - jeder Block bekommt seinen eigenen Zufalls-Strom, abgeleitet aus
+#   einem Master-Seed: SeedSequence(seed, spawn_key=(quest, block))
+# - die Blöcke werden in fester Reihenfolge zusammengefügt, doppelte
+#   Aufgaben fliegen raus (die erste bleibt), fehlende werden mit den
+#   nächsten Blöcken aufgefüllt
+#
+# Beispiele:
+#   python aufgaben_dienst.py 500000 --seed 42 --prozesse 8 --ausgabe aufgaben.npz
+#   python aufgaben_dienst.py 200000 --pruefe      # 1 Prozess vs. alle Kerne vergleichen
+#
+#   ergebnis = erzeuge(500_000, seed=42, mana=10, prozesse=8)
+#   ergebnis["klammer2"]["operanden"], ergebnis["luh_c"]["variablen"], ...
+########################################
+
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "luh"))
+import luh1a1_batch
+from aufgaben_batch import QUESTS, erzeuge_aufgaben
+
+BLOCK_GROESSE = 16384  # fest - davon hängt das Ergebnis ab, nicht von der Prozess-Anzahl
+QUEST_TYPEN = list(QUESTS) + [f"luh_{typ}" for typ in luh1a1_batch.TYPEN]
+
+
+def raum_groesse(quest, mana):
+    """Wie viele verschiedene Aufgaben gibt es bei diesem Mana überhaupt?"""
+    if quest.startswith("luh_"):
+        spec = luh1a1_batch.TYPEN[quest[4:]]
+        return (2 * mana) ** spec["operanden"] * len(spec["auswahl"]) ** spec["variablen"]
+    return (2 * mana + 1) ** len(QUESTS[quest]["operanden"])
+
+
+def verteile(anzahl, mischung=None):
+    """
+    Teilt `anzahl` auf die Quest-Typen auf (größte Reste bekommen den Rest).
+
+    Parameter:
+    - mischung: {quest: anteil}, None = alle Typen gleich oft
+    """
+    mischung = mischung or {quest: 1 for quest in QUEST_TYPEN}
+    summe = sum(mischung.values())
+    genau = {quest: anzahl * anteil / summe for quest, anteil in mischung.items()}
+    anzahlen = {quest: int(wert) for quest, wert in genau.items()}
+    rest = anzahl - sum(anzahlen.values())
+    for quest in sorted(genau, key=lambda q: (anzahlen[q] - genau[q], q))[:rest]:
+        anzahlen[quest] += 1
+    return anzahlen
+
+
+def erzeuge_block(auftrag):
+    """
+    Erzeugt einen Block - läuft im Arbeits-Prozess.
+
+    Parameter:
+    - auftrag: (quest, block_nummer, mana, seed)
+
+    Rückgabe:
+    - (schluessel, loesungen): schluessel = Operanden (+ Variablen-Nummern) pro Zeile
+    """
+    quest, block_nummer, mana, seed = auftrag
+    quest_nummer = QUEST_TYPEN.index(quest)
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(quest_nummer, block_nummer)))
+    if quest.startswith("luh_"):
+        stapel = luh1a1_batch.erzeuge_stapel(quest[4:], BLOCK_GROESSE, mana, rng, mit_text=False)
+        variablen = (stapel["variablen"][..., None] == luh1a1_batch.VARIABLEN).argmax(axis=-1)
+        return np.hstack([stapel["operanden"], variablen]), stapel["koeffizienten"]
+    operanden, loesungen = erzeuge_aufgaben(quest, BLOCK_GROESSE, mana, rng)
+    return operanden, loesungen[:, None]
+
+
+def _eindeutig(schluessel, loesungen):
+    """Doppelte Zeilen entfernen, Reihenfolge des ersten Auftretens bleibt."""
+    _, erste = np.unique(schluessel, axis=0, return_index=True)
+    erste.sort()
+    return schluessel[erste], loesungen[erste]
+
+
+def erzeuge(anzahl, seed=0, mana=10, mischung=None, prozesse=None):
+    """
+    Erzeugt `anzahl` verschiedene Aufgaben, gemischt über die Quest-Typen.
+
+    Parameter:
+    - anzahl: Gesamtzahl
+    - seed: Master-Seed - gleicher Seed = gleiches Ergebnis
+    - mana: Zahlen aus [-mana, mana] (luh-Typen ohne 0)
+    - mischung: {quest: anteil}, siehe verteile()
+    - prozesse: Anzahl Arbeits-Prozesse (None = alle Kerne, 1 = ohne Pool)
+
+    Rückgabe:
+    - {quest: {"operanden", "loesungen"[, "variablen"]}} ohne doppelte Aufgaben.
+      Gibt es bei diesem Mana weniger verschiedene Aufgaben als bestellt,
+      kommen eben alle.
+    """
+    ziele = {quest: min(zahl, raum_groesse(quest, mana))
+             for quest, zahl in verteile(anzahl, mischung).items() if zahl}
+    gesammelt = {}  # quest -> (schluessel, loesungen), schon ohne Doppelte
+    naechster_block = dict.fromkeys(ziele, 0)
+
+    pool = ProcessPoolExecutor(prozesse) if prozesse != 1 else None
+    try:
+        offen = dict(ziele)
+        while offen:
+            # so viele Blöcke, wie für die fehlenden Aufgaben nötig sind
+            auftraege = []
+            for quest, fehlt in offen.items():
+                for _ in range(-(-fehlt // BLOCK_GROESSE)):
+                    auftraege.append((quest, naechster_block[quest], mana, seed))
+                    naechster_block[quest] += 1
+            bloecke = pool.map(erzeuge_block, auftraege) if pool else map(erzeuge_block, auftraege)
+
+            neu = {}
+            for (quest, *_), block in zip(auftraege, bloecke):
+                neu.setdefault(quest, []).append(block)
+            for quest, liste in neu.items():
+                if quest in gesammelt:
+                    liste.insert(0, gesammelt[quest])
+                schluessel, loesungen = _eindeutig(np.vstack([s for s, _ in liste]),
+                                                   np.vstack([l for _, l in liste]))
+                gesammelt[quest] = (schluessel[:ziele[quest]], loesungen[:ziele[quest]])
+            offen = {quest: ziele[quest] - len(gesammelt[quest][0])
+                     for quest in ziele if len(gesammelt[quest][0]) < ziele[quest]}
+    finally:
+        if pool:
+            pool.shutdown()
+
+    ergebnis = {}
+    for quest, (schluessel, loesungen) in gesammelt.items():
+        if quest.startswith("luh_"):
+            k = luh1a1_batch.TYPEN[quest[4:]]["operanden"]
+            ergebnis[quest] = {"operanden": schluessel[:, :k],
+                               "variablen": luh1a1_batch.VARIABLEN[schluessel[:, k:]],
+                               "loesungen": loesungen}
+        else:
+            ergebnis[quest] = {"operanden": schluessel, "loesungen": loesungen[:, 0]}
+    return ergebnis
+
+
+def fingerabdruck(ergebnis):
+    """sha256 über alle Arrays - zum Vergleichen zweier Läufe."""
+    pruefsumme = hashlib.sha256()
+    for quest in sorted(ergebnis):
+        for name in sorted(ergebnis[quest]):
+            wert = ergebnis[quest][name]
+            pruefsumme.update(f"{quest}/{name}/{wert.shape}".encode())
+            pruefsumme.update(np.ascontiguousarray(wert).tobytes())
+    return pruefsumme.hexdigest()
+
+
+def speichere(ergebnis, pfad):
+    """Speichert alles in einer .npz-Datei, Namen wie "klammer2/operanden"."""
+    np.savez_compressed(pfad, **{f"{quest}/{name}": wert
+                                 for quest, teile in ergebnis.items() for name, wert in teile.items()})
+
+
+def main(argumente=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Viele Aufgaben reproduzierbar auf allen Kernen erzeugen")
+    parser.add_argument("anzahl", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mana", type=int, default=10)
+    parser.add_argument("--prozesse", type=int, default=None, help="Standard: alle Kerne")
+    parser.add_argument("--ausgabe", help=".npz-Datei")
+    parser.add_argument("--pruefe", action="store_true", help="mit 1 Prozess vergleichen")
+    args = parser.parse_args(argumente)
+
+    start = time.perf_counter()
+    ergebnis = erzeuge(args.anzahl, args.seed, args.mana, prozesse=args.prozesse)
+    dauer = time.perf_counter() - start
+    gesamt = sum(len(teile["operanden"]) for teile in ergebnis.values())
+    print(f"✅ {gesamt:,} verschiedene Aufgaben in {dauer:.2f} s ({args.prozesse or os.cpu_count()} Prozesse)")
+    for quest, teile in ergebnis.items():
+        print(f"   {quest:<9} {len(teile['operanden']):>9,}")
+    print(f"🔑 {fingerabdruck(ergebnis)}")
+
+    if args.pruefe:
+        start = time.perf_counter()
+        einzeln = erzeuge(args.anzahl, args.seed, args.mana, prozesse=1)
+        dauer = time.perf_counter() - start
+        gleich = fingerabdruck(einzeln) == fingerabdruck(ergebnis)
+        print(f"{'✅' if gleich else '❌'} 1 Prozess: {dauer:.2f} s - {'identisch' if gleich else 'VERSCHIEDEN'}")
+    if args.ausgabe:
+        speichere(ergebnis, args.ausgabe)
+        print(f"💾 {args.ausgabe}")
+
+
+if __name__ == "__main__":
+    main()
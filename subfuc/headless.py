@@ -0,0 +1,252 @@
+########################################
+# HEADLESS: Spiele ohne Tastatur und ohne Pausen
+########################################
+# Lässt die Spiele automatisch laufen - für Bewerter, Tests und Lasttests.
+# - Antworten kommen aus einer Liste/einem Iterator, einer Datei,
+#   einem Socket oder vom eingebauten "rechner" (antwortet immer richtig)
+# - tempo=0 schaltet alle time.sleep()-Pausen ab
+# - jede Aufgabe kommt als Datensatz (dict) zurück: quest, aufgabe,
+#   erwartet/loesung, antwort, richtig/bewertung, mana, ...
+#
+# Beispiele:
+#   python headless.py klammerrechnung --sitzungen 10000 --runden 3 --mana 5
+#   python headless.py minus_vor_der_klammer --antworten antworten.txt --jsonl
+#   python headless.py luh1a1 --antworten localhost:9000
+#
+#   from headless import spiele, aus_iterator
+#   ergebnisse = spiele("klammerrechnung", aus_iterator(["4", "-2", "9"]), runden=1, mana=3)
+########################################
+
+import ast
+import contextlib
+import json
+import operator
+import os
+import random
+import re
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sitzung import Sitzung
+
+
+class KeineAntwortMehr(Exception):
+    """Die Antwort-Quelle ist leer, das Spiel wollte aber noch etwas wissen."""
+
+
+########################################
+# ANTWORT-QUELLEN
+########################################
+# Eine Quelle ist eine Funktion(frage_text) -> antwort_text.
+
+def aus_iterator(antworten):
+    """Antworten der Reihe nach aus einer Liste / einem Iterator."""
+    antworten = iter(antworten)
+
+    def eingabe(frage=""):
+        try:
+            return str(next(antworten))
+        except StopIteration:
+            raise KeineAntwortMehr(frage) from None
+    return eingabe
+
+
+def aus_datei(pfad):
+    """Eine Antwort pro Zeile aus einer Textdatei (wird nur Zeile für Zeile gelesen)."""
+    def zeilen():
+        with open(pfad, "r", encoding="utf-8") as file:
+            for zeile in file:
+                yield zeile.rstrip("\r\n")
+    return aus_iterator(zeilen())
+
+
+def aus_socket(verbindung):
+    """
+    Fragt über einen Socket: schickt den Frage-Text als eine Zeile
+    und liest eine Zeile als Antwort zurück.
+
+    Parameter:
+    - verbindung: offener Socket oder "host:port"
+    """
+    if isinstance(verbindung, str):
+        host, port = verbindung.rsplit(":", 1)
+        verbindung = socket.create_connection((host, int(port)))
+    datei = verbindung.makefile("rw", encoding="utf-8", newline="\n")
+
+    def eingabe(frage=""):
+        datei.write(frage.replace("\n", " ") + "\n")
+        datei.flush()
+        zeile = datei.readline()
+        if not zeile:
+            raise KeineAntwortMehr(frage)
+        return zeile.rstrip("\r\n")
+    return eingabe
+
+
+_RECHEN_ZEICHEN = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul}
+_AUFGABE = re.compile(r"Was ist (.+) \?")
+
+
+def _rechne(knoten):
+    """Wertet nur Zahlen, +, -, * und Vorzeichen aus (kein eval)."""
+    if isinstance(knoten, ast.Constant) and isinstance(knoten.value, int):
+        return knoten.value
+    if isinstance(knoten, ast.UnaryOp) and isinstance(knoten.op, (ast.USub, ast.UAdd)):
+        wert = _rechne(knoten.operand)
+        return -wert if isinstance(knoten.op, ast.USub) else wert
+    if isinstance(knoten, ast.BinOp) and type(knoten.op) in _RECHEN_ZEICHEN:
+        return _RECHEN_ZEICHEN[type(knoten.op)](_rechne(knoten.left), _rechne(knoten.right))
+    raise ValueError(f"Kann ich nicht rechnen: {ast.dump(knoten)}")
+
+
+def rechner(bewertung="3", fehlerquote=0.0, zufall=None):
+    """
+    Automatischer Spieler: rechnet "Was ist ... ?" selbst aus. Beim Klammer-Spiel 1x1
+    ("Ihre Lösung:") schreibt er die erwartete Lösung des Spiels hin - dafür setzt
+    spiele() eingabe.spiel.
+
+    Parameter:
+    - bewertung: Antwort auf "Bewertung (1-5)" im Klammer-Spiel 1x1
+    - fehlerquote: Anteil absichtlich falscher Antworten (0.0 - 1.0)
+    - zufall: random.Random für die Fehler (None = eigener)
+    """
+    zufall = zufall or random.Random()
+
+    def eingabe(frage=""):
+        treffer = _AUFGABE.search(frage)
+        if treffer:
+            wert = _rechne(ast.parse(treffer.group(1), mode="eval").body)
+            if fehlerquote and zufall.random() < fehlerquote:
+                wert += 1
+            return str(wert)
+        if "Ihre Lösung" in frage and eingabe.spiel is not None:
+            from polynom import als_text
+            text = als_text(eingabe.spiel.erwartet)
+            if fehlerquote and zufall.random() < fehlerquote:
+                text += " + 1"
+            return text
+        if "Bewertung" in frage:
+            return bewertung
+        return ""  # "Enter drücken" & Co.
+    eingabe.spiel = None
+    return eingabe
+
+
+########################################
+# SPIELE STARTEN
+########################################
+
+def headless_sitzung(eingabe, tempo=0.0, seed=None, ausgabe=None):
+    """
+    Sitzung ohne Tastatur: Antworten aus `eingabe`, Ausgaben werden verworfen
+    (oder an `ausgabe` gegeben), Pausen mit `tempo` skaliert.
+    """
+    return Sitzung(
+        eingabe=eingabe,
+        ausgabe=ausgabe or (lambda *teile: None),
+        tempo=tempo,
+        zufall=random.Random(seed),
+    )
+
+
+def spiele(spiel, eingabe, runden=1, mana=5, tempo=0.0, seed=None, ausgabe=None):
+    """
+    Spielt eine Sitzung eines Spiels ohne Tastatur.
+
+    Parameter:
+    - spiel: "klammerrechnung", "minus_vor_der_klammer" oder "luh1a1"
+    - eingabe: Antwort-Quelle (siehe oben)
+    - runden / mana: wie im Spiel (werden nicht mehr gefragt)
+    - tempo: Faktor für Pausen (0 = keine)
+    - seed: für wiederholbare Aufgaben
+
+    Rückgabe:
+    - Liste der Ergebnis-Datensätze
+    """
+    sitzung = headless_sitzung(eingabe, tempo, seed, ausgabe)
+    if spiel == "klammerrechnung":
+        import klammerrechnung
+        return klammerrechnung.run(runden=runden, mana=mana, sitzung=sitzung)
+    if spiel == "minus_vor_der_klammer":
+        import minus_vor_der_klammer
+        return minus_vor_der_klammer.run(mana=mana, anzahl_runden=runden, sitzung=sitzung)
+    if spiel == "luh1a1":
+        luh_ordner = os.path.join(os.path.dirname(os.path.abspath(__file__)), "luh")
+        if luh_ordner not in sys.path:
+            sys.path.insert(0, luh_ordner)
+        import luh1a1
+        spiel = luh1a1.KlammerSpiel1x1(sitzung)
+        if hasattr(eingabe, "spiel"):
+            eingabe.spiel = spiel  # rechner liest die erwartete Lösung
+        return spiel.spiel_starten(mana=mana, runden=runden)
+    raise ValueError(f"Unbekanntes Spiel: {spiel}")
+
+
+def simuliere(spiel, sitzungen, eingabe_fabrik=rechner, seed=0, **parameter):
+    """
+    Spielt viele Sitzungen hintereinander.
+
+    Parameter:
+    - sitzungen: Anzahl Sitzungen
+    - eingabe_fabrik: Funktion() -> neue Antwort-Quelle pro Sitzung
+    - seed: Start-Seed; Sitzung i bekommt seed + i
+    - parameter: runden, mana, tempo (wie bei spiele())
+
+    Liefert:
+    - Datensätze, jeweils mit "sitzung" = Nummer der Sitzung
+    """
+    for nummer in range(sitzungen):
+        for datensatz in spiele(spiel, eingabe_fabrik(), seed=seed + nummer, **parameter):
+            datensatz["sitzung"] = nummer
+            yield datensatz
+
+
+def main(argumente=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Spiele ohne Tastatur laufen lassen")
+    parser.add_argument("spiel", choices=["klammerrechnung", "minus_vor_der_klammer", "luh1a1"])
+    parser.add_argument("--sitzungen", type=int, default=1)
+    parser.add_argument("--runden", type=int, default=1)
+    parser.add_argument("--mana", type=int, default=5)
+    parser.add_argument("--tempo", type=float, default=0.0, help="Faktor für Pausen (1 = wie im Spiel)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--antworten", default="rechner",
+                        help='"rechner", eine Datei (eine Antwort pro Zeile) oder host:port')
+    parser.add_argument("--jsonl", action="store_true", help="jeden Datensatz als JSON-Zeile ausgeben")
+    args = parser.parse_args(argumente)
+
+    if args.antworten == "rechner":
+        fabrik = rechner
+    elif os.path.exists(args.antworten):
+        quelle = aus_datei(args.antworten)  # eine Datei für alle Sitzungen nacheinander
+        fabrik = lambda: quelle
+    else:
+        quelle = aus_socket(args.antworten)
+        fabrik = lambda: quelle
+
+    # Bei --jsonl gehört stdout nur den Datensätzen: alles andere (z.B. log.run()
+    # beim Import der Spiele) landet auf stderr
+    jsonl_ziel = sys.stdout
+    umleitung = contextlib.redirect_stdout(sys.stderr) if args.jsonl else contextlib.nullcontext()
+
+    start = time.perf_counter()
+    anzahl = richtig = 0
+    with umleitung:
+        for datensatz in simuliere(args.spiel, args.sitzungen, fabrik, seed=args.seed,
+                                   runden=args.runden, mana=args.mana, tempo=args.tempo):
+            anzahl += 1
+            richtig += bool(datensatz.get("richtig", False))
+            if args.jsonl:
+                print(json.dumps(datensatz, ensure_ascii=False), file=jsonl_ziel)
+    dauer = time.perf_counter() - start
+
+    print(f"✅ {args.sitzungen} Sitzungen, {anzahl} Aufgaben in {dauer:.2f} s "
+          f"({args.sitzungen / dauer:,.0f} Sitzungen/s), richtig: {richtig}/{anzahl}",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,11 @@ import os
 # Füge das übergeordnete Verzeichnis zum Python-Pfad hinzu
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import log
-log.run()
+try:
+    import log
+    log.run()
+except ImportError:
+    pass  # ohne log.py läuft das Spiel einfach ohne Protokoll
 
 ########################################
 # ende log 
@@ -16,19 +19,29 @@ log.run()
 
 
 
-import time
-import random
+from sitzung import Sitzung
 
-def run():
-    runden = int(input("Spiel 1: (runden)goal: "))
-    mana = int(input("Gib dein Mana ein (Zahl): "))
+def run(runden=None, mana=None, sitzung=None):
+    """
+    Startet das Spiel. Ohne Parameter wie immer: alles wird per input() gefragt.
+    Mit `sitzung` (siehe headless.py) läuft es auch ohne Tastatur.
+
+    Rückgabe:
+    - Liste der Ergebnis-Datensätze (eine pro Aufgabe)
+    """
+    sitzung = sitzung or Sitzung()
+    if runden is None:
+        runden = int(sitzung.frage("Spiel 1: (runden)goal: "))
+    if mana is None:
+        mana = int(sitzung.frage("Gib dein Mana ein (Zahl): "))
     for _ in range(runden): 
-        quest1(mana)
-        quest2(mana)
-        quest3(mana)
-        print(f"main loop - Runde {_ + 1} abgeschlossen!")
-        print("_______________________________")
-        time.sleep(3)
+        quest1(mana, sitzung)
+        quest2(mana, sitzung)
+        quest3(mana, sitzung)
+        sitzung.zeige(f"main loop - Runde {_ + 1} abgeschlossen!")
+        sitzung.zeige("_______________________________")
+        sitzung.warte(3)
+    return sitzung.ergebnisse
 
 
 #############################################
@@ -43,19 +56,23 @@ def run():
 ##############################################
 
 
-def quest1(mana):
-    print("s1.1 - Klammer 1 - (a+b)*e")
-    import time
-    time.sleep(4)
-    a = random.randint(-mana, mana)
-    b = random.randint(-mana, mana)
-    e = random.randint(-mana, mana)
+def quest1(mana, sitzung=None):
+    sitzung = sitzung or Sitzung()
+    sitzung.zeige("s1.1 - Klammer 1 - (a+b)*e")
+    sitzung.warte(4)
+    a = sitzung.zufall.randint(-mana, mana)
+    b = sitzung.zufall.randint(-mana, mana)
+    e = sitzung.zufall.randint(-mana, mana)
     x = (a + b) * e
 
-    if input(f"Was ist ({a} + {b}) * {e} ? ") == str(x):
-        print("s1.1 - Richtig")
+    aufgabe = f"({a} + {b}) * {e}"
+    antwort = sitzung.frage(f"Was ist {aufgabe} ? ")
+    if antwort == str(x):
+        sitzung.zeige("s1.1 - Richtig")
     else:
-        print("s1.1 - Falsch, die richtige Antwort ist:", x)
+        sitzung.zeige("s1.1 - Falsch, die richtige Antwort ist:", x)
+    return sitzung.ergebnis(quest="s1.1", aufgabe=aufgabe, erwartet=x,
+                            antwort=antwort, richtig=antwort == str(x), mana=mana)
 
 #############################################
 # Ende Klammerrechnung Quest 1
@@ -63,19 +80,24 @@ def quest1(mana):
 
 
 # quest  2 - klammerrechnung 2
-def quest2(mana):
-    print("s1.2 - Klammer 2 - (a+b)*(e+f)")
-    a = random.randint(-mana, mana)
+def quest2(mana, sitzung=None):
+    sitzung = sitzung or Sitzung()
+    sitzung.zeige("s1.2 - Klammer 2 - (a+b)*(e+f)")
+    a = sitzung.zufall.randint(-mana, mana)
      #mit der einfach gerechnet werden kann
-    b = random.randint(-mana, mana)
-    e = random.randint(-mana, mana)
-    f = random.randint(-mana, mana)
+    b = sitzung.zufall.randint(-mana, mana)
+    e = sitzung.zufall.randint(-mana, mana)
+    f = sitzung.zufall.randint(-mana, mana)
     x = (a + b) * (e + f)
 
-    if input(f"Was ist ({a} + {b}) * ({e} + {f}) ? ") == str(x):
-        print("s1.2 - Richtig")
+    aufgabe = f"({a} + {b}) * ({e} + {f})"
+    antwort = sitzung.frage(f"Was ist {aufgabe} ? ")
+    if antwort == str(x):
+        sitzung.zeige("s1.2 - Richtig")
     else:
-        print("s1.2 - Falsch, die richtige Antwort ist:", x)
+        sitzung.zeige("s1.2 - Falsch, die richtige Antwort ist:", x)
+    return sitzung.ergebnis(quest="s1.2", aufgabe=aufgabe, erwartet=x,
+                            antwort=antwort, richtig=antwort == str(x), mana=mana)
 #############################################
 # Ende Klammerrechnung Quest 2
 
@@ -87,16 +109,21 @@ def quest2(mana):
 
 #############################################
 # quest  3 - klammerrechnung mit einer variablen a
-def quest3(mana):
-    print("s1.3 - Klammer 3 - (a+b)*a")
-    a = random.randint(-mana, mana)
-    b = random.randint(-mana, mana)
+def quest3(mana, sitzung=None):
+    sitzung = sitzung or Sitzung()
+    sitzung.zeige("s1.3 - Klammer 3 - (a+b)*a")
+    a = sitzung.zufall.randint(-mana, mana)
+    b = sitzung.zufall.randint(-mana, mana)
     x = (a + b) * a
 
-    if input(f"Was ist ({a} + {b}) * {a} ? ") == str(x):
-        print("s1.3 - Richtig")
+    aufgabe = f"({a} + {b}) * {a}"
+    antwort = sitzung.frage(f"Was ist {aufgabe} ? ")
+    if antwort == str(x):
+        sitzung.zeige("s1.3 - Richtig")
     else:
-        print("s1.3 - Falsch, die richtige Antwort ist:", x)
+        sitzung.zeige("s1.3 - Falsch, die richtige Antwort ist:", x)
+    return sitzung.ergebnis(quest="s1.3", aufgabe=aufgabe, erwartet=x,
+                            antwort=antwort, richtig=antwort == str(x), mana=mana)
 
 
 
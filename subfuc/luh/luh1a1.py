@@ -1,5 +1,8 @@
-import log
-log.run()
+try:
+    import log
+    log.run()
+except ImportError:
+    pass  # ohne log.py läuft das Spiel einfach ohne Protokoll (siehe auch unten)
 
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
@@ -8,10 +11,13 @@ log.run()
 Generiert Klammeraufgaben mit zufälligen Zahlen basierend auf Mana-Level
 """
 
-import random
 import sys
 import os
 
+# sitzung.py liegt einen Ordner höher (subfuc/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sitzung import Sitzung
+from polynom import kanonisch_aus_termen, pruefe
 
 
 def run():
@@ -27,53 +33,60 @@ def run():
 try:
     from log import log
 except ImportError:
-    # Falls log.py nicht gefunden wird
+    # Falls log.py nicht gefunden wird: nach stderr - stdout gehört der Sitzung
+    # (z.B. headless.py --jsonl)
     def log(nachricht):
-        print(f"[LOG] {nachricht}")
+        print(f"[LOG] {nachricht}", file=sys.stderr)
 
 class KlammerSpiel1x1:
-    def __init__(self):
+    def __init__(self, sitzung=None):
+        """
+        Parameter:
+        - sitzung: Ein-/Ausgabe, Pausen und Zufall (Standard: Tastatur + Bildschirm,
+          für automatische Läufe siehe headless.py)
+        """
+        self.sitzung = sitzung or Sitzung()
         self.mana = 0
         self.max_mana = 10
         self.min_mana = -10
         self.runde = 1
         self.punkte = 0
+        self.richtig = 0
+        self.erwartet = None  # feste Form der letzten Lösung (siehe polynom.py)
         
     def frage_nach_mana(self):
         """Fragt den Benutzer nach dem gewünschten Mana-Level"""
-        print("\n🎯 MANA-EINSTELLUNG")
-        print("="*30)
-        print("💡 Das Mana bestimmt die Zahlenrange:")
-        print("   Mana = 3  → Zahlen von -3 bis +3")
-        print("   Mana = 5  → Zahlen von -5 bis +5")
-        print("   Mana = 10 → Zahlen von -10 bis +10")
+        self.sitzung.zeige("\n🎯 MANA-EINSTELLUNG")
+        self.sitzung.zeige("="*30)
+        self.sitzung.zeige("💡 Das Mana bestimmt die Zahlenrange:")
+        self.sitzung.zeige("   Mana = 3  → Zahlen von -3 bis +3")
+        self.sitzung.zeige("   Mana = 5  → Zahlen von -5 bis +5")
+        self.sitzung.zeige("   Mana = 10 → Zahlen von -10 bis +10")
         
         while True:
             try:
-                mana_input = input("\n➤ Gewünschtes Mana-Level (1-20): ").strip()
+                mana_input = self.sitzung.frage("\n➤ Gewünschtes Mana-Level (1-20): ").strip()
                 mana = int(mana_input)
                 
                 if 1 <= mana <= 20:
-                    self.mana = mana
-                    self.max_mana = mana
-                    self.min_mana = -mana
-                    print(f"✅ Mana auf {mana} gesetzt!")
-                    print(f"📊 Zahlenrange: {self.min_mana} bis {self.max_mana}")
+                    self.setze_mana(mana)
+                    self.sitzung.zeige(f"✅ Mana auf {mana} gesetzt!")
+                    self.sitzung.zeige(f"📊 Zahlenrange: {self.min_mana} bis {self.max_mana}")
                     break
                 else:
-                    print("⚠️  Bitte eine Zahl zwischen 1 und 20 eingeben!")
+                    self.sitzung.zeige("⚠️  Bitte eine Zahl zwischen 1 und 20 eingeben!")
                     
             except ValueError:
-                print("❌ Bitte eine gültige Zahl eingeben!")
+                self.sitzung.zeige("❌ Bitte eine gültige Zahl eingeben!")
         
     def zeige_status(self):
         """Zeigt aktuellen Spielstatus an"""
-        print("\n" + "="*50)
-        print(f"🎮 KLAMMER-SPIEL 1x1 - RUNDE {self.runde}")
-        print("="*50)
-        print(f"⚡ Mana: {self.mana:+d} (Range: {self.min_mana} bis {self.max_mana})")
-        print(f"🏆 Punkte: {self.punkte}")
-        print(f"📊 Zahlen-Größe: {self.berechne_zahlen_groesse()}")
+        self.sitzung.zeige("\n" + "="*50)
+        self.sitzung.zeige(f"🎮 KLAMMER-SPIEL 1x1 - RUNDE {self.runde}")
+        self.sitzung.zeige("="*50)
+        self.sitzung.zeige(f"⚡ Mana: {self.mana:+d} (Range: {self.min_mana} bis {self.max_mana})")
+        self.sitzung.zeige(f"🏆 Punkte: {self.punkte}")
+        self.sitzung.zeige(f"📊 Zahlen-Größe: {self.berechne_zahlen_groesse()}")
         
     def berechne_zahlen_groesse(self):
         """Berechnet die Größe der Zahlen basierend auf Mana"""
@@ -83,13 +96,12 @@ class KlammerSpiel1x1:
     def generiere_zahl(self):
         """Generiert eine Zahl im Bereich von -mana bis +mana (aber nicht 0)"""
         abs_mana = abs(self.mana)
-        
-        # Zahl zwischen -mana und +mana generieren, aber 0 ausschließen
-        while True:
-            zahl = random.randint(-abs_mana, abs_mana)
-            if zahl != 0:  # 0 ausschließen für bessere Aufgaben
-                return zahl
-    
+
+        # 0 ausschließen für bessere Aufgaben - ohne Wiederholen:
+        # 1..mana -> -mana..-1, mana+1..2*mana -> 1..mana
+        zahl = self.sitzung.zufall.randint(1, 2 * abs_mana)
+        return zahl - abs_mana - 1 if zahl <= abs_mana else zahl - abs_mana
+
 
     
     def generiere_aufgabe_typ_a(self):
@@ -97,24 +109,27 @@ class KlammerSpiel1x1:
         a = self.generiere_zahl()
         b = self.generiere_zahl()
         c = self.generiere_zahl()
-        x_wert = random.choice(['x', 'y', 'z', 'a', 'b'])
+        x_wert = self.sitzung.zufall.choice(['x', 'y', 'z', 'a', 'b'])
         
         aufgabe = f"{a}({b} - {c}{x_wert})"
         loesung = f"{a * b} - {a * c}{x_wert}"
+        self.erwartet = kanonisch_aus_termen([(a * b, ""), (-a * c, x_wert)])
         
         return aufgabe, loesung
     
     def generiere_aufgabe_typ_b(self):
         """Generiert Aufgabe vom Typ: (ab - c)(d - ef)"""
         a = self.generiere_zahl()
-        b_var = random.choice(['x', 'y', 'z', 'a', 'b'])
+        b_var = self.sitzung.zufall.choice(['x', 'y', 'z', 'a', 'b'])
         c = self.generiere_zahl()
         d = self.generiere_zahl()
         e = self.generiere_zahl()
-        f_var = random.choice(['x', 'y', 'z', 'a', 'b'])
+        f_var = self.sitzung.zufall.choice(['x', 'y', 'z', 'a', 'b'])
         
         aufgabe = f"({a}{b_var} - {c})({d} - {e}{f_var})"
         loesung = f"{a * d}{b_var} - {a * e}{b_var}{f_var} - {c * d} + {c * e}{f_var}"
+        self.erwartet = kanonisch_aus_termen([(a * d, b_var), (-a * e, b_var + f_var),
+                                              (-c * d, ""), (c * e, f_var)])
         
         return aufgabe, loesung
     
@@ -124,7 +139,7 @@ class KlammerSpiel1x1:
         b = self.generiere_zahl()
         c = self.generiere_zahl()
         d = self.generiere_zahl()
-        x_var = random.choice(['x', 'y', 'z'])
+        x_var = self.sitzung.zufall.choice(['x', 'y', 'z'])
         
         aufgabe = f"({a}{x_var} - {b})({c}{x_var} + {d})"
         # Ausmultipliziert: ac*x² + ad*x - bc*x - bd
@@ -133,6 +148,7 @@ class KlammerSpiel1x1:
         konstante = -b * d
         
         loesung = f"{koeff_x2}{x_var}² + {koeff_x:+d}{x_var} + {konstante:+d}"
+        self.erwartet = kanonisch_aus_termen([(koeff_x2, x_var * 2), (koeff_x, x_var), (konstante, "")])
         
         return aufgabe, loesung
     
@@ -142,7 +158,7 @@ class KlammerSpiel1x1:
         b = self.generiere_zahl()
         c = self.generiere_zahl()
         d = self.generiere_zahl()
-        x_var = random.choice(['x', 'y', 'z'])
+        x_var = self.sitzung.zufall.choice(['x', 'y', 'z'])
         
         aufgabe = f"({a} - {b}{x_var})({c} + {d}{x_var})"
         # Ausmultipliziert: ac + ad*x - bc*x - bd*x²
@@ -151,6 +167,7 @@ class KlammerSpiel1x1:
         konstante = a * c
         
         loesung = f"{konstante} + {koeff_x:+d}{x_var} + {koeff_x2:+d}{x_var}²"
+        self.erwartet = kanonisch_aus_termen([(konstante, ""), (koeff_x, x_var), (koeff_x2, x_var * 2)])
         
         return aufgabe, loesung
     
@@ -166,74 +183,111 @@ class KlammerSpiel1x1:
             ('d', self.generiere_aufgabe_typ_d)
         ]
         
-        typ_name, generator_func = random.choice(aufgaben_typen)
+        typ_name, generator_func = self.sitzung.zufall.choice(aufgaben_typen)
         aufgabe, loesung = generator_func()
         
-        print(f"\n🧮 AUFGABE (Typ {typ_name}):")
-        print(f"Lösen Sie die Klammern auf: {aufgabe}")
-        print("\n💡 Drücken Sie Enter um die Lösung zu sehen...")
-        input()
+        self.sitzung.zeige(f"\n🧮 AUFGABE (Typ {typ_name}):")
+        self.sitzung.zeige(f"Lösen Sie die Klammern auf: {aufgabe}")
+        self.sitzung.zeige("\n💡 Schreiben Sie Ihre Lösung (z.B. 6x² - 5x - 4)")
+        self.sitzung.zeige("   oder drücken Sie nur Enter um die Lösung zu sehen...")
+        antwort = self.sitzung.frage("Ihre Lösung: ").strip()
         
-        print(f"✅ LÖSUNG: {loesung}")
+        richtig = None  # nur angesehen
+        if antwort:
+            richtig = pruefe(antwort, self.erwartet)
+            if richtig:
+                self.richtig += 1
+                self.sitzung.zeige("🎉 Richtig ausmultipliziert!")
+            else:
+                self.sitzung.zeige("❌ Leider nicht richtig.")
+        self.sitzung.zeige(f"✅ LÖSUNG: {loesung}")
         
         # Bewertung durch Spieler
-        print("\nWie schwer war diese Aufgabe?")
-        print("1 = Sehr einfach  2 = Einfach  3 = Normal  4 = Schwer  5 = Sehr schwer")
+        self.sitzung.zeige("\nWie schwer war diese Aufgabe?")
+        self.sitzung.zeige("1 = Sehr einfach  2 = Einfach  3 = Normal  4 = Schwer  5 = Sehr schwer")
         
         while True:
             try:
-                bewertung = int(input("Bewertung (1-5): "))
+                bewertung = int(self.sitzung.frage("Bewertung (1-5): "))
                 if 1 <= bewertung <= 5:
                     break
                 else:
-                    print("Bitte eine Zahl zwischen 1 und 5 eingeben!")
+                    self.sitzung.zeige("Bitte eine Zahl zwischen 1 und 5 eingeben!")
             except ValueError:
-                print("Bitte eine gültige Zahl eingeben!")
+                self.sitzung.zeige("Bitte eine gültige Zahl eingeben!")
         
         # Punkte basierend auf Bewertung und Mana
         if bewertung <= 2:
-            self.punkte += 10
+            gewonnen = 10
         elif bewertung == 3:
-            self.punkte += 20
+            gewonnen = 20
         else:
-            self.punkte += 30
+            gewonnen = 30
+        self.punkte += gewonnen
             
-        print(f"🏆 +{30 if bewertung > 3 else (20 if bewertung == 3 else 10)} Punkte!")
+        self.sitzung.zeige(f"🏆 +{gewonnen} Punkte!")
+        self.sitzung.ergebnis(quest=f"luh1a1-{typ_name}", aufgabe=aufgabe, loesung=loesung,
+                              antwort=antwort, richtig=richtig,
+                              bewertung=bewertung, punkte=gewonnen, mana=self.mana)
         
         self.runde += 1
         log(f"Runde {self.runde-1} abgeschlossen - Mana: {self.mana}, Punkte: {self.punkte}")
     
-    def spiel_starten(self):
-        """Startet das Klammerspiel"""
-        print("🎮 WILLKOMMEN ZUM KLAMMER-SPIEL 1x1!")
-        print("="*50)
-        print("📚 Regel: Lösen Sie Klammerausdrücke auf")
-        print("⚡ Mana bestimmt die Zahlenrange der Aufgaben") 
-        print("� Sie wählen Ihr Mana-Level selbst!")
+    def setze_mana(self, mana):
+        """Setzt das Mana-Level direkt (ohne Nachfrage)"""
+        self.mana = mana
+        self.max_mana = mana
+        self.min_mana = -mana
+
+    def spiel_starten(self, mana=None, runden=None):
+        """
+        Startet das Klammerspiel.
+
+        Parameter:
+        - mana: Mana-Level (None = wird gefragt)
+        - runden: Genau so viele Runden spielen (None = nach jeder Runde fragen)
+
+        Rückgabe:
+        - Liste der Ergebnis-Datensätze (eine pro Runde)
+        """
+        self.sitzung.zeige("🎮 WILLKOMMEN ZUM KLAMMER-SPIEL 1x1!")
+        self.sitzung.zeige("="*50)
+        self.sitzung.zeige("📚 Regel: Lösen Sie Klammerausdrücke auf")
+        self.sitzung.zeige("⚡ Mana bestimmt die Zahlenrange der Aufgaben") 
+        self.sitzung.zeige("� Sie wählen Ihr Mana-Level selbst!")
         
         # Mana vom Benutzer abfragen
-        self.frage_nach_mana()
+        if mana is None:
+            self.frage_nach_mana()
+        else:
+            self.setze_mana(mana)
         
         while True:
             try:
                 self.spiele_runde()
                 
-                print(f"\n🎯 ZWISCHENSTAND:")
-                print(f"Runden gespielt: {self.runde-1}")
-                print(f"Gesamtpunkte: {self.punkte}")
+                self.sitzung.zeige(f"\n🎯 ZWISCHENSTAND:")
+                self.sitzung.zeige(f"Runden gespielt: {self.runde-1}")
+                self.sitzung.zeige(f"Gesamtpunkte: {self.punkte}")
                 
-                weiter = input("\nNoch eine Runde? (j/n): ").lower().strip()
+                if runden is not None:
+                    if self.runde > runden:
+                        break
+                    continue
+                weiter = self.sitzung.frage("\nNoch eine Runde? (j/n): ").lower().strip()
                 if weiter not in ['j', 'ja', 'y', 'yes', '']:
                     break
                     
             except KeyboardInterrupt:
-                print("\n\n👋 Spiel beendet!")
+                self.sitzung.zeige("\n\n👋 Spiel beendet!")
                 break
         
-        print(f"\n🏁 ENDSTAND:")
-        print(f"Runden gespielt: {self.runde-1}")
-        print(f"Gesamtpunkte: {self.punkte}")
-        print("Danke fürs Spielen! 🎮")
+        self.sitzung.zeige(f"\n🏁 ENDSTAND:")
+        self.sitzung.zeige(f"Runden gespielt: {self.runde-1}")
+        self.sitzung.zeige(f"Gesamtpunkte: {self.punkte}")
+        self.sitzung.zeige(f"Richtig gelöst: {self.richtig}")
+        self.sitzung.zeige("Danke fürs Spielen! 🎮")
+        return self.sitzung.ergebnisse
 
 def main():
     """Hauptfunktion"""
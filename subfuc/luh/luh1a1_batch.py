@@ -0,0 +1,228 @@
+########################################
+# KLAMMER-SPIEL 1x1 - AUFGABEN IN GROSSEN MENGEN (NumPy)
+########################################
+# Erzeugt Aufgaben der Typen a-d aus luh1a1.py stapelweise:
+# - Zahlen ungleich 0 werden direkt gezogen (keine Wiederhol-Schleife):
+#   aus k in [0, 2*mana) wird k - mana, für k >= mana noch +1
+# - die Koeffizienten der Lösung werden für den ganzen Stapel auf einmal
+#   gerechnet (Spalten-Arrays)
+# - die Texte entstehen aus vorberechneten Zahl-Tabellen ("-3", "+12", ...)
+#   statt aus einem f-String pro Aufgabe
+#
+# Die Texte sind Zeichen für Zeichen dieselben wie bei
+# KlammerSpiel1x1.generiere_aufgabe_typ_a/b/c/d.
+#
+# Beispiel:
+#   stapel = erzeuge_stapel("c", 100_000, mana=7)
+#   stapel["aufgaben"][0], stapel["loesungen"][0], stapel["koeffizienten"][0]
+#
+# Benchmark:  python luh1a1_batch.py
+########################################
+
+from functools import lru_cache
+
+import numpy as np
+
+VARIABLEN = np.array(["x", "y", "z", "a", "b"])  # Typ a und b
+VARIABLEN_XYZ = VARIABLEN[:3]                    # Typ c und d
+
+# Pro Typ: Anzahl Operanden, Anzahl Variablen und welche Variablen erlaubt sind
+TYPEN = {
+    "a": {"muster": "a(b - cx)", "operanden": 3, "variablen": 1, "auswahl": VARIABLEN},
+    "b": {"muster": "(ab - c)(d - ef)", "operanden": 4, "variablen": 2, "auswahl": VARIABLEN},
+    "c": {"muster": "(ax - b)(cx + d)", "operanden": 4, "variablen": 1, "auswahl": VARIABLEN_XYZ},
+    "d": {"muster": "(a - bx)(c + dx)", "operanden": 4, "variablen": 1, "auswahl": VARIABLEN_XYZ},
+}
+
+# Terme der Lösung, passend zu den Spalten von koeffizienten():
+# (Vorzeichen im Text, welche Variablen-Spalten zum Term gehören)
+TERME = {
+    "a": [(1, ()), (-1, (0,))],                          # ab - acx
+    "b": [(1, (0,)), (-1, (0, 1)), (-1, ()), (1, (1,))],  # adb - aebf - cd + cef
+    "c": [(1, (0, 0)), (1, (0,)), (1, ())],              # acx² + ... x + ...
+    "d": [(1, ()), (1, (0,)), (1, (0, 0))],              # ac + ... x + ... x²
+}
+
+
+def ziehe_ohne_null(rng, mana, form):
+    """
+    Zieht gleichverteilt aus [-mana, -1] ∪ [1, mana] - ohne Verwerfen.
+
+    Parameter:
+    - rng: numpy.random.Generator
+    - mana: Zahlenbereich (wie in luh1a1, Vorzeichen egal)
+    - form: Form des Ergebnis-Arrays
+    """
+    mana = abs(mana)
+    k = rng.integers(0, 2 * mana, size=form)
+    return k - mana + (k >= mana)
+
+
+def koeffizienten(typ, operanden):
+    """
+    Koeffizienten der Lösung in der Reihenfolge, in der sie im Lösungs-Text stehen.
+
+    - a: a(b - cx)          -> [ab, ac]              "ab - acx"
+    - b: (ab - c)(d - ef)   -> [ad, ae, cd, ce]      "adb - aebf - cd + cef"
+    - c: (ax - b)(cx + d)   -> [ac, ad-bc, -bd]      "acx² + (ad-bc)x + (-bd)"
+    - d: (a - bx)(c + dx)   -> [ac, ad-bc, -bd]      "ac + (ad-bc)x + (-bd)x²"
+    """
+    spalten = operanden.T
+    if typ == "a":
+        a, b, c = spalten
+        return np.stack([a * b, a * c], axis=1)
+    a, b, c, d = spalten
+    if typ == "b":
+        # hier heißen die Zahlen a, c, d, e (b und f sind Variablen)
+        a, c, d, e = spalten
+        return np.stack([a * d, a * e, c * d, c * e], axis=1)
+    if typ == "c":
+        return np.stack([a * c, a * d - b * c, -b * d], axis=1)
+    if typ == "d":
+        return np.stack([a * c, a * d - b * c, -b * d], axis=1)
+    raise ValueError(f"Unbekannter Aufgabentyp: {typ}")
+
+
+@lru_cache(maxsize=None)
+def zahl_tabellen(grenze):
+    """
+    Texte für alle Zahlen von -grenze bis +grenze, einmal vorberechnet.
+
+    Rückgabe:
+    - (ohne_vorzeichen, mit_vorzeichen): z.B. "-3"/"3" und "-3"/"+3"
+    """
+    werte = range(-grenze, grenze + 1)
+    return (np.array([str(wert) for wert in werte]),
+            np.array([f"{wert:+d}" for wert in werte]))
+
+
+def _text(tabelle, werte, grenze):
+    return tabelle[werte + grenze]
+
+
+def _verbinde(*teile):
+    ergebnis = teile[0]
+    for teil in teile[1:]:
+        ergebnis = np.char.add(ergebnis, teil)
+    return ergebnis
+
+
+def baue_texte(typ, operanden, variablen, koeff):
+    """
+    Baut Aufgaben- und Lösungs-Texte für einen ganzen Stapel aus den Tabellen.
+
+    Rückgabe:
+    - (aufgaben, loesungen) als NumPy-String-Arrays
+    """
+    grenze = int(max(np.abs(operanden).max(initial=0), np.abs(koeff).max(initial=0)))
+    zahl, vorz = zahl_tabellen(grenze)
+    z = lambda werte: _text(zahl, werte, grenze)
+    v = lambda werte: _text(vorz, werte, grenze)
+    o = operanden.T
+    k = koeff.T
+
+    if typ == "a":
+        x = variablen[:, 0]
+        aufgaben = _verbinde(z(o[0]), "(", z(o[1]), " - ", z(o[2]), x, ")")
+        loesungen = _verbinde(z(k[0]), " - ", z(k[1]), x)
+    elif typ == "b":
+        b_var, f_var = variablen[:, 0], variablen[:, 1]
+        aufgaben = _verbinde("(", z(o[0]), b_var, " - ", z(o[1]), ")(", z(o[2]), " - ", z(o[3]), f_var, ")")
+        loesungen = _verbinde(z(k[0]), b_var, " - ", z(k[1]), b_var, f_var,
+                              " - ", z(k[2]), " + ", z(k[3]), f_var)
+    elif typ == "c":
+        x = variablen[:, 0]
+        aufgaben = _verbinde("(", z(o[0]), x, " - ", z(o[1]), ")(", z(o[2]), x, " + ", z(o[3]), ")")
+        loesungen = _verbinde(z(k[0]), x, "² + ", v(k[1]), x, " + ", v(k[2]))
+    else:
+        x = variablen[:, 0]
+        aufgaben = _verbinde("(", z(o[0]), " - ", z(o[1]), x, ")(", z(o[2]), " + ", z(o[3]), x, ")")
+        loesungen = _verbinde(z(k[0]), " + ", v(k[1]), x, " + ", v(k[2]), x, "²")
+    return aufgaben, loesungen
+
+
+def erzeuge_stapel(typ, anzahl, mana, rng=None, mit_text=True):
+    """
+    Erzeugt `anzahl` Aufgaben eines Typs auf einmal.
+
+    Parameter:
+    - typ: "a", "b", "c" oder "d"
+    - anzahl: Wie viele Aufgaben
+    - mana: Zahlen aus [-mana, mana] ohne 0
+    - rng: numpy.random.Generator (None = neuer, zufällig geseedet)
+    - mit_text: False -> nur Zahlen, keine Texte (noch schneller)
+
+    Rückgabe (dict):
+    - operanden: (anzahl, 3 oder 4) - die Zahlen in der Aufgabe, von links nach rechts
+    - variablen: (anzahl, 1 oder 2) - Variablen-Namen
+    - koeffizienten: (anzahl, 2-4) - siehe koeffizienten()
+    - aufgaben, loesungen: String-Arrays (nur mit mit_text=True)
+    """
+    spec = TYPEN[typ]
+    rng = rng if rng is not None else np.random.default_rng()
+    operanden = ziehe_ohne_null(rng, mana, (anzahl, spec["operanden"]))
+    variablen = spec["auswahl"][rng.integers(0, len(spec["auswahl"]), size=(anzahl, spec["variablen"]))]
+    koeff = koeffizienten(typ, operanden)
+
+    stapel = {"typ": typ, "operanden": operanden, "variablen": variablen, "koeffizienten": koeff}
+    if mit_text:
+        stapel["aufgaben"], stapel["loesungen"] = baue_texte(typ, operanden, variablen, koeff)
+    return stapel
+
+
+def erwartungen_aus_stapel(stapel):
+    """
+    Erwartete Lösungen eines Stapels in der festen Form von polynom.py
+    (zum Bewerten mit polynom.bewerte).
+    """
+    from polynom import kanonisch_aus_termen
+
+    terme = TERME[stapel["typ"]]
+    erwartungen = []
+    for koeff, variablen in zip(stapel["koeffizienten"].tolist(), stapel["variablen"].tolist()):
+        erwartungen.append(kanonisch_aus_termen(
+            (vorzeichen * k, "".join(variablen[spalte] for spalte in spalten))
+            for k, (vorzeichen, spalten) in zip(koeff, terme)
+        ))
+    return erwartungen
+
+
+########################################
+# BENCHMARK: Stapel vs. eine Aufgabe nach der anderen
+########################################
+
+def benchmark(anzahl=200_000, mana=10):
+    import os
+    import sys
+    import time
+
+    hauptordner = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.path.insert(0, hauptordner)                                # log.py
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from luh1a1 import KlammerSpiel1x1
+
+    spiel = KlammerSpiel1x1()
+    spiel.setze_mana(mana)
+    print(f"{'Typ':<4} | {'einzeln':>12} | {'Stapel':>12} | {'Stapel ohne Text':>16} | Faktor")
+    print("-" * 64)
+    for typ in TYPEN:
+        methode = getattr(spiel, f"generiere_aufgabe_typ_{typ}")
+        start = time.perf_counter()
+        for _ in range(anzahl):
+            methode()
+        einzeln = time.perf_counter() - start
+
+        start = time.perf_counter()
+        erzeuge_stapel(typ, anzahl, mana)
+        stapel = time.perf_counter() - start
+
+        start = time.perf_counter()
+        erzeuge_stapel(typ, anzahl, mana, mit_text=False)
+        nur_zahlen = time.perf_counter() - start
+
+        print(f"{typ:<4} | {anzahl / einzeln:>8,.0f} /s | {anzahl / stapel:>8,.0f} /s | "
+              f"{anzahl / nur_zahlen:>12,.0f} /s | {einzeln / stapel:5.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,207 @@
+########################################
+# POLYNOM-PRÜFUNG: ausmultiplizierte Antworten vergleichen
+########################################
+# Beim Klammer-Spiel 1x1 kann dieselbe Lösung ganz verschieden aussehen:
+#   "6x² + -5x + -4"  =  "6x^2 - 5x - 4"  =  "-4 - 5*x + 6xx"
+# Darum wird jede Antwort in eine feste Form gebracht: ein Tupel aus
+# (Exponenten, Koeffizient)-Paaren, sortiert, ohne Nullen.
+#   Exponenten = (x, y, z, a, b), z.B. x²y -> (2, 1, 0, 0, 0)
+#
+# Erlaubt sind ganze Zahlen, die Variablen x y z a b, Hochzahlen als
+# ², ³ oder ^n, * oder · (oder nichts) zum Malnehmen und beliebige
+# Vorzeichen-Folgen wie "+ -11z" oder "- -6x". Klammern nicht - die
+# Antwort soll ja ausmultipliziert sein.
+#
+# Gelesene Antworten werden zwischengespeichert (lru_cache): in einer
+# Klasse schreiben viele dasselbe. Mehr als MAX_LAENGE Zeichen oder eine
+# Hochzahl über MAX_HOCH gelten als unlesbar - ein Tippfehler wie
+# "7^300000000" darf die Bewertung nicht aufhalten.
+#
+# Beispiel:
+#   erwartet = kanonisch_aus_termen([(6, "xx"), (-5, "x"), (-4, "")])
+#   pruefe("6x^2 - 5x - 4", erwartet)  -> True
+#
+# Benchmark:  python polynom.py
+########################################
+
+import re
+from functools import lru_cache
+
+VARIABLEN = "xyzab"
+_VARIABLE = {name: index for index, name in enumerate(VARIABLEN)}
+_HOCH = {"²": 2, "³": 3, "⁴": 4}
+MAX_LAENGE = 200
+MAX_HOCH = 12
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<zahl>\d+)|(?P<var>[xyzab])|(?P<hoch>\^\s*\d+|[²³⁴])"
+    r"|(?P<vz>[+\-−])|(?P<mal>[*·]))",
+    re.IGNORECASE,
+)
+
+
+class KeinPolynom(ValueError):
+    """Die Antwort lässt sich nicht als ausmultipliziertes Polynom lesen."""
+
+
+@lru_cache(maxsize=None)
+def monom(variablen):
+    """
+    Exponenten-Tupel aus einem Variablen-Text, z.B. "xy" -> (1, 1, 0, 0, 0), "xx" -> (2, 0, 0, 0, 0).
+    """
+    exponenten = [0] * len(VARIABLEN)
+    for name in variablen:
+        exponenten[_VARIABLE[name]] += 1
+    return tuple(exponenten)
+
+
+def _form(summen):
+    return tuple(sorted((exponenten, koeff) for exponenten, koeff in summen.items() if koeff))
+
+
+def kanonisch_aus_termen(terme):
+    """
+    Feste Form aus (Koeffizient, Variablen-Text)-Paaren - so liefern die Generatoren ihre Lösung.
+
+    Parameter:
+    - terme: z.B. [(6, "xx"), (-5, "x"), (-4, "")]
+    """
+    summen = {}
+    for koeff, variablen in terme:
+        exponenten = monom(variablen)
+        summen[exponenten] = summen.get(exponenten, 0) + koeff
+    return _form(summen)
+
+
+@lru_cache(maxsize=65536)
+def kanonisch(text):
+    """
+    Liest eine ausmultiplizierte Antwort und gibt die feste Form zurück.
+
+    Raises:
+    - KeinPolynom: wenn der Text nicht gelesen werden kann, zu lang ist oder
+      eine Hochzahl über MAX_HOCH hat
+    """
+    if len(text) > MAX_LAENGE:
+        raise KeinPolynom(text[:MAX_LAENGE] + "...")
+
+    summen = {}
+    vorzeichen, koeff, exponenten = 1, 1, [0] * len(VARIABLEN)
+    im_term = nach_mal = False
+    letzter = None  # ("zahl", wert) oder ("var", index) - dahin gehört eine Hochzahl
+    ende = 0  # bis hierhin ist der Text gelesen - jedes Token muss genau hier anfangen
+
+    for treffer in _TOKEN.finditer(text):
+        if treffer.start() != ende:
+            raise KeinPolynom(text)
+        ende = treffer.end()
+        art = treffer.lastgroup
+        wert = treffer.group(art)
+        if art == "vz":
+            if im_term and not nach_mal:
+                # neuer Term beginnt
+                schluessel = tuple(exponenten)
+                summen[schluessel] = summen.get(schluessel, 0) + vorzeichen * koeff
+                vorzeichen, koeff, exponenten = 1, 1, [0] * len(VARIABLEN)
+                im_term, letzter = False, None
+            if wert != "+":
+                vorzeichen = -vorzeichen
+        elif art == "mal":
+            if not im_term or nach_mal:
+                raise KeinPolynom(text)
+            nach_mal = True
+        elif art == "hoch":
+            if letzter is None or nach_mal:
+                raise KeinPolynom(text)
+            hoch = _HOCH.get(wert) or int(wert.lstrip("^ \t"))
+            if hoch > MAX_HOCH:
+                raise KeinPolynom(text)
+            if letzter[0] == "var":
+                exponenten[letzter[1]] += hoch - 1
+            else:
+                koeff = koeff // letzter[1] * letzter[1] ** hoch if letzter[1] else 0
+            letzter = None
+        else:
+            if art == "zahl":
+                zahl = int(wert)
+                koeff *= zahl
+                letzter = ("zahl", zahl)
+            else:
+                index = _VARIABLE[wert.lower()]
+                exponenten[index] += 1
+                letzter = ("var", index)
+            im_term, nach_mal = True, False
+
+    if text[ende:].strip() or not im_term or nach_mal:
+        raise KeinPolynom(text)
+    schluessel = tuple(exponenten)
+    summen[schluessel] = summen.get(schluessel, 0) + vorzeichen * koeff
+    return _form(summen)
+
+
+def als_text(form):
+    """
+    Schreibt eine feste Form als Antwort-Text, den kanonisch() wieder genauso liest.
+
+    Beispiel:
+    - kanonisch_aus_termen([(6, "xx"), (-5, "x"), (-4, "")]) -> "-4 - 5x + 6x^2"
+    """
+    terme = []
+    for exponenten, koeff in form:
+        variablen = "".join(name + (f"^{hoch}" if hoch > 1 else "")
+                            for name, hoch in zip(VARIABLEN, exponenten) if hoch)
+        terme.append(f"{koeff}{variablen}")
+    return " + ".join(terme).replace("+ -", "- ") or "0"
+
+
+def pruefe(antwort, erwartet):
+    """
+    Ist die Antwort gleich dem erwarteten Polynom? Unlesbare Antworten sind falsch.
+
+    Parameter:
+    - antwort: Text des Spielers
+    - erwartet: feste Form (kanonisch / kanonisch_aus_termen)
+    """
+    try:
+        return kanonisch(antwort.strip()) == erwartet
+    except KeinPolynom:
+        return False
+
+
+def bewerte(antworten, erwartungen):
+    """
+    Bewertet viele Antworten auf einmal (z.B. eine ganze Klasse).
+
+    Rückgabe:
+    - Liste mit True/False, in derselben Reihenfolge
+    """
+    return [pruefe(antwort, erwartet) for antwort, erwartet in zip(antworten, erwartungen)]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    import numpy as np
+    from luh1a1_batch import erwartungen_aus_stapel, erzeuge_stapel
+
+    anzahl = 50_000
+    for typ in "abcd":
+        stapel = erzeuge_stapel(typ, anzahl, mana=10, rng=np.random.default_rng(0))
+        erwartungen = erwartungen_aus_stapel(stapel)
+        # Antworten in gemischter Reihenfolge der Terme, damit nicht nur Texte verglichen werden
+        antworten = []
+        for loesung in stapel["loesungen"].tolist():
+            terme = loesung.replace(" - ", " + -").split(" + ")
+            random.shuffle(terme)
+            antworten.append(" + ".join(terme))
+
+        kanonisch.cache_clear()
+        start = time.perf_counter()
+        ergebnis = bewerte(antworten, erwartungen)
+        kalt = time.perf_counter() - start
+        start = time.perf_counter()
+        bewerte(antworten, erwartungen)
+        warm = time.perf_counter() - start
+        print(f"Typ {typ}: {sum(ergebnis)}/{anzahl} richtig - "
+              f"{anzahl / kalt:,.0f} Antworten/s (neu), {anzahl / warm:,.0f} Antworten/s (im Cache)")
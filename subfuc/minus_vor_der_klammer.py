@@ -6,53 +6,73 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 #import log
 #log.run()
 
-import time
-import random
+from sitzung import Sitzung
 
-def run():
-    print("Minus vor der Klammer Spiel!")
-    print("_______________________________")
-    import time
-    time.sleep(2)
-    global runden, mana
-    mana = int(input("Gib dein Mana ein (Zahl): "))
-    runden = int(input("Wie viele Runden möchtest du spielen? "))
+def run(mana=None, anzahl_runden=None, sitzung=None):
+    """
+    Startet das Spiel. Ohne Parameter wie immer: alles wird per input() gefragt.
+    Mit `sitzung` (siehe headless.py) läuft es auch ohne Tastatur.
+
+    Rückgabe:
+    - Liste der Ergebnis-Datensätze (eine pro Aufgabe)
+    """
+    sitzung = sitzung or Sitzung()
+    sitzung.zeige("Minus vor der Klammer Spiel!")
+    sitzung.zeige("_______________________________")
+    sitzung.warte(2)
+    global runden
+    if mana is None:
+        mana = int(sitzung.frage("Gib dein Mana ein (Zahl): "))
+    if anzahl_runden is None:
+        anzahl_runden = int(sitzung.frage("Wie viele Runden möchtest du spielen? "))
+    runden = anzahl_runden
     for _ in range(runden):
-        quest1(mana)
-        quest2(mana)
+        quest1(mana, sitzung)
+        quest2(mana, sitzung)
         #quest3()
-        print(f"Runde {_ + 1} abgeschlossen!")
-        print("_______________________________")
-        time.sleep(1)
+        sitzung.zeige(f"Runde {_ + 1} abgeschlossen!")
+        sitzung.zeige("_______________________________")
+        sitzung.warte(1)
+    return sitzung.ergebnisse
 #############################################
 # anfang Minus vor der Klammer Quest 1
 #############################################
-def quest1(mana):
-    print("Minus vor der Klammer 1 - -(a+b)")
+def quest1(mana, sitzung=None):
+    sitzung = sitzung or Sitzung()
+    sitzung.zeige("Minus vor der Klammer 1 - -(a+b)")
     for _ in range(runden):
-        a = random.randint(-mana, mana)
-        b = random.randint(-mana, mana)
+        a = sitzung.zufall.randint(-mana, mana)
+        b = sitzung.zufall.randint(-mana, mana)
         x = -(a + b)
 
-        if input(f"Was ist -({a} + {b}) ? ") == str(x):
-            print("Richtig")
+        aufgabe = f"-({a} + {b})"
+        antwort = sitzung.frage(f"Was ist {aufgabe} ? ")
+        if antwort == str(x):
+            sitzung.zeige("Richtig")
         else:
-            print("Falsch, die richtige Antwort ist:", x)
+            sitzung.zeige("Falsch, die richtige Antwort ist:", x)
+        sitzung.ergebnis(quest="minus1", aufgabe=aufgabe, erwartet=x,
+                         antwort=antwort, richtig=antwort == str(x), mana=mana)
         mana += 1  # Erhöhe das Mana nach jeder Frage
 #############################################
 # Ende Minus vor der Klammer Quest 1
 #############################################
 
 # quest  2 - Minus vor der Klammer - schwieriger
-def quest2(mana):
-    print("Minus vor der Klammer 2")
-    time.sleep(1)
-    a = random.randint(-mana, mana)
-    b = random.randint(-mana, mana)
-    c = random.randint(-mana, mana)
+def quest2(mana, sitzung=None):
+    sitzung = sitzung or Sitzung()
+    sitzung.zeige("Minus vor der Klammer 2")
+    sitzung.warte(1)
+    a = sitzung.zufall.randint(-mana, mana)
+    b = sitzung.zufall.randint(-mana, mana)
+    c = sitzung.zufall.randint(-mana, mana)
     x = -(a - b * c)
 
-    if input(f"Was ist -({a} - {b} * {c}) ? ") == str(x):
-        print("Richtig")
+    aufgabe = f"-({a} - {b} * {c})"
+    antwort = sitzung.frage(f"Was ist {aufgabe} ? ")
+    if antwort == str(x):
+        sitzung.zeige("Richtig")
     else:
-        print("Falsch, die richtige Antwort ist:", x)
+        sitzung.zeige("Falsch, die richtige Antwort ist:", x)
+    return sitzung.ergebnis(quest="minus2", aufgabe=aufgabe, erwartet=x,
+                            antwort=antwort, richtig=antwort == str(x), mana=mana)
@@ -0,0 +1,341 @@
+########################################
+# NEURO-ANALYSE: Kennzahlen für alle Decks (NumPy) 📊
+########################################
+# Lädt alle Bewertungen einmal in NumPy-Arrays und rechnet daraus:
+# - Behaltensquote je Note: wie oft klappt die NÄCHSTE Wiederholung
+#   (Note >= 3), je nachdem welche Note die Karte davor bekam
+# - mittlere Ease über die Zeit (Wert am Ende jedes Tages)
+# - Prognose: wie viele Karten an jedem der nächsten 30 Tage fällig werden
+#
+# Die Ease hängt von allen vorigen Bewertungen einer Karte ab
+# (ease = max(1.3, ease + delta)). Das geht trotzdem ohne Schleife:
+# in Hundertsteln ist es eine Summe mit Untergrenze, und die ist
+#   W_t = S_t - min(-W_0, min_{k<=t} S_k)        (W = ease - 1.3)
+# mit S = laufende Summe der deltas je Karte. Die laufende Minimum-
+# Bildung wird pro Karte neu gestartet, indem jede Karte um ein großes
+# Stück nach unten verschoben wird.
+#
+# Neue Bewertungen (dict von Planer.bewerte) werden mit aktualisiere()
+# eingerechnet - in O(1), ohne alles neu zu rechnen.
+#
+# Beispiele:
+#   analyse = Analyse.aus_decks("neurogame_data.json", "neurogame_daten.json")
+#   analyse.behaltensquote(), analyse.ease_verlauf(), analyse.prognose()
+#   analyse.aktualisiere(planer.bewerte(karte, 3))
+#
+#   python analyse.py neurogame_data.json neurogame_daten.json
+#   python analyse.py --benchmark
+########################################
+
+import os
+import sys
+from array import array
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from karten import lade_karten
+from planer import TAG, versatz
+
+START_EASE = 250   # in Hundertsteln
+MIN_EASE = 130
+MAX_NOTE = 5       # Noten-Fächer 0..5
+GUT_AB = 3         # ab dieser Note gilt eine Wiederholung als behalten
+PROGNOSE_TAGE = 30
+
+
+def tage(zeit_us):
+    """
+    Tag-Nummer (Ortszeit, wie im Planer) für Mikrosekunden-Zeiten.
+
+    Der UTC-Versatz gilt pro Zeitpunkt (Sommerzeit!). Gefragt wird nur einmal pro
+    UTC-Tag (Anfang und Ende); nur an Tagen mit Umstellung für jeden Zeitpunkt einzeln.
+    """
+    sekunden = np.asarray(zeit_us, dtype=np.int64) // 1_000_000
+    utc_tage, stelle = np.unique(sekunden // TAG, return_inverse=True)
+    anfang = np.array([versatz(int(tag) * TAG) for tag in utc_tage], dtype=np.int64)
+    ende = np.array([versatz(int(tag) * TAG + TAG - 1) for tag in utc_tage], dtype=np.int64)
+    versaetze = anfang[stelle]
+    umstellung = np.flatnonzero((anfang != ende)[stelle])
+    if len(umstellung):
+        versaetze[umstellung] = [versatz(int(zeit)) for zeit in sekunden[umstellung]]
+    return (sekunden + versaetze) // TAG
+
+
+def ease_delta(noten):
+    """Änderung der Ease in Hundertsteln (wie planer.naechster_zustand)."""
+    noten = np.asarray(noten)
+    return np.where(noten <= 2, -20, np.where(noten >= 4, 15, 0)).astype(np.int64)
+
+
+def ease_nach_bewertungen(karte, noten):
+    """
+    Ease (Hundertstel) nach jeder Bewertung - ohne Python-Schleife.
+
+    Parameter:
+    - karte: Karten-Nummer je Bewertung, aufsteigend sortiert
+    - noten: Note je Bewertung (innerhalb einer Karte zeitlich sortiert)
+    """
+    if len(noten) == 0:
+        return np.zeros(0, dtype=np.int64)
+    delta = ease_delta(noten)
+    neu = np.r_[True, karte[1:] != karte[:-1]]
+    segment = np.cumsum(neu) - 1
+    summe = np.cumsum(delta)
+    summe -= (summe - delta)[neu][segment]  # laufende Summe je Karte
+    w0 = START_EASE - MIN_EASE
+    gross = int(np.abs(delta).sum()) + w0 + 1  # größer als jede Summe innerhalb einer Karte
+    verschoben = summe - segment * gross
+    minimum = np.minimum.accumulate(verschoben) + segment * gross
+    return MIN_EASE + summe - np.minimum(-w0, minimum)
+
+
+class Analyse:
+    def __init__(self, ids, karte, zeiten, noten, faellig):
+        """
+        Parameter (meist über aus_karten / aus_decks):
+        - ids: Karten-ids
+        - karte, zeiten, noten: je Bewertung (Karten-Nummer, Mikrosekunden, Note)
+        - faellig: je Karte Fälligkeit in Mikrosekunden
+        """
+        self.nummer = {karten_id: index for index, karten_id in enumerate(ids)}
+        sortiert = np.all((karte[1:] > karte[:-1]) | ((karte[1:] == karte[:-1]) & (zeiten[1:] >= zeiten[:-1])))
+        if not sortiert:
+            reihenfolge = np.lexsort((zeiten, karte))
+            karte, zeiten, noten = karte[reihenfolge], zeiten[reihenfolge], noten[reihenfolge]
+        noten = noten.astype(np.int64)
+        self.anzahl_bewertungen = len(noten)
+
+        # Behaltensquote: Paare (Note davor, nächste Note) derselben Karte
+        gleich = karte[1:] == karte[:-1]
+        davor = noten[:-1][gleich]
+        behalten = noten[1:][gleich] >= GUT_AB
+        self.paare = np.bincount(davor, minlength=MAX_NOTE + 1).astype(np.int64)
+        self.behalten = np.bincount(davor, weights=behalten, minlength=MAX_NOTE + 1).astype(np.int64)
+
+        # letzte Note und Ease je Karte (-1 = noch nie bewertet)
+        ease = ease_nach_bewertungen(karte, noten)
+        letzte = np.r_[karte[1:] != karte[:-1], True] if len(karte) else np.zeros(0, dtype=bool)
+        self.letzte_note = np.full(len(self.nummer), -1, dtype=np.int64)
+        self.letzte_note[karte[letzte]] = noten[letzte]
+        self.ease = np.full(len(self.nummer), -1, dtype=np.int64)
+        self.ease[karte[letzte]] = ease[letzte]
+
+        # mittlere Ease über die Zeit: Summe und Anzahl der bewerteten Karten, zeitlich sortiert
+        erste = np.r_[True, karte[1:] != karte[:-1]] if len(karte) else np.zeros(0, dtype=bool)
+        vorher = np.r_[0, ease[:-1]] if len(ease) else ease
+        beitrag = np.where(erste, ease, ease - vorher)
+        zeitlich = np.argsort(zeiten, kind="stable")
+        summe = np.cumsum(beitrag[zeitlich])
+        anzahl = np.cumsum(erste[zeitlich])
+        tag = tage(zeiten[zeitlich])
+        tagesende = np.flatnonzero(np.r_[tag[1:] != tag[:-1], True]) if len(tag) else np.zeros(0, dtype=np.int64)
+        self.ease_summe = int(summe[-1]) if len(summe) else 0
+        self.ease_anzahl = int(anzahl[-1]) if len(anzahl) else 0
+        self._ease_tage = dict(zip(tag[tagesende].tolist(), (summe[tagesende] / anzahl[tagesende] / 100).tolist()))
+
+        # Prognose: Karten je Fälligkeits-Tag
+        self.faellig_tag = tage(faellig)
+        self._basis = int(self.faellig_tag.min()) if len(self.faellig_tag) else 0
+        self._pro_tag = np.bincount(self.faellig_tag - self._basis) if len(self.faellig_tag) else np.zeros(1, np.int64)
+
+    ########################################
+    # LADEN
+    ########################################
+
+    @classmethod
+    def aus_karten(cls, karten):
+        """Aus Karten (karten.lade_karten) - die Verlauf-Arrays werden einmal aneinandergehängt."""
+        ids = [karte.id for karte in karten]
+        alle_zeiten, alle_noten = array("q"), array("b")
+        for karte in karten:
+            alle_zeiten.extend(karte.verlauf.zeiten)  # gleicher Typ: nur Speicher kopieren
+            alle_noten.extend(karte.verlauf.noten)
+        zeiten = np.frombuffer(alle_zeiten, dtype=np.int64)
+        noten = np.frombuffer(alle_noten, dtype=np.int8)
+        laengen = np.fromiter((len(karte.verlauf) for karte in karten), dtype=np.int64, count=len(karten))
+        faellig = np.fromiter(
+            ((karte.letztes_review + karte.intervall * TAG * 1_000_000) if karte.letztes_review is not None
+             else (karte.erstellt or 0) for karte in karten),
+            dtype=np.int64, count=len(karten))
+        return cls(ids, np.repeat(np.arange(len(karten)), laengen), zeiten, noten, faellig)
+
+    @classmethod
+    def aus_decks(cls, *pfade):
+        karten = []
+        for pfad in pfade:
+            karten.extend(lade_karten(pfad)[0])
+        return cls.aus_karten(karten)
+
+    ########################################
+    # KENNZAHLEN
+    ########################################
+
+    def behaltensquote(self):
+        """{Note davor: (Anteil behalten, Anzahl Paare)} für alle Noten mit Daten."""
+        return {note: (self.behalten[note] / self.paare[note], int(self.paare[note]))
+                for note in range(MAX_NOTE + 1) if self.paare[note]}
+
+    def ease_verlauf(self):
+        """(tage, mittlere_ease): Tag-Nummern und Mittelwert der Ease am Ende jedes Tages."""
+        tage_liste = sorted(self._ease_tage)
+        return np.array(tage_liste, dtype=np.int64), np.array([self._ease_tage[tag] for tag in tage_liste])
+
+    def prognose(self, heute=None, tage_anzahl=PROGNOSE_TAGE):
+        """
+        Fällige Karten je Tag ab heute (Tag 0 enthält auch alle überfälligen).
+
+        Parameter:
+        - heute: Tag-Nummer (None = heute)
+        """
+        import time
+
+        heute = int(tage(time.time() * 1_000_000)) if heute is None else heute
+        ab = heute - self._basis
+        ergebnis = np.zeros(tage_anzahl, dtype=np.int64)
+        teil = self._pro_tag[max(ab, 0):max(ab + tage_anzahl, 0)]
+        ergebnis[max(-ab, 0):max(-ab, 0) + len(teil)] = teil
+        if ab > 0:
+            ergebnis[0] += self._pro_tag[:ab].sum()
+        return ergebnis
+
+    ########################################
+    # NEUE BEWERTUNGEN
+    ########################################
+
+    def aktualisiere(self, ereignis):
+        """
+        Rechnet eine neue Bewertung ein (O(1)).
+
+        Parameter:
+        - ereignis: dict von Planer.bewerte (id, zeit in Sekunden, note, intervall)
+        """
+        index = self.nummer.get(ereignis["id"])
+        if index is None:
+            index = self._neue_karte(ereignis["id"])
+        note = int(ereignis["note"])
+        zeit_us = round(ereignis["zeit"] * 1_000_000)
+        self.anzahl_bewertungen += 1
+
+        davor = self.letzte_note[index]
+        if davor >= 0:
+            self.paare[davor] += 1
+            self.behalten[davor] += note >= GUT_AB
+        self.letzte_note[index] = note
+
+        alt = self.ease[index]
+        neu = max(MIN_EASE, (START_EASE if alt < 0 else alt) + int(ease_delta(note)))
+        if alt < 0:
+            self.ease_summe += neu
+            self.ease_anzahl += 1
+        else:
+            self.ease_summe += neu - alt
+        self.ease[index] = neu
+        self._ease_tage[int(tage(zeit_us))] = self.ease_summe / self.ease_anzahl / 100
+
+        self._pro_tag[self.faellig_tag[index] - self._basis] -= 1
+        self._zaehle_faellig(index, int(tage(zeit_us + ereignis["intervall"] * TAG * 1_000_000)))
+
+    def _zaehle_faellig(self, index, tag):
+        if tag < self._basis:
+            self._pro_tag = np.concatenate([np.zeros(self._basis - tag, np.int64), self._pro_tag])
+            self._basis = tag
+        if tag - self._basis >= len(self._pro_tag):
+            self._pro_tag = np.concatenate(
+                [self._pro_tag, np.zeros(max(tag - self._basis + 1 - len(self._pro_tag), len(self._pro_tag)), np.int64)])
+        self._pro_tag[tag - self._basis] += 1
+        self.faellig_tag[index] = tag
+
+    def _neue_karte(self, karten_id):
+        """Neue Karte ans Ende der Arrays (selten - darf kopieren)."""
+        index = len(self.nummer)
+        self.nummer[karten_id] = index
+        self.letzte_note = np.append(self.letzte_note, -1)
+        self.ease = np.append(self.ease, -1)
+        self.faellig_tag = np.append(self.faellig_tag, self._basis)
+        self._pro_tag[0] += 1
+        return index
+
+
+########################################
+# AUSGABE + BENCHMARK
+########################################
+
+def zeige(analyse):
+    from datetime import date
+
+    print(f"📊 {len(analyse.nummer):,} Karten, {analyse.anzahl_bewertungen:,} Bewertungen")
+    print("\n🧠 Behaltensquote (nächste Wiederholung mit Note >= 3), nach Note davor:")
+    for note, (quote, anzahl) in analyse.behaltensquote().items():
+        print(f"   Note {note}: {quote:6.1%}  ({anzahl:,} Paare)")
+    tag_liste, mittel = analyse.ease_verlauf()
+    print("\n📈 Mittlere Ease (letzte 7 Tage mit Bewertungen):")
+    for tag, wert in zip(tag_liste[-7:], mittel[-7:]):
+        print(f"   {date.fromordinal(date(1970, 1, 1).toordinal() + int(tag)):%d.%m.%Y}: {wert:.2f}")
+    print(f"\n📅 Fällig in den nächsten {PROGNOSE_TAGE} Tagen:")
+    print("   " + " ".join(str(anzahl) for anzahl in analyse.prognose()))
+
+
+def benchmark(karten_anzahl=100_000, bewertungen_pro_karte=20):
+    import random
+    import time
+
+    from karten import Karte
+    from verlauf import ReviewVerlauf, VerlaufSpalten
+
+    rng = np.random.default_rng(0)
+    jetzt = int(time.time() * 1_000_000)
+    spalten = VerlaufSpalten()
+    karten = []
+    for nummer in range(karten_anzahl):
+        zeiten = np.sort(jetzt - rng.integers(0, 365 * TAG * 1_000_000, bewertungen_pro_karte)).tolist()
+        noten = rng.integers(1, 5, bewertungen_pro_karte).tolist()
+        verlauf = ReviewVerlauf(zip(zeiten, noten, [0] * bewertungen_pro_karte), spalten)
+        karten.append(Karte(f"item_{nummer}", "", "", letztes_review=zeiten[-1],
+                            intervall=random.randint(1, 40), verlauf=verlauf))
+    gesamt = karten_anzahl * bewertungen_pro_karte
+
+    start = time.perf_counter()
+    analyse = Analyse.aus_karten(karten)
+    analyse.behaltensquote(), analyse.ease_verlauf(), analyse.prognose()
+    numpy_dauer = time.perf_counter() - start
+
+    # Vergleich: dieselbe Behaltensquote + Ease mit einer Python-Schleife über dict-Verläufe
+    dicts = [karte.verlauf.als_dicts() for karte in karten[:karten_anzahl // 10]]
+    start = time.perf_counter()
+    paare, behalten, eases = [0] * 6, [0] * 6, []
+    for verlauf in dicts:
+        davor, ease = None, 2.5
+        for eintrag in verlauf:
+            if davor is not None:
+                paare[davor] += 1
+                behalten[davor] += eintrag["score"] >= 3
+            ease = max(1.3, ease - 0.2) if eintrag["score"] <= 2 else ease + (0.15 if eintrag["score"] >= 4 else 0)
+            eases.append(ease)
+            davor = eintrag["score"]
+    schleife_dauer = (time.perf_counter() - start) * 10
+
+    start = time.perf_counter()
+    for nummer in range(10_000):
+        analyse.aktualisiere({"id": f"item_{nummer}", "zeit": time.time(), "note": 1 + nummer % 4, "intervall": 3})
+    update = (time.perf_counter() - start) / 10_000
+
+    print(f"{karten_anzahl:,} Karten, {gesamt:,} Bewertungen")
+    print(f"  NumPy, alles:                 {numpy_dauer:6.2f} s")
+    print(f"  Python-Schleife (hochgerechnet): {schleife_dauer:6.2f} s (nur Quote + Ease)")
+    print(f"  aktualisiere():               {update * 1e6:6.1f} µs pro Bewertung")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Kennzahlen für NeuroGame-Decks")
+    parser.add_argument("decks", nargs="*")
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark()
+    elif args.decks:
+        zeige(Analyse.aus_decks(*args.decks))
+    else:
+        parser.error("Deck-Dateien oder --benchmark angeben")
@@ -0,0 +1,468 @@
+########################################
+# NEURO-BILDER: Bilder nach Inhalt ablegen + kleine Vorschau-Varianten 🖼️
+########################################
+# Bisher zeigt jedes Item mit image_path direkt auf eine Datei in
+# clipboard_images/ - jedes Einfügen ist eine weitere volle Kopie
+# (zwei byte-gleiche 3 MB PNGs liegen schon dort), und jede Wiederholung
+# dekodiert das Original in voller Größe.
+#
+# Jetzt:
+# - Ablage nach Inhalt: bilder/objekte/<ab>/<sha256>.png - dasselbe Bild
+#   zweimal eingefügt ist nur einmal auf der Platte
+# - Varianten: bilder/varianten/<ab>/<sha256>_<kante>.jpg (bzw. .png bei
+#   echter Transparenz), verkleinert und neu komprimiert - im Hintergrund
+#   von einem Thread-Pool erzeugt
+# - Cache: die zuletzt gezeigten Varianten liegen als Bytes im Speicher
+#   (LRU, höchstens CACHE_BYTES)
+# - Beim Abfragen wird nur die kleine Variante gelesen, nie das Original
+#   (außer einmal zum Erzeugen der Variante)
+#
+# Das Item speichert weiterhin einen normalen Pfad (relativ zum Projekt),
+# z.B. "bilder/objekte/3f/3fa4....png" - alte Leser funktionieren also weiter.
+# Pillow ist optional: ohne Pillow gibt es nur die Ablage, keine Varianten.
+#
+# Beispiele:
+#   speicher = BildSpeicher()
+#   item["image_path"] = speicher.lege_ab("clipboard_images/clipboard_20251006_010553.png")
+#   daten = speicher.klein(karte.bild)          # JPEG-Bytes, ~320 px
+#
+#   python bilder.py --migriere neurogame_data.json neurogame_daten.json
+#   python bilder.py --benchmark
+########################################
+
+import hashlib
+import io
+import os
+import shutil
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+PROJEKT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BILD_ORDNER = os.environ.get("AKADEMY_BILD_DIR", os.path.join(PROJEKT, "bilder"))
+
+KANTEN = {"klein": 320, "mittel": 800}  # längste Kante der Varianten in Pixeln
+JPEG_QUALITAET = 82
+CACHE_BYTES = 32 * 1024 * 1024
+ARBEITER = 2
+BLOCK = 1 << 20  # Bytes pro Lese-Block beim Hashen
+
+
+def _pillow():
+    """Pillow erst laden, wenn eine Variante gebraucht wird (None, wenn nicht installiert)."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def _hash_datei(pfad):
+    summe = hashlib.sha256()
+    with open(pfad, "rb") as file:
+        while True:
+            block = file.read(BLOCK)
+            if not block:
+                break
+            summe.update(block)
+    return summe.hexdigest()
+
+
+def _schreibe_atomar(ziel, daten=None, quelle=None):
+    """Erst Temp-Datei, dann os.replace - halbe Dateien gibt es nie."""
+    os.makedirs(os.path.dirname(ziel), exist_ok=True)
+    temp = f"{ziel}.{threading.get_ident()}.tmp"
+    if quelle is not None:
+        shutil.copyfile(quelle, temp)
+    else:
+        with open(temp, "wb") as file:
+            file.write(daten)
+    os.replace(temp, ziel)
+
+
+########################################
+# LRU-CACHE MIT GRÖSSEN-GRENZE
+########################################
+
+class VorschauCache:
+    """Bytes-Cache: die am längsten nicht benutzten Einträge fliegen raus, sobald mehr als max_bytes belegt sind."""
+
+    def __init__(self, max_bytes=CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.belegt = 0
+        self.treffer = 0
+        self.fehlschlaege = 0
+        self._daten = OrderedDict()
+        self._sperre = threading.Lock()
+
+    def hole(self, schluessel):
+        with self._sperre:
+            daten = self._daten.get(schluessel)
+            if daten is None:
+                self.fehlschlaege += 1
+                return None
+            self._daten.move_to_end(schluessel)
+            self.treffer += 1
+            return daten
+
+    def lege(self, schluessel, daten):
+        if len(daten) > self.max_bytes:
+            return  # passt nie rein
+        with self._sperre:
+            alt = self._daten.pop(schluessel, None)
+            if alt is not None:
+                self.belegt -= len(alt)
+            self._daten[schluessel] = daten
+            self.belegt += len(daten)
+            while self.belegt > self.max_bytes:
+                _, raus = self._daten.popitem(last=False)
+                self.belegt -= len(raus)
+
+    def __len__(self):
+        return len(self._daten)
+
+
+########################################
+# BILD-SPEICHER
+########################################
+
+class BildSpeicher:
+    def __init__(self, ordner=BILD_ORDNER, basis=PROJEKT, arbeiter=ARBEITER, cache_bytes=CACHE_BYTES):
+        """
+        Parameter:
+        - ordner: hier liegen objekte/ und varianten/
+        - basis: Pfade in den Items sind relativ zu diesem Ordner
+        - arbeiter: Threads für die Varianten
+        - cache_bytes: Obergrenze für den Vorschau-Cache im Speicher
+        """
+        self.ordner = ordner
+        self.basis = basis
+        self.cache = VorschauCache(cache_bytes)
+        self._pool = ThreadPoolExecutor(max_workers=arbeiter, thread_name_prefix="bilder")
+        self._laufend = {}            # (hash, kante) -> Future
+        self._nach_pfad = {}          # (pfad, mtime, größe) -> (hash, endung) für alte Pfade
+        self._sperre = threading.RLock()  # der Callback kann sofort im selben Thread laufen
+
+    ########################################
+    # PFADE
+    ########################################
+
+    def objekt_pfad(self, schluessel, endung):
+        return os.path.join(self.ordner, "objekte", schluessel[:2], schluessel + endung)
+
+    def varianten_pfad(self, schluessel, kante, endung=".jpg"):
+        return os.path.join(self.ordner, "varianten", schluessel[:2], f"{schluessel}_{kante}{endung}")
+
+    def referenz(self, schluessel, endung):
+        """Pfad, wie er im Item steht (relativ zu basis, immer mit /)."""
+        return os.path.relpath(self.objekt_pfad(schluessel, endung), self.basis).replace(os.sep, "/")
+
+    def _absolut(self, referenz):
+        return referenz if os.path.isabs(referenz) else os.path.join(self.basis, referenz)
+
+    def aufloesen(self, referenz):
+        """
+        Item-Pfad -> (hash, endung, absoluter Pfad).
+
+        Liegt die Datei schon im Speicher, steht der Hash im Dateinamen.
+        Alte Pfade (clipboard_images/...) werden einmal gehasht und abgelegt.
+        """
+        pfad = self._absolut(referenz)
+        objekte = os.path.join(self.ordner, "objekte") + os.sep
+        if os.path.abspath(pfad).startswith(os.path.abspath(objekte)):
+            name, endung = os.path.splitext(os.path.basename(pfad))
+            return name, endung, pfad
+        info = os.stat(pfad)
+        merker = (os.path.abspath(pfad), info.st_mtime_ns, info.st_size)
+        bekannt = self._nach_pfad.get(merker)
+        if bekannt is None:
+            self.lege_ab(pfad)
+            bekannt = self._nach_pfad[merker]
+        schluessel, endung = bekannt
+        return schluessel, endung, self.objekt_pfad(schluessel, endung)
+
+    ########################################
+    # ABLEGEN
+    ########################################
+
+    def lege_ab(self, quelle, endung=None, varianten=True):
+        """
+        Legt ein Bild nach Inhalt ab (doppelte Bilder kosten keinen Platz).
+
+        Parameter:
+        - quelle: Dateipfad, Bytes oder ein PIL-Bild (z.B. aus der Zwischenablage)
+        - endung: Dateiendung, wenn quelle kein Pfad ist (Standard ".png")
+        - varianten: kleine Varianten gleich im Hintergrund erzeugen
+
+        Rückgabe:
+        - Pfad für das Item (relativ zu basis)
+        """
+        if hasattr(quelle, "save"):  # PIL-Bild
+            puffer = io.BytesIO()
+            quelle.save(puffer, format="PNG")
+            quelle, endung = puffer.getvalue(), endung or ".png"
+
+        if isinstance(quelle, (bytes, bytearray, memoryview)):
+            daten = bytes(quelle)
+            schluessel = hashlib.sha256(daten).hexdigest()
+            endung = (endung or ".png").lower()
+            ziel = self.objekt_pfad(schluessel, endung)
+            if not os.path.exists(ziel):
+                _schreibe_atomar(ziel, daten=daten)
+        else:
+            pfad = self._absolut(quelle)
+            schluessel = _hash_datei(pfad)
+            endung = (endung or os.path.splitext(pfad)[1] or ".png").lower()
+            ziel = self.objekt_pfad(schluessel, endung)
+            if not os.path.exists(ziel):
+                _schreibe_atomar(ziel, quelle=pfad)
+            info = os.stat(pfad)
+            self._nach_pfad[(os.path.abspath(pfad), info.st_mtime_ns, info.st_size)] = (schluessel, endung)
+
+        if varianten:
+            for kante in KANTEN.values():
+                self._plane(schluessel, endung, kante)
+        return self.referenz(schluessel, endung)
+
+    ########################################
+    # VARIANTEN
+    ########################################
+
+    def _fertige_variante(self, schluessel, kante):
+        for endung in (".jpg", ".png"):
+            pfad = self.varianten_pfad(schluessel, kante, endung)
+            if os.path.exists(pfad):
+                return pfad
+        return None
+
+    def _plane(self, schluessel, endung, kante):
+        """Variante im Pool anstoßen (höchstens einmal gleichzeitig pro Bild und Größe)."""
+        if _pillow() is None:
+            return None
+        with self._sperre:
+            future = self._laufend.get((schluessel, kante))
+            if future is None:
+                if self._fertige_variante(schluessel, kante):
+                    return None
+                future = self._pool.submit(self._erzeuge, schluessel, endung, kante)
+                self._laufend[(schluessel, kante)] = future
+                future.add_done_callback(lambda _, merker=(schluessel, kante): self._fertig(merker))
+            return future
+
+    def _fertig(self, merker):
+        with self._sperre:
+            self._laufend.pop(merker, None)
+
+    def _erzeuge(self, schluessel, endung, kante):
+        """Original einmal öffnen, verkleinern, neu komprimieren (läuft im Pool)."""
+        Image = _pillow()
+        with Image.open(self.objekt_pfad(schluessel, endung)) as bild:
+            bild.draft("RGB", (kante, kante))  # JPEG: gleich verkleinert dekodieren
+            bild.thumbnail((kante, kante), Image.LANCZOS)
+            transparent = bild.mode in ("RGBA", "LA", "PA") or "transparency" in bild.info
+            if transparent:
+                bild = bild.convert("RGBA")
+                transparent = bild.getextrema()[3][0] < 255
+            puffer = io.BytesIO()
+            if transparent:
+                bild.save(puffer, format="PNG", optimize=True)
+                ziel = self.varianten_pfad(schluessel, kante, ".png")
+            else:
+                bild.convert("RGB").save(puffer, format="JPEG", quality=JPEG_QUALITAET, optimize=True)
+                ziel = self.varianten_pfad(schluessel, kante, ".jpg")
+        _schreibe_atomar(ziel, daten=puffer.getvalue())
+        return ziel
+
+    def vorbereiten(self, referenzen, groesse="klein"):
+        """Varianten für die nächsten Karten schon mal anstoßen (wartet nicht)."""
+        for referenz in referenzen:
+            if referenz:
+                schluessel, endung, _ = self.aufloesen(referenz)
+                self._plane(schluessel, endung, KANTEN[groesse])
+
+    def klein(self, referenz, groesse="klein"):
+        """
+        Bytes der verkleinerten Variante für die Anzeige.
+
+        Parameter:
+        - referenz: Pfad aus dem Item (image_path / bild)
+        - groesse: "klein" oder "mittel" (siehe KANTEN)
+
+        Rückgabe:
+        - JPEG/PNG-Bytes, oder None ohne Bild / ohne Pillow
+        """
+        if not referenz:
+            return None
+        kante = KANTEN[groesse]
+        daten = self.cache.hole((referenz, kante))
+        if daten is not None:
+            return daten
+
+        schluessel, endung, _ = self.aufloesen(referenz)
+        pfad = self._fertige_variante(schluessel, kante)
+        if pfad is None:
+            future = self._plane(schluessel, endung, kante)
+            if future is not None:
+                future.result()
+            pfad = self._fertige_variante(schluessel, kante)
+            if pfad is None:
+                return None  # kein Pillow
+        with open(pfad, "rb") as file:
+            daten = file.read()
+        self.cache.lege((referenz, kante), daten)
+        return daten
+
+    def warte(self):
+        """Bis alle angestoßenen Varianten fertig sind."""
+        with self._sperre:
+            offen = list(self._laufend.values())
+        for future in offen:
+            future.result()
+
+    def schliesse(self):
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *fehler):
+        self.schliesse()
+
+
+########################################
+# MIGRATION DER DECKS
+########################################
+
+BILD_FELDER = ("image_path", "bild")
+
+
+def migriere_deck(pfad, speicher, alte=None):
+    """
+    Stellt alle Bild-Pfade eines Decks auf den Speicher um (über das Journal).
+
+    Parameter:
+    - pfad: Deck-Datei (beide Schemas)
+    - speicher: BildSpeicher
+    - alte: Menge, in die die Pfade der abgelegten Originale kommen - gelöscht wird erst
+      nach ALLEN Decks (raeume_auf), weil mehrere Decks dasselbe Bild benutzen können
+
+    Rückgabe:
+    - Anzahl der umgestellten Items
+    """
+    from journal import Deck
+
+    deck = Deck.oeffne(pfad)
+    umgestellt = 0
+    if alte is None:
+        alte = set()
+    for item in list(deck.items):
+        for feld in BILD_FELDER:
+            alt = item.get(feld)
+            if not alt:
+                continue
+            if not os.path.exists(speicher._absolut(alt)):
+                print(f"⚠️ {item['id']}: Bild fehlt ({alt})")
+                continue
+            neu = speicher.lege_ab(alt)
+            if neu != alt:
+                deck.aendere(item["id"], **{feld: neu})
+                alte.add(os.path.abspath(speicher._absolut(alt)))
+                umgestellt += 1
+    deck.schliesse(verdichten=umgestellt > 0)
+    return umgestellt
+
+
+def raeume_auf(alte):
+    """
+    Löscht die alten Originale, nachdem alle Decks umgestellt sind.
+
+    Rückgabe:
+    - Anzahl der gelöschten Dateien
+    """
+    geloescht = 0
+    for alt in sorted(alte):
+        try:
+            os.remove(alt)
+            geloescht += 1
+        except FileNotFoundError:
+            pass
+    return geloescht
+
+
+########################################
+# BENCHMARK
+########################################
+
+def benchmark(bilder=None, wiederholungen=200):
+    import tempfile
+    import time
+
+    Image = _pillow()
+    if Image is None:
+        print("❌ Für den Benchmark wird Pillow gebraucht")
+        return
+    ordner = os.path.join(PROJEKT, "clipboard_images")
+    bilder = bilder or sorted(os.path.join(ordner, name) for name in os.listdir(ordner))
+
+    with tempfile.TemporaryDirectory() as temp, BildSpeicher(os.path.join(temp, "bilder"), basis=temp) as speicher:
+        referenzen = [speicher.lege_ab(pfad) for pfad in bilder]
+        speicher.warte()
+        vorher = sum(os.path.getsize(pfad) for pfad in bilder)
+        nachher = sum(os.path.getsize(os.path.join(wurzel, name))
+                      for wurzel, _, namen in os.walk(os.path.join(temp, "bilder", "objekte")) for name in namen)
+        variante = os.path.getsize(speicher._fertige_variante(speicher.aufloesen(referenzen[0])[0], KANTEN["klein"]))
+
+        start = time.perf_counter()
+        for nummer in range(wiederholungen):
+            with Image.open(bilder[nummer % len(bilder)]) as bild:
+                bild.load()
+        dauer_original = (time.perf_counter() - start) / wiederholungen
+
+        start = time.perf_counter()
+        for nummer in range(wiederholungen):
+            speicher.cache = VorschauCache(0)  # ohne Cache: Variante jedes Mal von der Platte
+            with Image.open(io.BytesIO(speicher.klein(referenzen[nummer % len(referenzen)]))) as bild:
+                bild.load()
+        dauer_variante = (time.perf_counter() - start) / wiederholungen
+
+        speicher.cache = VorschauCache()
+        start = time.perf_counter()
+        for nummer in range(wiederholungen * 100):
+            speicher.klein(referenzen[nummer % len(referenzen)])
+        dauer_cache = (time.perf_counter() - start) / (wiederholungen * 100)
+
+    print(f"🖼️ {len(bilder)} Bilder, {vorher / 1e6:.1f} MB -> {nachher / 1e6:.1f} MB abgelegt, "
+          f"{len(set(referenzen))} verschiedene")
+    print(f"   Variante klein ({KANTEN['klein']} px): {variante / 1e3:.0f} kB")
+    print(f"   Original dekodieren:            {dauer_original * 1000:8.2f} ms")
+    print(f"   Variante lesen + dekodieren:    {dauer_variante * 1000:8.2f} ms")
+    print(f"   Variante aus dem Cache:         {dauer_cache * 1e6:8.2f} µs")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bilder der Decks nach Inhalt ablegen")
+    parser.add_argument("--migriere", nargs="+", metavar="DECK", help="Bild-Pfade dieser Decks umstellen")
+    parser.add_argument("--aufraeumen", action="store_true", help="alte Dateien löschen, wenn alle Decks umgestellt sind")
+    parser.add_argument("--ablegen", nargs="+", metavar="BILD", help="Bilder ablegen und Pfade ausgeben")
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+    if args.ablegen or args.migriere:
+        with BildSpeicher() as speicher:
+            for pfad in args.ablegen or ():
+                print(f"{pfad} -> {speicher.lege_ab(pfad)}")
+            alte = set()
+            for deck in args.migriere or ():
+                print(f"✅ {deck}: {migriere_deck(deck, speicher, alte)} Bild-Pfade umgestellt")
+            speicher.warte()
+            if args.aufraeumen:
+                print(f"🧹 {raeume_auf(alte)} alte Bilder gelöscht")
+    if not (args.benchmark or args.ablegen or args.migriere):
+        parser.print_help()
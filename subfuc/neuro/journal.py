@@ -0,0 +1,322 @@
+########################################
+# NEURO-JOURNAL: Decks speichern ohne die ganze Datei neu zu schreiben 📓
+########################################
+# Bisher wurde für jede einzelne Bewertung die komplette Deck-Datei
+# (neurogame_data.json / neurogame_daten.json) neu geschrieben.
+# Jetzt:
+# - jede Änderung ist eine Zeile im Journal "<deck>.journal" (JSON pro
+#   Zeile, ein paar hundert Bytes), angehängt und mit fsync gesichert
+# - ab und zu (VERDICHTEN_AB Einträge) wird ein Snapshot geschrieben:
+#   das Deck-JSON wie bisher, plus "journal_seq" = erste Nummer, die noch
+#   NICHT drin ist. Erst Temp-Datei + fsync, dann os.replace - danach
+#   wird das Journal geleert.
+# - beim Öffnen: Snapshot laden, dann alle Journal-Zeilen ab journal_seq
+#   nachspielen. Eine halb geschriebene letzte Zeile (Absturz) wird
+#   ignoriert und abgeschnitten.
+#
+# Das Deck-Format bleibt dasselbe - beide Schemas (englisch/deutsch)
+# werden in ihrem eigenen Format fortgeschrieben.
+# Wer mitlesen will (z.B. der Such-Index in suche.py), hängt sich an
+# deck.beobachter: geaendert(deck, eintrag) nach jedem Eintrag,
+# verdichtet(deck) nach jedem Snapshot.
+#
+# Beispiel:
+#   deck = Deck.oeffne("neurogame_data.json")
+#   planer = Planer.aus_items(deck.items)
+#   karte = planer.naechste()
+#   deck.bewerte(planer.bewerte(karte, 3))
+#   deck.schliesse()
+#
+# Benchmark:  python journal.py --benchmark
+########################################
+
+import json
+import os
+from datetime import datetime
+
+VERDICHTEN_AB = 10_000  # Journal-Einträge bis zum nächsten Snapshot
+EINGERUECKT_BIS = 10_000  # größere Snapshots ohne indent, in einem Stück (json.dumps rechnet dann in C)
+
+_DECODER = json.JSONDecoder()
+
+# Schlüssel pro Schema: englisch (neurogame_data) / deutsch (neurogame_daten)
+SCHEMA_FELDER = {
+    "en": {"letztes_review": "last_review", "intervall": "interval_days", "ease": "ease_factor",
+           "wiederholungen": "repetitions", "verlauf": "feedback_log", "gespeichert": "last_save"},
+    "de": {"letztes_review": "letztes_review", "intervall": "intervall_tage", "ease": "ease_faktor",
+           "wiederholungen": "wiederholungen", "verlauf": "bewertungen", "gespeichert": "gespeichert_am"},
+}
+
+
+def schema_von(item):
+    """"en" für prompt/answer-Items, "de" für frage/antwort-Items."""
+    return "de" if "frage" in item or "bewertungen" in item else "en"
+
+
+def _iso(zeit):
+    return datetime.fromtimestamp(zeit).isoformat()
+
+
+def _fsync_ordner(ordner):
+    """Damit auch das Umbenennen sicher auf der Platte ist (nicht unter Windows)."""
+    if os.name == "nt":
+        return
+    fd = os.open(ordner or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class Deck:
+    def __init__(self, pfad, daten, schema, seq, sync=True, verdichten_ab=VERDICHTEN_AB):
+        self.pfad = pfad
+        self.journal_pfad = pfad + ".journal"
+        self.daten = daten
+        self.items = daten["items"]
+        self.schema = schema
+        self.seq = seq         # Nummer des nächsten Journal-Eintrags
+        self.sync = sync       # False: kein fsync pro Eintrag (schneller, für Massen-Importe)
+        self.im_journal = 0    # Einträge seit dem letzten Snapshot
+        self.verdichten_ab = verdichten_ab
+        self.nach_id = {item["id"]: item for item in self.items}
+        # id -> Stelle in items: Löschen tauscht die letzte Karte an die Lücke (O(1) statt
+        # die ganze Liste zu durchsuchen) - die Reihenfolge in items ist danach nicht mehr
+        # die Einfüge-Reihenfolge
+        self.stelle = {item["id"]: nummer for nummer, item in enumerate(self.items)}
+        self.beobachter = []   # z.B. SuchIndex: geaendert(deck, eintrag), verdichtet(deck)
+        self._journal = None
+
+    ########################################
+    # ÖFFNEN + NACHSPIELEN
+    ########################################
+
+    @classmethod
+    def oeffne(cls, pfad, sync=True, verdichten_ab=VERDICHTEN_AB):
+        """
+        Lädt den Snapshot und spielt das Journal nach.
+
+        Parameter:
+        - pfad: Deck-Datei, z.B. "neurogame_data.json" (darf fehlen -> leeres Deck)
+        - sync: fsync nach jedem Eintrag
+        - verdichten_ab: nach so vielen Journal-Einträgen automatisch ein Snapshot
+        """
+        if os.path.exists(pfad):
+            with open(pfad, "r", encoding="utf-8") as file:
+                daten = json.load(file)
+        else:
+            daten = {"items": []}
+        schema = schema_von(daten["items"][0]) if daten["items"] else "en"
+        deck = cls(pfad, daten, schema, daten.get("journal_seq", 0), sync, verdichten_ab)
+        deck._spiele_nach()
+        return deck
+
+    def _spiele_nach(self):
+        if not os.path.exists(self.journal_pfad):
+            return
+        gueltig = 0  # Bytes bis zur letzten vollständigen Zeile
+        with open(self.journal_pfad, "rb") as file:
+            for zeile in file:
+                if not zeile.endswith(b"\n"):
+                    break  # halb geschrieben
+                try:
+                    eintrag = _DECODER.raw_decode(zeile.decode("utf-8"))[0]
+                except ValueError:
+                    break
+                gueltig += len(zeile)
+                if eintrag["seq"] < self.seq:
+                    continue  # steckt schon im Snapshot
+                self._wende_an(eintrag)
+                self.seq = eintrag["seq"] + 1
+                self.im_journal += 1
+        if gueltig < os.path.getsize(self.journal_pfad):
+            with open(self.journal_pfad, "r+b") as file:
+                file.truncate(gueltig)
+
+    def _wende_an(self, eintrag):
+        art = eintrag["art"]
+        if art == "review":
+            item = self.nach_id[eintrag["id"]]
+            felder = SCHEMA_FELDER[schema_von(item)]
+            zeit = eintrag["zeit"]
+            item[felder["letztes_review"]] = zeit
+            item[felder["intervall"]] = eintrag["intervall"]
+            item[felder["ease"]] = eintrag["ease"]
+            item[felder["wiederholungen"]] = eintrag["wiederholungen"]
+            if felder["verlauf"] == "feedback_log":
+                item.setdefault("feedback_log", []).append(
+                    {"timestamp": zeit, "score": eintrag["note"], "interval_before": eintrag["intervall_vorher"]})
+            else:
+                item.setdefault("bewertungen", []).append({"datum": zeit, "note": eintrag["note"]})
+        elif art == "neu":
+            item = eintrag["item"]
+            self.stelle[item["id"]] = len(self.items)
+            self.items.append(item)
+            self.nach_id[item["id"]] = item
+        elif art == "aendere":
+            self.nach_id[eintrag["id"]].update(eintrag["felder"])
+        elif art == "loesche":
+            del self.nach_id[eintrag["id"]]
+            stelle = self.stelle.pop(eintrag["id"])
+            letztes = self.items.pop()
+            if stelle < len(self.items):
+                self.items[stelle] = letztes
+                self.stelle[letztes["id"]] = stelle
+        else:
+            raise ValueError(f"Unbekannter Journal-Eintrag: {art}")
+
+    ########################################
+    # SCHREIBEN
+    ########################################
+
+    def _schreibe(self, eintrag):
+        eintrag["seq"] = self.seq
+        self._wende_an(eintrag)
+        if self._journal is None:
+            self._journal = open(self.journal_pfad, "ab")
+        self._journal.write(json.dumps(eintrag, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._journal.flush()
+        if self.sync:
+            os.fsync(self._journal.fileno())
+        for beobachter in self.beobachter:
+            beobachter.geaendert(self, eintrag)
+        self.seq += 1
+        self.im_journal += 1
+        if self.im_journal >= self.verdichten_ab:
+            self.verdichte()
+
+    def bewerte(self, ereignis):
+        """
+        Speichert eine Bewertung.
+
+        Parameter:
+        - ereignis: dict von Planer.bewerte (id, zeit, note, intervall_vorher, intervall, ease, wiederholungen)
+        """
+        eintrag = {"art": "review", "id": ereignis["id"], "zeit": _iso(ereignis["zeit"])}
+        for name in ("note", "intervall_vorher", "intervall", "ease", "wiederholungen"):
+            eintrag[name] = ereignis[name]
+        self._schreibe(eintrag)
+
+    def neu(self, item):
+        """Neue Karte (vollständiges Item im Schema des Decks)."""
+        self._schreibe({"art": "neu", "item": item})
+
+    def aendere(self, karte, **felder):
+        """Ändert Felder einer Karte, z.B. aendere(id, answer="...")."""
+        self._schreibe({"art": "aendere", "id": karte, "felder": felder})
+
+    def loesche(self, karte):
+        self._schreibe({"art": "loesche", "id": karte})
+
+    ########################################
+    # SNAPSHOT
+    ########################################
+
+    def verdichte(self):
+        """Schreibt den Snapshot (atomar) und leert danach das Journal."""
+        self.daten[SCHEMA_FELDER[self.schema]["gespeichert"]] = datetime.now().isoformat()
+        self.daten["journal_seq"] = self.seq
+        temp = self.pfad + ".tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            if len(self.items) <= EINGERUECKT_BIS:
+                json.dump(self.daten, file, ensure_ascii=False, indent=2)
+            else:
+                file.write(json.dumps(self.daten, ensure_ascii=False))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, self.pfad)
+        _fsync_ordner(os.path.dirname(self.pfad))
+        for beobachter in self.beobachter:
+            beobachter.verdichtet(self)
+
+        # Ab hier steht alles im Snapshot - alte Journal-Zeilen würden ohnehin übersprungen
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if os.path.exists(self.journal_pfad):
+            os.truncate(self.journal_pfad, 0)
+        self.im_journal = 0
+
+    def schliesse(self, verdichten=False):
+        """Schließt das Journal (mit verdichten=True vorher noch ein Snapshot)."""
+        if verdichten:
+            self.verdichte()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+########################################
+# BENCHMARK
+########################################
+
+def benchmark(karten=100_000, reviews=1_000_000):
+    import random
+    import shutil
+    import sys
+    import tempfile
+    import time
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from planer import Planer
+
+    ordner = tempfile.mkdtemp()
+    pfad = os.path.join(ordner, "deck.json")
+    jetzt = time.time()
+    with open(pfad, "w", encoding="utf-8") as file:
+        json.dump({"items": [{"id": f"item_{nummer}", "prompt": f"Frage {nummer}", "answer": "Antwort",
+                              "interval_days": 1, "ease_factor": 2.5, "repetitions": 0,
+                              "created_at": _iso(jetzt), "feedback_log": []}
+                             for nummer in range(karten)]}, file)
+    groesse = os.path.getsize(pfad)
+
+    zufall = random.Random(0)
+    deck = Deck.oeffne(pfad, sync=False, verdichten_ab=reviews + 1)  # für die Messung: alles im Journal
+    planer = Planer.aus_items(deck.items, jetzt)
+    start = time.perf_counter()
+    for nummer in range(reviews):
+        karte = f"item_{zufall.randrange(karten)}"
+        deck.bewerte(planer.bewerte(karte, zufall.randint(1, 4), jetzt + nummer))
+    schreiben = time.perf_counter() - start
+    deck.schliesse()
+    pro_review = os.path.getsize(deck.journal_pfad) / reviews
+
+    start = time.perf_counter()
+    Deck.oeffne(pfad)
+    nachspielen = time.perf_counter() - start
+
+    deck = Deck.oeffne(pfad)
+    start = time.perf_counter()
+    deck.verdichte()
+    verdichten = time.perf_counter() - start
+
+    start = time.perf_counter()
+    Deck.oeffne(pfad)
+    snapshot = time.perf_counter() - start
+
+    print(f"{karten:,} Karten, {reviews:,} Bewertungen")
+    print(f"  vorher pro Bewertung: ganze Datei = {groesse / 1e6:.1f} MB (wächst mit jeder Bewertung)")
+    print(f"  Journal pro Bewertung: {pro_review:.0f} Bytes, {reviews / schreiben:,.0f} Bewertungen/s (ohne fsync)")
+    print(f"  Öffnen + {reviews:,} Einträge nachspielen: {nachspielen:.2f} s "
+          f"(im Betrieb höchstens {VERDICHTEN_AB:,}, dann kommt ein Snapshot)")
+    print(f"  Snapshot schreiben: {verdichten:.2f} s, danach öffnen: {snapshot:.2f} s "
+          f"({os.path.getsize(pfad) / 1e6:.0f} MB)")
+    shutil.rmtree(ordner)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Deck mit Journal öffnen / verdichten")
+    parser.add_argument("deck", nargs="?")
+    parser.add_argument("--verdichte", action="store_true", help="Snapshot schreiben und Journal leeren")
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark()
+    elif args.deck:
+        deck = Deck.oeffne(args.deck)
+        print(f"📚 {len(deck.items)} Karten, {deck.im_journal} Einträge im Journal")
+        deck.schliesse(verdichten=args.verdichte)
+    else:
+        parser.error("Deck-Datei oder --benchmark angeben")
@@ -0,0 +1,261 @@
+########################################
+# NEURO-KARTEN: ein Lader für beide Deck-Schemas 🗂️
+########################################
+# Es gibt zwei Deck-Formate:
+#   neurogame_data.json  - prompt/answer/image_path/ease_factor/feedback_log
+#   neurogame_daten.json - frage/antwort/intervall_tage/bewertungen
+# Beide werden hier in dieselbe kleine Karte übersetzt:
+# - Karte mit __slots__ (kein __dict__ pro Karte)
+# - Zeiten als ganze Zahl: Mikrosekunden seit 1970 statt ISO-Text
+# - ids mit sys.intern (kommen im Journal/Planer immer wieder vor)
+# - Verlauf als ReviewVerlauf (typisierte Arrays, siehe verlauf.py),
+#   Einträge (zeit_us, note, intervall_vorher) - alle Karten eines Decks
+#   teilen sich dieselben VerlaufSpalten
+#
+# Große Dateien werden Item für Item gelesen (JSONDecoder.raw_decode
+# auf einem Puffer) - es liegt nie das ganze Deck als dict im Speicher.
+#
+# Beispiele:
+#   karten, info = lade_karten("neurogame_daten.json")
+#   karten[0].frage, karten[0].letztes_review
+#   python karten.py neurogame_data.json --speicher
+#   python karten.py neurogame_daten.json --nach en --ausgabe deck_en.json
+########################################
+
+import json
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from verlauf import ReviewVerlauf, VerlaufSpalten, zeit_iso, zeit_us
+
+START_EASE = 2.5
+BLOCK = 1 << 16  # Zeichen pro Lese-Block
+
+_DECODER = json.JSONDecoder()
+_LEER = " \t\r\n"
+
+
+class Karte:
+    __slots__ = ("id", "frage", "antwort", "bild", "erstellt", "letztes_review",
+                 "intervall", "ease", "wiederholungen", "verlauf")
+
+    def __init__(self, id, frage, antwort, bild=None, erstellt=None, letztes_review=None,
+                 intervall=1, ease=START_EASE, wiederholungen=0, verlauf=None):
+        self.id = sys.intern(id)
+        self.frage = frage
+        self.antwort = antwort
+        self.bild = bild
+        self.erstellt = erstellt
+        self.letztes_review = letztes_review
+        self.intervall = intervall
+        self.ease = ease
+        self.wiederholungen = wiederholungen
+        self.verlauf = verlauf if verlauf is not None else ReviewVerlauf()
+
+    @classmethod
+    def aus_item(cls, item, spalten=None):
+        """
+        Karte aus einem Item in einem der beiden Schemas.
+
+        Parameter:
+        - spalten: VerlaufSpalten des Decks, in die der Verlauf kommt
+        """
+        if "frage" in item or "bewertungen" in item:
+            verlauf = ReviewVerlauf.aus_dicts(item.get("bewertungen", ()), spalten)
+            return cls(item["id"], item.get("frage", ""), item.get("antwort", ""),
+                       bild=item.get("bild"),
+                       erstellt=zeit_us(item.get("erstellt_am")),
+                       letztes_review=zeit_us(item.get("letztes_review")),
+                       intervall=item.get("intervall_tage", 1),
+                       ease=item.get("ease_faktor", START_EASE),
+                       wiederholungen=item.get("wiederholungen", 0),
+                       verlauf=verlauf)
+        verlauf = ReviewVerlauf.aus_dicts(item.get("feedback_log", ()), spalten)
+        return cls(item["id"], item.get("prompt", ""), item.get("answer", ""),
+                   bild=item.get("image_path"),
+                   erstellt=zeit_us(item.get("created_at")),
+                   letztes_review=zeit_us(item.get("last_review")),
+                   intervall=item.get("interval_days", 1),
+                   ease=item.get("ease_factor", START_EASE),
+                   wiederholungen=item.get("repetitions", 0),
+                   verlauf=verlauf)
+
+    def als_item(self, schema="en"):
+        """Zurück in ein Deck-Item ("en" = neurogame_data, "de" = neurogame_daten)."""
+        if schema == "de":
+            item = {"id": self.id, "frage": self.frage, "antwort": self.antwort,
+                    "letztes_review": zeit_iso(self.letztes_review), "intervall_tage": self.intervall,
+                    "ease_faktor": self.ease, "wiederholungen": self.wiederholungen,
+                    "bewertungen": self.verlauf.als_dicts("de"),
+                    "erstellt_am": zeit_iso(self.erstellt)}
+            if self.bild:
+                item["bild"] = self.bild
+            return item
+        return {"id": self.id, "prompt": self.frage, "answer": self.antwort, "image_path": self.bild,
+                "last_review": zeit_iso(self.letztes_review), "interval_days": self.intervall,
+                "ease_factor": self.ease, "repetitions": self.wiederholungen,
+                "feedback_log": self.verlauf.als_dicts("en"),
+                "created_at": zeit_iso(self.erstellt)}
+
+    def __repr__(self):
+        return f"Karte({self.id!r}, {self.frage!r})"
+
+
+########################################
+# STREAMING-LESER
+########################################
+
+def lese_items(pfad, info=None):
+    """
+    Liest die Items eines Decks einzeln, ohne die ganze Datei zu laden.
+
+    Parameter:
+    - pfad: Deck-Datei ({"items": [...], ...})
+    - info: dict, in das die übrigen Schlüssel (last_save, journal_seq, ...) kommen
+
+    Liefert:
+    - ein Item (dict) nach dem anderen
+    """
+    info = {} if info is None else info
+    with open(pfad, "r", encoding="utf-8") as file:
+        puffer = file.read(BLOCK)
+        # bis zum Anfang der Liste "items": [
+        while True:
+            start = puffer.find('"items"')
+            klammer = puffer.find("[", start) if start >= 0 else -1
+            if klammer >= 0:
+                break
+            mehr = file.read(BLOCK)
+            if not mehr:
+                raise ValueError(f"{pfad}: keine Liste 'items' gefunden")
+            puffer += mehr
+        vorne = puffer[puffer.index("{") + 1:start].strip().rstrip(",")
+        if vorne:
+            info.update(json.loads("{" + vorne + "}"))
+        puffer = puffer[klammer + 1:]
+        pos = 0
+
+        while True:
+            while pos < len(puffer) and (puffer[pos] in _LEER or puffer[pos] == ","):
+                pos += 1
+            if pos < len(puffer) and puffer[pos] == "]":
+                break
+            try:
+                item, ende = _DECODER.raw_decode(puffer, pos)
+            except json.JSONDecodeError:
+                mehr = file.read(BLOCK)
+                if not mehr:
+                    raise
+                puffer = puffer[pos:] + mehr
+                pos = 0
+                continue
+            yield item
+            pos = ende
+            if pos > BLOCK:
+                puffer = puffer[pos:]
+                pos = 0
+
+        hinten = (puffer[pos + 1:] + file.read()).strip()
+        if hinten.startswith(","):
+            info.update(json.loads("{" + hinten[1:]))
+
+
+def lade_karten(pfad):
+    """
+    Lädt ein Deck (beliebiges Schema) als Liste von Karten.
+
+    Rückgabe:
+    - (karten, info): info enthält die übrigen Schlüssel der Datei und "schema"
+    """
+    info = {}
+    karten = []
+    schema = None
+    spalten = VerlaufSpalten()
+    for item in lese_items(pfad, info):
+        if schema is None:
+            schema = "de" if "frage" in item or "bewertungen" in item else "en"
+        karten.append(Karte.aus_item(item, spalten))
+    info["schema"] = schema or "en"
+    return karten, info
+
+
+def speichere_karten(karten, pfad, schema="en"):
+    """Schreibt Karten als Deck im gewünschten Schema (z.B. zum Umstellen eines Decks)."""
+    gespeichert = "gespeichert_am" if schema == "de" else "last_save"
+    with open(pfad, "w", encoding="utf-8") as file:
+        json.dump({"items": [karte.als_item(schema) for karte in karten],
+                   gespeichert: datetime.now().isoformat()}, file, ensure_ascii=False, indent=2)
+
+
+########################################
+# SPEICHER-BERICHT
+########################################
+
+def speicher_bericht(pfad):
+    """Misst mit tracemalloc: Bytes pro Item mit json.load gegenüber Karten aus dem Streaming-Leser."""
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    with open(pfad, "r", encoding="utf-8") as file:
+        daten = json.load(file)
+    vorher, spitze_vorher = tracemalloc.get_traced_memory()
+    anzahl = len(daten["items"])
+    del daten
+    gc.collect()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    karten, _ = lade_karten(pfad)
+    nachher, spitze_nachher = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del karten
+
+    anzahl = max(anzahl, 1)
+    print(f"📊 {anzahl:,} Items")
+    print(f"   json.load (dicts + ISO-Texte): {vorher / anzahl:8.0f} Bytes/Item, Spitze {spitze_vorher / 1e6:7.1f} MB")
+    print(f"   Karten (__slots__, Zeiten int): {nachher / anzahl:8.0f} Bytes/Item, Spitze {spitze_nachher / 1e6:7.1f} MB")
+
+
+def beispiel_deck(pfad, anzahl, reviews=5):
+    """Schreibt ein künstliches Deck (englisches Schema) für Messungen."""
+    jetzt = datetime.now().isoformat()
+    with open(pfad, "w", encoding="utf-8") as file:
+        json.dump({"items": [{"id": f"item_{nummer:08d}", "prompt": f"Frage Nummer {nummer}",
+                              "answer": f"Antwort {nummer}", "image_path": None, "last_review": jetzt,
+                              "interval_days": 6, "ease_factor": 2.5, "repetitions": 2,
+                              "feedback_log": [{"timestamp": jetzt, "score": 3, "interval_before": 1}] * reviews,
+                              "created_at": jetzt}
+                             for nummer in range(anzahl)], "last_save": jetzt}, file, indent=2)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Decks laden, umstellen und vermessen")
+    parser.add_argument("deck", nargs="?")
+    parser.add_argument("--speicher", action="store_true", help="Bytes pro Item messen")
+    parser.add_argument("--beispiel", type=int, help="künstliches Deck mit so vielen Items anlegen")
+    parser.add_argument("--nach", choices=["en", "de"], help="in dieses Schema umstellen")
+    parser.add_argument("--ausgabe", help="Ziel-Datei für --nach")
+    args = parser.parse_args()
+
+    if args.beispiel:
+        beispiel_deck(args.deck or "beispiel_deck.json", args.beispiel)
+    deck = args.deck or ("beispiel_deck.json" if args.beispiel else None)
+    if not deck:
+        parser.error("Deck-Datei angeben")
+    if args.speicher:
+        speicher_bericht(deck)
+    if args.nach:
+        karten, info = lade_karten(deck)
+        speichere_karten(karten, args.ausgabe or deck, args.nach)
+        print(f"✅ {len(karten)} Karten von {info['schema']} nach {args.nach} umgestellt")
+    if not args.speicher and not args.nach:
+        karten, info = lade_karten(deck)
+        print(f"📚 {len(karten)} Karten, Schema {info['schema']}")
+        for karte in karten[:5]:
+            print(f"   {karte.id}: {karte.frage}")
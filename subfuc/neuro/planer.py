@@ -0,0 +1,329 @@
+########################################
+# NEURO-PLANER: welche Karte ist als nächstes dran? 🧠
+########################################
+# Spaced Repetition für die NeuroGame-Decks (neurogame_data.json und
+# neurogame_daten.json). Statt bei jeder Frage alle Karten durchzugehen:
+# - ein Heap nach Fälligkeit: nächste Karte in O(log n)
+# - nach einer Bewertung kommt die Karte mit neuer Fälligkeit wieder
+#   in den Heap, der alte Eintrag bleibt liegen und wird beim Herausholen
+#   übersprungen (er passt nicht mehr zur Versions-Nummer der Karte)
+# - "wie viele sind heute fällig" steht in einem Zähler: Karten, die bis
+#   heute fällig sind, plus ein Fach pro späterem Tag. Bricht ein neuer
+#   Tag an, wird nur dessen Fach dazugezählt.
+#
+# Regel (wie SM-2, Noten 1-4):
+#   1 = nochmal, 2 = schwer -> Wiederholungen auf 0, Intervall 1 Tag, Ease -0.2
+#   3 = gut                 -> Intervall 1, dann 6, dann Intervall * Ease
+#   4 = leicht              -> wie 3, aber Ease +0.15 und Intervall * 1.3
+#   Ease nie unter 1.3
+#
+# Beispiele:
+#   planer = Planer.aus_deck("neurogame_data.json")
+#   karte = planer.naechste()
+#   planer.bewerte(karte, 3)
+#   planer.faellig_heute()
+#
+#   python planer.py neurogame_data.json
+#   python planer.py --benchmark 100000 1000000
+########################################
+
+import heapq
+import json
+import time
+from datetime import datetime
+
+TAG = 86400
+START_EASE = 2.5
+MIN_EASE = 1.3
+
+# Feldnamen der beiden Deck-Schemas: englisch (neurogame_data) / deutsch (neurogame_daten)
+FELDER = {
+    "letztes_review": ("last_review", "letztes_review"),
+    "intervall": ("interval_days", "intervall_tage"),
+    "ease": ("ease_factor", "ease_faktor"),
+    "wiederholungen": ("repetitions", "wiederholungen"),
+    "erstellt": ("created_at", "erstellt_am"),
+}
+
+
+def versatz(zeit):
+    """Abstand der Ortszeit zu UTC in Sekunden zu diesem Zeitpunkt (Sommerzeit zählt mit)."""
+    return time.localtime(zeit).tm_gmtoff
+
+
+def tag_von(zeit):
+    """Nummer des Tages (Ortszeit) für einen Unix-Zeitpunkt - Tage beginnen um Mitternacht Ortszeit."""
+    return int((zeit + versatz(zeit)) // TAG)
+
+
+def naechster_zustand(intervall, ease, wiederholungen, note):
+    """
+    Neuer Zustand einer Karte nach einer Bewertung.
+
+    Parameter:
+    - intervall: bisheriges Intervall in Tagen
+    - ease: bisheriger Ease-Faktor
+    - wiederholungen: bisher richtige Wiederholungen am Stück
+    - note: 1 (nochmal) bis 4 (leicht)
+
+    Rückgabe:
+    - (intervall, ease, wiederholungen)
+    """
+    if note <= 2:
+        return 1, max(MIN_EASE, round(ease - 0.2, 2)), 0
+    if note >= 4:
+        ease = round(ease + 0.15, 2)
+    wiederholungen += 1
+    if wiederholungen == 1:
+        intervall = 1
+    elif wiederholungen == 2:
+        intervall = 6
+    else:
+        intervall = round(intervall * ease)
+    if note >= 4:
+        intervall = round(intervall * 1.3)
+    return intervall, ease, wiederholungen
+
+
+def _feld(item, name, standard=None):
+    for schluessel in FELDER[name]:
+        if item.get(schluessel) is not None:
+            return item[schluessel]
+    return standard
+
+
+def _zeit(text):
+    return datetime.fromisoformat(text).timestamp() if text else None
+
+
+class Planer:
+    def __init__(self):
+        self.karten = {}      # id -> [faellig, intervall, ease, wiederholungen, version]
+        self._heap = []       # (faellig, version, id) - alte Versionen werden übersprungen
+        self._version = 0
+        self._stichtag = tag_von(time.time())  # bis hier ist _bis_heute gezählt (läuft nur vorwärts)
+        self._bis_heute = 0   # Karten fällig an Tagen <= _stichtag
+        self._pro_tag = {}    # Tag -> Anzahl Karten, fällig an diesem (späteren) Tag
+
+    ########################################
+    # LADEN
+    ########################################
+
+    @classmethod
+    def aus_items(cls, items, jetzt=None):
+        """
+        Baut den Planer aus Deck-Items (beide Schemas).
+
+        Karten ohne Review sind ab ihrer Erstellung fällig.
+        """
+        planer = cls()
+        planer._stichtag = tag_von(time.time() if jetzt is None else jetzt)
+        for item in items:
+            letztes = _zeit(_feld(item, "letztes_review"))
+            intervall = _feld(item, "intervall", 1)
+            if letztes is None:
+                faellig = _zeit(_feld(item, "erstellt")) or 0.0
+            else:
+                faellig = letztes + intervall * TAG
+            planer._setze(item["id"], faellig, intervall,
+                          _feld(item, "ease", START_EASE), _feld(item, "wiederholungen", 0))
+        heapq.heapify(planer._heap)  # einmal O(n) statt n-mal O(log n)
+        return planer
+
+    @classmethod
+    def aus_karten(cls, karten, jetzt=None):
+        """Wie aus_items, aber für Karten aus karten.lade_karten (Zeiten in Mikrosekunden)."""
+        planer = cls()
+        planer._stichtag = tag_von(time.time() if jetzt is None else jetzt)
+        for karte in karten:
+            if karte.letztes_review is None:
+                faellig = (karte.erstellt or 0) / 1_000_000
+            else:
+                faellig = karte.letztes_review / 1_000_000 + karte.intervall * TAG
+            planer._setze(karte.id, faellig, karte.intervall, karte.ease, karte.wiederholungen)
+        heapq.heapify(planer._heap)
+        return planer
+
+    @classmethod
+    def aus_deck(cls, pfad, jetzt=None):
+        with open(pfad, "r", encoding="utf-8") as file:
+            return cls.aus_items(json.load(file)["items"], jetzt)
+
+    ########################################
+    # INTERNER ZUSTAND
+    ########################################
+
+    def _zaehle(self, faellig, delta):
+        tag = tag_von(faellig)
+        if tag <= self._stichtag:
+            self._bis_heute += delta
+        else:
+            anzahl = self._pro_tag.get(tag, 0) + delta
+            if anzahl:
+                self._pro_tag[tag] = anzahl
+            else:
+                del self._pro_tag[tag]
+
+    def _setze(self, karte, faellig, intervall, ease, wiederholungen, push=False):
+        alt = self.karten.get(karte)
+        if alt is not None:
+            self._zaehle(alt[0], -1)
+        self._version += 1
+        self.karten[karte] = [faellig, intervall, ease, wiederholungen, self._version]
+        self._zaehle(faellig, +1)
+        eintrag = (faellig, self._version, karte)
+        if push:
+            heapq.heappush(self._heap, eintrag)
+            if len(self._heap) > 2 * len(self.karten) + 1024:
+                self._verdichte()
+        else:
+            self._heap.append(eintrag)
+
+    def _verdichte(self):
+        """Baut den Heap neu, ohne die übersprungenen alten Einträge."""
+        self._heap = [(zustand[0], zustand[4], karte) for karte, zustand in self.karten.items()]
+        heapq.heapify(self._heap)
+
+    def _rolle_bis(self, tag):
+        """Zählt die Fächer aller Tage bis `tag` zu _bis_heute dazu."""
+        if tag <= self._stichtag:
+            return
+        if tag - self._stichtag > len(self._pro_tag):
+            # großer Sprung: lieber die (wenigen) Fächer durchgehen
+            for fach in [t for t in self._pro_tag if t <= tag]:
+                self._bis_heute += self._pro_tag.pop(fach)
+        else:
+            for fach in range(self._stichtag + 1, tag + 1):
+                self._bis_heute += self._pro_tag.pop(fach, 0)
+        self._stichtag = tag
+
+    ########################################
+    # ABFRAGEN
+    ########################################
+
+    def naechste(self, jetzt=None, nur_faellige=True):
+        """
+        Die Karte mit der frühesten Fälligkeit (O(log n), alte Heap-Einträge fallen dabei raus).
+
+        Rückgabe:
+        - id der Karte, oder None (keine Karte / keine fällig)
+        """
+        heap = self._heap
+        while heap:
+            faellig, version, karte = heap[0]
+            zustand = self.karten.get(karte)
+            if zustand is None or zustand[4] != version:
+                heapq.heappop(heap)
+                continue
+            if nur_faellige and faellig > (time.time() if jetzt is None else jetzt):
+                return None
+            return karte
+        return None
+
+    def faellig_heute(self, jetzt=None):
+        """Wie viele Karten sind bis heute Abend fällig? (O(1), pro neuem Tag ein Fach)"""
+        self._rolle_bis(tag_von(time.time() if jetzt is None else jetzt))
+        return self._bis_heute
+
+    def faellig_am(self, karte):
+        """Unix-Zeitpunkt, ab dem die Karte fällig ist."""
+        return self.karten[karte][0]
+
+    def __len__(self):
+        return len(self.karten)
+
+    ########################################
+    # ÄNDERN
+    ########################################
+
+    def bewerte(self, karte, note, jetzt=None):
+        """
+        Trägt eine Bewertung ein und plant die Karte neu.
+
+        Rückgabe (dict, zum Speichern):
+        - id, zeit, note, intervall_vorher, intervall, ease, wiederholungen
+        """
+        jetzt = time.time() if jetzt is None else jetzt
+        self._rolle_bis(tag_von(jetzt))
+        _, intervall_vorher, ease, wiederholungen, _ = self.karten[karte]
+        intervall, ease, wiederholungen = naechster_zustand(intervall_vorher, ease, wiederholungen, note)
+        self._setze(karte, jetzt + intervall * TAG, intervall, ease, wiederholungen, push=True)
+        return {"id": karte, "zeit": jetzt, "note": note, "intervall_vorher": intervall_vorher,
+                "intervall": intervall, "ease": ease, "wiederholungen": wiederholungen}
+
+    def neue_karte(self, karte, jetzt=None):
+        """Nimmt eine neue Karte auf - sofort fällig."""
+        jetzt = time.time() if jetzt is None else jetzt
+        self._rolle_bis(tag_von(jetzt))
+        self._setze(karte, jetzt, 1, START_EASE, 0, push=True)
+
+    def entferne(self, karte):
+        """Nimmt eine Karte heraus (ihr Heap-Eintrag wird später übersprungen)."""
+        zustand = self.karten.pop(karte)
+        self._zaehle(zustand[0], -1)
+
+
+########################################
+# BENCHMARK
+########################################
+
+def benchmark(groessen=(100_000, 1_000_000), reviews=100_000):
+    import random
+
+    zufall = random.Random(0)
+    jetzt = time.time()
+    for anzahl in groessen:
+        items = [{"id": f"item_{nummer}",
+                  "last_review": datetime.fromtimestamp(jetzt - zufall.uniform(0, 60) * TAG).isoformat(),
+                  "interval_days": zufall.randint(1, 60), "ease_factor": 2.5, "repetitions": 2}
+                 for nummer in range(anzahl)]
+
+        start = time.perf_counter()
+        planer = Planer.aus_items(items, jetzt)
+        laden = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for runde in range(reviews):
+            karte = planer.naechste(jetzt)
+            if karte is None:
+                break
+            planer.bewerte(karte, 1 + runde % 4, jetzt)
+        review = (time.perf_counter() - start) / max(runde, 1)
+
+        start = time.perf_counter()
+        for _ in range(reviews):
+            planer.faellig_heute(jetzt)
+        zaehlen = (time.perf_counter() - start) / reviews
+
+        # Vergleich: alles durchsuchen wie bisher
+        start = time.perf_counter()
+        min(planer.karten.items(), key=lambda paar: paar[1][0])
+        scan = time.perf_counter() - start
+
+        print(f"{anzahl:>9,} Karten | Aufbau {laden:5.2f} s | naechste+bewerte {review * 1e6:5.1f} µs | "
+              f"faellig_heute {zaehlen * 1e6:4.2f} µs | Scan {scan * 1e3:6.1f} ms "
+              f"| heute fällig: {planer.faellig_heute(jetzt):,}")
+
+
+def main(argumente=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Spaced-Repetition-Planer für NeuroGame-Decks")
+    parser.add_argument("deck", nargs="?", help="z.B. neurogame_data.json")
+    parser.add_argument("--benchmark", type=int, nargs="*", help="Deck-Größen, z.B. 100000 1000000")
+    args = parser.parse_args(argumente)
+
+    if args.benchmark is not None:
+        benchmark(args.benchmark or (100_000, 1_000_000))
+        return
+    if not args.deck:
+        parser.error("Deck-Datei oder --benchmark angeben")
+    planer = Planer.aus_deck(args.deck)
+    karte = planer.naechste(nur_faellige=False)
+    print(f"📚 {len(planer)} Karten, heute fällig: {planer.faellig_heute()}")
+    if karte is not None:
+        print(f"➡️  Nächste: {karte} (fällig {datetime.fromtimestamp(planer.faellig_am(karte)):%d.%m.%Y %H:%M})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+########################################
+# NEURO-SUCHE: Volltext-Index über Fragen und Antworten 🔎
+########################################
+# Statt alle Karten nach einem Teil-Text zu durchsuchen, gibt es einen
+# invertierten Index: Wort -> (Karten-Nummern, Anzahl im Text).
+#
+# Normalisierung (für Index und Anfrage gleich):
+#   "Größe der Ähre" -> ["groesse", "der", "aehre"]
+#   - casefold (ß -> ss), ä/ö/ü -> ae/oe/ue, Wörter = Buchstaben/Ziffern
+# Das letzte Wort der Anfrage zählt auch als Anfang ("haupt" findet
+# "hauptstadt") - wie bisher beim Teil-Text-Suchen.
+#
+# Rangfolge nach BM25: seltene Wörter zählen mehr, mehrfache Treffer
+# zählen weniger als doppelt, lange Texte werden etwas abgewertet.
+#
+# Aktuell halten:
+# - am Deck aus journal.py angehängt (deck.beobachter): neu/aendere/
+#   loesche ändern den Index sofort, gelöschte Karten werden nur
+#   markiert und beim Speichern aussortiert
+# - gespeichert neben dem Deck als "<deck>.suche.npz", immer wenn das
+#   Deck einen Snapshot schreibt, mit der Journal-Nummer des Snapshots.
+#   Beim Öffnen werden nur die neueren Journal-Zeilen nachgespielt.
+#
+# Beispiele:
+#   deck = Deck.oeffne("neurogame_data.json")
+#   index = SuchIndex.fuer_deck(deck)
+#   index.suche("hauptstadt frankreich")   -> [(id, punkte), ...]
+#
+#   python suche.py neurogame_daten.json "gehirn"
+#   python suche.py --benchmark 1000000
+########################################
+
+import json
+import math
+import os
+import re
+import sys
+import unicodedata
+from array import array
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from journal import _DECODER, schema_von
+
+K1 = 1.2
+B = 0.75
+MAX_TREFFER = 20
+PRAEFIX_MAX = 64      # so viele Wörter darf ein Wort-Anfang höchstens abdecken
+VERSION = 1
+
+TEXT_FELDER = {"en": ("prompt", "answer"), "de": ("frage", "antwort")}
+_WORT = re.compile(r"[^\W_]+")
+
+
+def woerter(text):
+    """Text -> normalisierte Wörter (casefold, Umlaute ausgeschrieben)."""
+    text = unicodedata.normalize("NFC", text).casefold()
+    if not text.isascii():
+        text = text.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue")
+    return _WORT.findall(text)
+
+
+def text_von(item):
+    """Frage und Antwort eines Items (beide Schemas)."""
+    frage, antwort = TEXT_FELDER[schema_von(item)]
+    return f"{item.get(frage) or ''} {item.get(antwort) or ''}"
+
+
+class SuchIndex:
+    def __init__(self, pfad=None):
+        """
+        Parameter:
+        - pfad: Datei für speichere() (meist "<deck>.suche.npz")
+        """
+        self.pfad = pfad
+        self.seq = 0                  # Journal-Nummer, bis zu der der Index aktuell ist
+        self._posten = {}             # Wort -> [array('I') Nummern, array('H') Anzahl]
+        self._ids = []                # Nummer -> Karten-id (None = gelöscht)
+        self._lebt = bytearray()      # Nummer -> 1 / 0 (gelöscht)
+        self._laengen = array("I")    # Nummer -> Wörter im Text
+        self._nummer = {}             # Karten-id -> Nummer
+        self._laenge_summe = 0
+        self._geloescht = 0
+        self._sortiert = None         # alle Wörter sortiert, für Wort-Anfänge (wird bei Bedarf gebaut)
+
+    ########################################
+    # ÄNDERN
+    ########################################
+
+    def fuege_hinzu(self, karte, text):
+        """Karte indexieren (eine vorhandene Karte mit derselben id wird ersetzt)."""
+        if karte in self._nummer:
+            self.entferne(karte)
+        nummer = len(self._ids)
+        liste = woerter(text)
+        for wort, wie_oft in Counter(liste).items():
+            posten = self._posten.get(wort)
+            if posten is None:
+                posten = self._posten[wort] = [array("I"), array("H")]
+                self._sortiert = None
+            posten[0].append(nummer)
+            posten[1].append(wie_oft if wie_oft < 65536 else 65535)
+        self._ids.append(karte)
+        self._lebt.append(1)
+        self._laengen.append(len(liste))
+        self._nummer[karte] = nummer
+        self._laenge_summe += len(liste)
+
+    def entferne(self, karte):
+        """Karte aus der Suche nehmen (nur markiert, aufgeräumt wird in verdichte())."""
+        nummer = self._nummer.pop(karte, None)
+        if nummer is None:
+            return
+        self._ids[nummer] = None
+        self._lebt[nummer] = 0
+        self._laenge_summe -= self._laengen[nummer]
+        self._geloescht += 1
+        if self._geloescht > max(1024, len(self._nummer)):
+            self.verdichte()  # mehr Leichen als Karten
+
+    def aendere(self, karte, text):
+        self.fuege_hinzu(karte, text)
+
+    def verdichte(self):
+        """Gelöschte Karten wirklich entfernen und neu durchnummerieren."""
+        if not self._geloescht:
+            return
+        alt = np.frombuffer(self._lebt, dtype=np.bool_)
+        neu_nummer = np.cumsum(alt, dtype=np.int64) - 1
+        for wort in list(self._posten):
+            nummern, anzahl = self._posten[wort]
+            nummern_np = np.frombuffer(nummern, dtype=np.uint32)
+            behalten = alt[nummern_np]
+            if not behalten.any():
+                del self._posten[wort]
+                self._sortiert = None
+                continue
+            if behalten.all():
+                self._posten[wort][0] = array("I", neu_nummer[nummern_np].astype(np.uint32).tobytes())
+                continue
+            self._posten[wort] = [array("I", neu_nummer[nummern_np[behalten]].astype(np.uint32).tobytes()),
+                                  array("H", np.frombuffer(anzahl, dtype=np.uint16)[behalten].tobytes())]
+        self._laengen = array("I", np.frombuffer(self._laengen, dtype=np.uint32)[alt].tobytes())
+        self._ids = [karte for karte in self._ids if karte is not None]
+        self._lebt = bytearray(b"\x01") * len(self._ids)
+        self._nummer = {karte: nummer for nummer, karte in enumerate(self._ids)}
+        self._geloescht = 0
+
+    def __len__(self):
+        return len(self._nummer)
+
+    ########################################
+    # SUCHEN
+    ########################################
+
+    def _erweitere(self, anfang):
+        """Alle Wörter, die mit anfang beginnen (höchstens PRAEFIX_MAX)."""
+        from bisect import bisect_left
+
+        if self._sortiert is None:
+            self._sortiert = sorted(self._posten)
+        start = bisect_left(self._sortiert, anfang)
+        treffer = []
+        for wort in self._sortiert[start:start + PRAEFIX_MAX]:
+            if not wort.startswith(anfang):
+                break
+            treffer.append(wort)
+        return treffer
+
+    def suche(self, anfrage, anzahl=MAX_TREFFER, praefix=True):
+        """
+        Karten nach BM25 sortiert.
+
+        Parameter:
+        - anfrage: freier Text
+        - anzahl: höchstens so viele Treffer
+        - praefix: letztes Wort auch als Wort-Anfang suchen
+
+        Rückgabe:
+        - Liste (karten_id, punkte), beste zuerst
+        """
+        liste = woerter(anfrage)
+        if not liste or not self._nummer:
+            return []
+        if praefix:
+            liste += self._erweitere(liste[-1])
+
+        karten_gesamt = len(self._nummer)
+        mittel = self._laenge_summe / karten_gesamt or 1.0
+        laengen = np.frombuffer(self._laengen, dtype=np.uint32)
+        lebendig = np.frombuffer(self._lebt, dtype=np.bool_) if self._geloescht else None
+
+        alle_nummern, alle_punkte = [], []
+        for wort in dict.fromkeys(liste):
+            posten = self._posten.get(wort)
+            if posten is None:
+                continue
+            nummern = np.frombuffer(posten[0], dtype=np.uint32)
+            wie_oft = np.frombuffer(posten[1], dtype=np.uint16).astype(np.float64)
+            if lebendig is not None:
+                maske = lebendig[nummern]
+                nummern, wie_oft = nummern[maske], wie_oft[maske]
+            df = len(nummern)
+            if not df:
+                continue
+            idf = math.log(1 + (karten_gesamt - df + 0.5) / (df + 0.5))
+            norm = K1 * (1 - B + B * laengen[nummern] / mittel)
+            alle_nummern.append(nummern)
+            alle_punkte.append(idf * wie_oft * (K1 + 1) / (wie_oft + norm))
+        if not alle_nummern:
+            return []
+
+        if len(alle_nummern) == 1:
+            nummern, punkte = alle_nummern[0], alle_punkte[0]
+        else:
+            nummern, stelle = np.unique(np.concatenate(alle_nummern), return_inverse=True)
+            punkte = np.bincount(stelle, weights=np.concatenate(alle_punkte))
+        if len(punkte) > anzahl:
+            beste = np.argpartition(-punkte, anzahl - 1)[:anzahl]
+        else:
+            beste = np.arange(len(punkte))
+        beste = beste[np.lexsort((nummern[beste], -punkte[beste]))]
+        return [(self._ids[nummern[stelle]], float(punkte[stelle])) for stelle in beste]
+
+    ########################################
+    # DECK ANHÄNGEN
+    ########################################
+
+    @classmethod
+    def aus_items(cls, items, pfad=None):
+        index = cls(pfad)
+        for item in items:
+            index.fuege_hinzu(item["id"], text_von(item))
+        return index
+
+    @classmethod
+    def fuer_deck(cls, deck):
+        """
+        Index für ein offenes journal.Deck: laden (oder bauen), nachspielen, anhängen.
+
+        Liegt der gespeicherte Index vor dem letzten Snapshot des Decks (die
+        Journal-Zeilen dazwischen gibt es nicht mehr), wird er neu gebaut.
+        """
+        pfad = deck.pfad + ".suche.npz"
+        index = cls.lade(pfad) if os.path.exists(pfad) else None
+        if index is None or index.seq < deck.daten.get("journal_seq", 0) or index.seq > deck.seq:
+            index = cls.aus_items(deck.items, pfad)
+        elif index.seq < deck.seq:
+            index._spiele_nach(deck)
+        index.seq = deck.seq
+        deck.beobachter.append(index)
+        return index
+
+    def _spiele_nach(self, deck):
+        """Karten, die seit dem gespeicherten Index im Journal geändert wurden, neu einlesen."""
+        geaendert = set()
+        with open(deck.journal_pfad, "rb") as file:
+            for zeile in file:
+                try:
+                    eintrag = _DECODER.raw_decode(zeile.decode("utf-8"))[0]
+                except ValueError:
+                    break
+                if eintrag["seq"] >= self.seq and eintrag["art"] != "review":
+                    geaendert.add(eintrag["item"]["id"] if eintrag["art"] == "neu" else eintrag["id"])
+        for karte in geaendert:
+            item = deck.nach_id.get(karte)
+            if item is None:
+                self.entferne(karte)
+            else:
+                self.fuege_hinzu(karte, text_von(item))
+
+    def geaendert(self, deck, eintrag):
+        """Beobachter für journal.Deck: nach jedem Journal-Eintrag."""
+        art = eintrag["art"]
+        if art == "neu":
+            item = eintrag["item"]
+            self.fuege_hinzu(item["id"], text_von(item))
+        elif art == "aendere":
+            item = deck.nach_id[eintrag["id"]]
+            if set(eintrag["felder"]) & set(TEXT_FELDER[schema_von(item)]):
+                self.fuege_hinzu(item["id"], text_von(item))
+        elif art == "loesche":
+            self.entferne(eintrag["id"])
+        self.seq = deck.seq + 1
+
+    def verdichtet(self, deck):
+        """Beobachter für journal.Deck: das Deck hat einen Snapshot geschrieben."""
+        self.seq = deck.seq
+        self.speichere()
+
+    ########################################
+    # SPEICHERN + LADEN
+    ########################################
+
+    def speichere(self, pfad=None):
+        """Schreibt den Index als .npz (erst Temp-Datei, dann os.replace)."""
+        pfad = pfad or self.pfad
+        self.verdichte()
+        woerter_liste = list(self._posten)
+        anfang = np.zeros(len(woerter_liste) + 1, dtype=np.int64)
+        anfang[1:] = np.cumsum([len(self._posten[wort][0]) for wort in woerter_liste])
+        nummern = array("I")
+        anzahl = array("H")
+        for wort in woerter_liste:
+            nummern.extend(self._posten[wort][0])
+            anzahl.extend(self._posten[wort][1])
+        temp = pfad + ".tmp"
+        with open(temp, "wb") as file:
+            np.savez(file,
+                     info=np.array([VERSION, self.seq], dtype=np.int64),
+                     woerter=np.frombuffer("\n".join(woerter_liste).encode("utf-8"), dtype=np.uint8),
+                     ids=np.frombuffer(json.dumps(self._ids, ensure_ascii=False).encode("utf-8"), dtype=np.uint8),
+                     anfang=anfang,
+                     nummern=np.frombuffer(nummern, dtype=np.uint32),
+                     anzahl=np.frombuffer(anzahl, dtype=np.uint16),
+                     laengen=np.frombuffer(self._laengen, dtype=np.uint32))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, pfad)
+
+    @classmethod
+    def lade(cls, pfad):
+        """Gespeicherten Index laden (None bei anderer VERSION)."""
+        with np.load(pfad) as daten:
+            version, seq = (int(wert) for wert in daten["info"])
+            if version != VERSION:
+                return None
+            index = cls(pfad)
+            index.seq = seq
+            woerter_liste = daten["woerter"].tobytes().decode("utf-8").split("\n") if len(daten["woerter"]) else []
+            index._ids = json.loads(daten["ids"].tobytes().decode("utf-8"))
+            anfang = daten["anfang"].tolist()
+            nummern = daten["nummern"].tobytes()
+            anzahl = daten["anzahl"].tobytes()
+            index._laengen = array("I", daten["laengen"].tobytes())
+        for stelle, wort in enumerate(woerter_liste):
+            von, bis = anfang[stelle], anfang[stelle + 1]
+            index._posten[wort] = [array("I", nummern[4 * von:4 * bis]), array("H", anzahl[2 * von:2 * bis])]
+        index._lebt = bytearray(b"\x01") * len(index._ids)
+        index._nummer = {karte: nummer for nummer, karte in enumerate(index._ids)}
+        index._laenge_summe = sum(index._laengen)
+        return index
+
+
+########################################
+# BENCHMARK
+########################################
+
+def beispiel_items(anzahl, seed=0):
+    """Künstliche Karten mit deutschen Wörtern (Zipf-verteilt) für Messungen."""
+    rng = np.random.default_rng(seed)
+    silben = ["haupt", "stadt", "ge", "hirn", "zel", "le", "ner", "ven", "bahn", "über", "gröss", "äh",
+              "re", "kern", "schal", "tung", "wel", "le", "fluss", "men", "ge", "zahl", "tier", "art"]
+    vokabular = ["".join(rng.choice(silben, size=rng.integers(1, 4))) + str(nummer % 7 or "")
+                 for nummer in range(50_000)]
+    gewichte = 1 / np.arange(1, len(vokabular) + 1)
+    gewichte /= gewichte.sum()
+    laengen = rng.integers(3, 12, size=anzahl)
+    alle = rng.choice(len(vokabular), size=int(laengen.sum()), p=gewichte)
+    items, pos = [], 0
+    for nummer, laenge in enumerate(laengen.tolist()):
+        teil = [vokabular[wort] for wort in alle[pos:pos + laenge]]
+        pos += laenge
+        items.append({"id": f"item_{nummer:08d}", "prompt": " ".join(teil[:laenge // 2]).capitalize() + "?",
+                      "answer": " ".join(teil[laenge // 2:])})
+    return items, vokabular
+
+
+def benchmark(anzahl=1_000_000, anfragen=200):
+    import tempfile
+    import time
+
+    items, vokabular = beispiel_items(anzahl)
+    rng = np.random.default_rng(1)
+    texte = [f"{item['prompt']} {item['answer']}".casefold() for item in items]
+    woerter_anfragen = [" ".join(vokabular[wort] for wort in rng.integers(0, 5000, size=2))
+                        for _ in range(anfragen)]
+
+    start = time.perf_counter()
+    index = SuchIndex.aus_items(items)
+    dauer_bauen = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for anfrage in woerter_anfragen:
+        index.suche(anfrage)
+    dauer_index = (time.perf_counter() - start) / anfragen
+
+    start = time.perf_counter()
+    linear = woerter_anfragen[:5]
+    for anfrage in linear:
+        teile = anfrage.split()
+        [nummer for nummer, text in enumerate(texte) if all(teil in text for teil in teile)]
+    dauer_linear = (time.perf_counter() - start) / len(linear)
+
+    start = time.perf_counter()
+    for nummer in range(1000):
+        index.fuege_hinzu(f"neu_{nummer}", "Was ist die Hauptstadt von Frankreich?")
+        index.aendere(items[nummer]["id"], "Größe der Ähre")
+        index.entferne(items[nummer + 1000]["id"])
+    dauer_aendern = (time.perf_counter() - start) / 3000
+
+    with tempfile.TemporaryDirectory() as ordner:
+        pfad = os.path.join(ordner, "deck.suche.npz")
+        start = time.perf_counter()
+        index.speichere(pfad)
+        dauer_speichern = time.perf_counter() - start
+        groesse = os.path.getsize(pfad)
+        start = time.perf_counter()
+        geladen = SuchIndex.lade(pfad)
+        dauer_laden = time.perf_counter() - start
+    for anfrage in woerter_anfragen[:20] + ["Größe der Ähre"]:
+        assert geladen.suche(anfrage) == index.suche(anfrage)
+
+    print(f"🔎 {anzahl:,} Karten, {len(index._posten):,} Wörter")
+    print(f"   Index bauen:            {dauer_bauen:8.2f} s")
+    print(f"   Suche (Index, BM25):    {dauer_index * 1000:8.2f} ms pro Anfrage")
+    print(f"   Suche (Teil-Text):      {dauer_linear * 1000:8.2f} ms pro Anfrage")
+    print(f"   neu/ändern/löschen:     {dauer_aendern * 1e6:8.2f} µs")
+    print(f"   speichern / laden:      {dauer_speichern:8.2f} s / {dauer_laden:.2f} s ({groesse / 1e6:.0f} MB)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Karten eines Decks durchsuchen")
+    parser.add_argument("deck", nargs="?")
+    parser.add_argument("anfrage", nargs="*")
+    parser.add_argument("-n", "--anzahl", type=int, default=MAX_TREFFER)
+    parser.add_argument("--benchmark", type=int, nargs="?", const=1_000_000, metavar="KARTEN")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    elif args.deck:
+        from journal import Deck
+
+        deck = Deck.oeffne(args.deck)
+        index = SuchIndex.fuer_deck(deck)
+        if not os.path.exists(index.pfad):
+            index.speichere()
+        for karte, punkte in index.suche(" ".join(args.anfrage), args.anzahl):
+            item = deck.nach_id[karte]
+            frage, antwort = TEXT_FELDER[schema_von(item)]
+            print(f"{punkte:6.2f}  {karte}: {item.get(frage)} -> {item.get(antwort)}")
+        deck.schliesse()
+    else:
+        parser.print_help()
@@ -0,0 +1,297 @@
+########################################
+# NEURO-VERLAUF: Bewertungen als Spalten statt als dicts 📈
+########################################
+# Jede Bewertung war bisher ein eigenes dict mit 26 Zeichen ISO-Text
+# ({"timestamp": ..., "score": ..., "interval_before": ...}) - ein paar
+# hundert Bytes pro Eintrag. Jetzt liegen alle Bewertungen eines Decks
+# in einem VerlaufSpalten mit vier typisierten Arrays:
+#   karten      array('I')  Nummer der Karte im Deck   (4 Bytes)
+#   zeiten      array('q')  Mikrosekunden seit 1970    (8 Bytes)
+#   noten       array('b')  Note                        (1 Byte)
+#   intervalle  array('H')  Intervall davor in Tagen    (2 Bytes)
+# Der ReviewVerlauf einer Karte ist nur ein Ausschnitt daraus (Start +
+# Länge) - eigene Arrays pro Karte würden schon ~350 Bytes kosten, mehr
+# als 1-3 Bewertungen selbst.
+#
+# Nach außen bleibt es eine Liste: append, len, Iteration (als Tupel
+# (zeit_us, note, intervall_vorher)), Index und Slice. append nimmt auch
+# die dicts aus beiden Deck-Schemas. Liegt der Ausschnitt nicht am Ende
+# der Spalten, zieht er beim append ans Ende um; die alten Zeilen werden
+# zu Lücken, und sind es mehr als die Hälfte, wird zusammengeschoben.
+#
+# Mit NumPy gibt es die Spalten ohne Kopie: verlauf.als_numpy()
+#
+# Beispiel:
+#   spalten = VerlaufSpalten()                 # eine pro Deck
+#   verlauf = ReviewVerlauf.aus_dicts(item["feedback_log"], spalten)
+#   verlauf.append((zeit_us, 3, 6))
+#   for zeit, note, vorher in verlauf: ...
+#
+# Benchmark:  python verlauf.py 20000
+########################################
+
+from array import array
+from datetime import datetime
+
+MAX_INTERVALL = 65535  # Grenze von array('H')
+LUECKE = 0xFFFFFFFF    # Karten-Nummer für verlassene Zeilen
+
+
+def zeit_us(text):
+    """ISO-Text -> Mikrosekunden seit 1970 (None bleibt None)."""
+    return round(datetime.fromisoformat(text).timestamp() * 1_000_000) if text else None
+
+
+def zeit_iso(mikro):
+    """Mikrosekunden seit 1970 -> ISO-Text wie in den Decks."""
+    return datetime.fromtimestamp(mikro / 1_000_000).isoformat() if mikro is not None else None
+
+
+def _als_tupel(eintrag):
+    """(zeit_us, note, intervall_vorher) aus einem Tupel oder einem dict beider Deck-Schemas."""
+    if isinstance(eintrag, dict):
+        if "timestamp" in eintrag:
+            zeit, note, vorher = eintrag["timestamp"], eintrag["score"], eintrag.get("interval_before", 0)
+        else:
+            zeit, note, vorher = eintrag["datum"], eintrag["note"], eintrag.get("intervall_vorher", 0)
+        return zeit_us(zeit), note, min(vorher or 0, MAX_INTERVALL)
+    zeit, note, vorher = eintrag
+    return zeit, note, min(vorher or 0, MAX_INTERVALL)
+
+
+class VerlaufSpalten:
+    """Die Bewertungen aller Karten eines Decks, Spalte für Spalte."""
+    __slots__ = ("karten", "zeiten", "noten", "intervalle", "verlaeufe", "luecken")
+
+    def __init__(self):
+        self.karten = array("I")
+        self.zeiten = array("q")
+        self.noten = array("b")
+        self.intervalle = array("H")
+        self.verlaeufe = []  # Nummer -> ReviewVerlauf
+        self.luecken = 0
+
+    def __len__(self):
+        return len(self.zeiten)
+
+    def _anhaengen(self, nummer, zeit, note, vorher):
+        self.karten.append(nummer)
+        self.zeiten.append(zeit)
+        self.noten.append(note)
+        self.intervalle.append(vorher)
+
+    def _ans_ende(self, verlauf):
+        """Block einer Karte ans Ende kopieren, die alten Zeilen werden Lücken."""
+        if self.luecken + verlauf.laenge > len(self.zeiten) // 2:
+            self.zusammenschieben(zuletzt=verlauf)
+            return
+        start, ende = verlauf.start, verlauf.start + verlauf.laenge
+        neu = len(self.zeiten)
+        self.karten.extend(self.karten[start:ende])
+        self.zeiten.extend(self.zeiten[start:ende])
+        self.noten.extend(self.noten[start:ende])
+        self.intervalle.extend(self.intervalle[start:ende])
+        self.karten[start:ende] = array("I", [LUECKE]) * verlauf.laenge
+        verlauf.start = neu
+        self.luecken += verlauf.laenge
+
+    def zusammenschieben(self, zuletzt=None):
+        """
+        Lücken entfernen: alle Blöcke neu hintereinander, in der Reihenfolge der Karten.
+
+        Parameter:
+        - zuletzt: dieser Verlauf kommt ans Ende (dort geht sein nächstes append hin)
+        """
+        karten, zeiten, noten, intervalle = array("I"), array("q"), array("b"), array("H")
+        reihenfolge = self.verlaeufe if zuletzt is None else \
+            [verlauf for verlauf in self.verlaeufe if verlauf is not zuletzt] + [zuletzt]
+        for verlauf in reihenfolge:
+            start, ende = verlauf.start, verlauf.start + verlauf.laenge
+            verlauf.start = len(zeiten)
+            karten.extend(self.karten[start:ende])
+            zeiten.extend(self.zeiten[start:ende])
+            noten.extend(self.noten[start:ende])
+            intervalle.extend(self.intervalle[start:ende])
+        self.karten, self.zeiten, self.noten, self.intervalle = karten, zeiten, noten, intervalle
+        self.luecken = 0
+
+    def als_numpy(self):
+        """
+        (karten, zeiten, noten, intervalle) aller Zeilen ohne Kopie - Lücken haben karten == LUECKE.
+        Nur lesen, und solange die Arrays leben, kann kein Verlauf des Decks wachsen (BufferError).
+        """
+        import numpy as np
+
+        return (np.frombuffer(self.karten, dtype=np.uint32),
+                np.frombuffer(self.zeiten, dtype=np.int64),
+                np.frombuffer(self.noten, dtype=np.int8),
+                np.frombuffer(self.intervalle, dtype=np.uint16))
+
+    def speicher(self):
+        """Bytes für die Daten (ohne die Array-Objekte selbst)."""
+        return sum(spalte.itemsize * len(spalte) for spalte in (self.karten, self.zeiten, self.noten, self.intervalle))
+
+
+class ReviewVerlauf:
+    __slots__ = ("spalten", "nummer", "start", "laenge")
+
+    def __init__(self, eintraege=(), spalten=None):
+        """
+        Parameter:
+        - eintraege: Tupel (zeit_us, note, intervall_vorher) oder Deck-dicts
+        - spalten: VerlaufSpalten des Decks (ohne: eigene Spalten nur für diese Karte)
+        """
+        self.spalten = spalten if spalten is not None else VerlaufSpalten()
+        self.nummer = len(self.spalten.verlaeufe)
+        self.spalten.verlaeufe.append(self)
+        self.start = len(self.spalten)
+        self.laenge = 0
+        self.extend(eintraege)
+
+    @classmethod
+    def aus_dicts(cls, eintraege, spalten=None):
+        """Aus feedback_log ({timestamp, score, interval_before}) oder bewertungen ({datum, note})."""
+        return cls(eintraege, spalten)
+
+    ########################################
+    # DIE EIGENEN ZEILEN
+    ########################################
+
+    @property
+    def zeiten(self):
+        """Kopie als array('q')."""
+        return self.spalten.zeiten[self.start:self.start + self.laenge]
+
+    @property
+    def noten(self):
+        """Kopie als array('b')."""
+        return self.spalten.noten[self.start:self.start + self.laenge]
+
+    @property
+    def intervalle(self):
+        """Kopie als array('H')."""
+        return self.spalten.intervalle[self.start:self.start + self.laenge]
+
+    ########################################
+    # WIE EINE LISTE
+    ########################################
+
+    def append(self, eintrag):
+        spalten = self.spalten
+        if self.laenge == 0:
+            self.start = len(spalten)
+        elif self.start + self.laenge != len(spalten):
+            spalten._ans_ende(self)
+        spalten._anhaengen(self.nummer, *_als_tupel(eintrag))
+        self.laenge += 1
+
+    def extend(self, eintraege):
+        for eintrag in eintraege:
+            self.append(eintrag)
+
+    def __len__(self):
+        return self.laenge
+
+    def __iter__(self):
+        return zip(self.zeiten, self.noten, self.intervalle)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ReviewVerlauf(list(self)[index])
+        if index < 0:
+            index += self.laenge
+        if not 0 <= index < self.laenge:
+            raise IndexError("ReviewVerlauf index out of range")
+        zeile = self.start + index
+        return self.spalten.zeiten[zeile], self.spalten.noten[zeile], self.spalten.intervalle[zeile]
+
+    def __eq__(self, anderes):
+        if isinstance(anderes, ReviewVerlauf):
+            return (self.zeiten == anderes.zeiten and self.noten == anderes.noten
+                    and self.intervalle == anderes.intervalle)
+        return list(self) == list(anderes)
+
+    def __repr__(self):
+        return f"ReviewVerlauf({list(self)!r})"
+
+    ########################################
+    # UMWANDELN + STATISTIK
+    ########################################
+
+    def als_dicts(self, schema="en"):
+        """Zurück in die dicts des Deck-Schemas ("en" = feedback_log, "de" = bewertungen)."""
+        if schema == "de":
+            return [{"datum": zeit_iso(zeit), "note": note} for zeit, note, _ in self]
+        return [{"timestamp": zeit_iso(zeit), "score": note, "interval_before": vorher}
+                for zeit, note, vorher in self]
+
+    def als_numpy(self):
+        """(zeiten, noten, intervalle) als NumPy-Arrays - ohne Kopie, nur lesen (und nur bis zum nächsten append)!"""
+        import numpy as np
+
+        start, ende = self.start, self.start + self.laenge
+        return (np.frombuffer(self.spalten.zeiten, dtype=np.int64)[start:ende],
+                np.frombuffer(self.spalten.noten, dtype=np.int8)[start:ende],
+                np.frombuffer(self.spalten.intervalle, dtype=np.uint16)[start:ende])
+
+    def mittlere_note(self):
+        return sum(self.noten) / self.laenge if self.laenge else None
+
+    def letzte(self):
+        """Der neueste Eintrag oder None."""
+        return self[-1] if self.laenge else None
+
+    def speicher(self):
+        """Bytes für die eigenen Daten (ohne Karten-Spalte und Objekte)."""
+        return self.laenge * (8 + 1 + 2)
+
+
+def _messe(baue):
+    """Bytes, die baue() dauerhaft belegt (tracemalloc), und das Ergebnis."""
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    ergebnis = baue()
+    belegt, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return belegt, ergebnis
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    karten_anzahl = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    jetzt = round(datetime.now().timestamp() * 1_000_000)
+
+    # echte Decks: meistens 1-3 Bewertungen pro Karte
+    for pro_karte in (1, 3, 10):
+        def eintraege(karte):
+            return [(jetzt - (karte * pro_karte + nummer) * 60_000_000, 1 + nummer % 4, nummer % 60)
+                    for nummer in range(pro_karte)]
+
+        dict_bytes, dicts = _messe(lambda: [
+            [{"timestamp": zeit_iso(zeit), "score": note, "interval_before": vorher}
+             for zeit, note, vorher in eintraege(karte)] for karte in range(karten_anzahl)])
+        eigen_bytes, _ = _messe(lambda: [ReviewVerlauf(eintraege(karte)) for karte in range(karten_anzahl)])
+
+        def deck():
+            spalten = VerlaufSpalten()
+            return spalten, [ReviewVerlauf(eintraege(karte), spalten) for karte in range(karten_anzahl)]
+        deck_bytes, (spalten, verlaeufe) = _messe(deck)
+
+        start = time.perf_counter()
+        mittel_dicts = sum(eintrag["score"] for verlauf in dicts for eintrag in verlauf) / (karten_anzahl * pro_karte)
+        dauer_dicts = time.perf_counter() - start
+        spalten.als_numpy()  # NumPy-Import nicht mitmessen
+        start = time.perf_counter()
+        mittel_numpy = spalten.als_numpy()[2].mean()
+        dauer_numpy = time.perf_counter() - start
+        assert abs(mittel_dicts - mittel_numpy) < 1e-9
+
+        print(f"{karten_anzahl:,} Karten mit je {pro_karte} Bewertungen (Bytes pro Karte)")
+        print(f"  dicts:                  {dict_bytes / karten_anzahl:7.0f}   mittlere Note {dauer_dicts * 1000:7.2f} ms")
+        print(f"  eigene Arrays je Karte: {eigen_bytes / karten_anzahl:7.0f}")
+        print(f"  Spalten je Deck:        {deck_bytes / karten_anzahl:7.0f}   mittlere Note {dauer_numpy * 1000:7.2f} ms (NumPy)")
@@ -0,0 +1,46 @@
+########################################
+# SITZUNG: Ein-/Ausgabe, Pausen und Zufall der Spiele
+########################################
+# Die Spiele fragen nicht mehr direkt input()/print()/time.sleep(),
+# sondern eine Sitzung. Standard ist wie bisher Tastatur + Bildschirm.
+# Für automatische Läufe (Bewerter, Lasttests) siehe headless.py:
+# dort kommen die Antworten aus einer Liste, Datei oder einem Socket,
+# und mit tempo=0 fallen alle Pausen weg.
+########################################
+
+import random
+import time
+
+
+class Sitzung:
+    def __init__(self, eingabe=input, ausgabe=print, tempo=1.0, zufall=random):
+        """
+        Parameter:
+        - eingabe: Funktion(frage_text) -> antwort_text (Standard: input)
+        - ausgabe: Funktion(*teile) wie print (Standard: print)
+        - tempo: Faktor für alle Pausen (1.0 = wie im Spiel, 0 = keine Pausen)
+        - zufall: Objekt mit randint/choice, z.B. random.Random(seed)
+        """
+        self.eingabe = eingabe
+        self.ausgabe = ausgabe
+        self.tempo = tempo
+        self.zufall = zufall
+        self.ergebnisse = []
+
+    def frage(self, text=""):
+        """Stellt eine Frage und gibt die Antwort als Text zurück."""
+        return self.eingabe(text)
+
+    def zeige(self, *teile):
+        """Gibt etwas aus (wie print)."""
+        self.ausgabe(*teile)
+
+    def warte(self, sekunden):
+        """Pause - mit tempo skaliert, bei tempo=0 gar nicht."""
+        if self.tempo > 0:
+            time.sleep(sekunden * self.tempo)
+
+    def ergebnis(self, **daten):
+        """Merkt sich das Ergebnis einer Aufgabe als Datensatz (dict)."""
+        self.ergebnisse.append(daten)
+        return daten
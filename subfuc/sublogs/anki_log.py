@@ -1,4 +1,3 @@
-import inspect
 import os
 
 
@@ -9,11 +8,15 @@ script_dir = os.path.dirname(os.path.abspath(__file__))  # aktueller Ordner: sub
 parent_dir = os.path.dirname(script_dir)                 # ein Ordner höher: subfuc/
 main_dir = os.path.dirname(parent_dir)                   # noch ein Ordner höher: akademy/
 
-# 2. "Baue den Pfad zum logs-Ordner"
-logs_dir = os.path.join(main_dir, "logs")
+# 2. "Baue den Pfad zum logs-Ordner" (AKADEMY_LOGS_DIR überschreibt, z.B. für Stresstests)
+logs_dir = os.environ.get("AKADEMY_LOGS_DIR", os.path.join(main_dir, "logs"))
 
 # 3. "Baue den kompletten Pfad zur Log-Datei"
-dateiname = os.path.join(logs_dir, "anki_logn.txt")
+dateiname = os.path.join(logs_dir, "anki_logn.txt")         # altes Text-Log (wird nur noch gelesen)
+ereignis_datei = os.path.join(logs_dir, "anki_events.log")  # erste Datensatz-Datei (vor den Segmenten)
+segment_ordner = os.path.join(logs_dir, "anki_events")      # kompakte Datensätze in Segmenten, siehe unten
+skript_tabelle = os.path.join(logs_dir, "anki_skripte.tsv") # skript-id -> voller Pfad, je Skript EINMAL
+import_datei = os.path.join(logs_dir, "anki_events.import.log")  # einmalig übernommene alte Text-Logs
 
 # 4. "Falls der logs-Ordner nicht da ist, erstelle ihn"
 os.makedirs(logs_dir, exist_ok=True)
@@ -27,70 +30,639 @@ def create_log_file():
     except FileExistsError:
         pass
 
-# prepend new entries (newest at top)
-import datetime
-from itertools import count
+# Einträge werden nur noch ANGEHÄNGT (älteste oben, neueste unten).
+# Die letzte "call"-Nummer steht in einer kleinen Zähler-Datei daneben,
+# damit nie die ganze Log-Datei gelesen oder neu geschrieben werden muss.
+# "Neueste zuerst" liefert lese_neueste() durch Rückwärts-Lesen.
+#
+# Mehrere Prozesse gleichzeitig (main.py, menu.py, alle Spiele in derselben
+# Sekunde): Zähler erhöhen + Zeile anhängen passiert unter einer kurzen
+# Datei-Sperre (anki_logn.lock). Der Zähler selbst ist eine per mmap geteilte
+# Zahl, die Zeile wird mit O_APPEND in EINEM write() geschrieben.
+#
+# Datensatz-Format (eine Zeile pro Ereignis, Tab-getrennt):
+#     call-nummer  zeit_ms  skript-id  ereignis
+#     105          1759705165000  3f2a9c1e  run
+# - zeit_ms: Unix-Zeit in Millisekunden, läuft pro Prozess nie rückwärts
+# - skript-id: 8 Hex-Zeichen (crc32 des Pfads); der lange Pfad steht nur
+#   einmal in anki_skripte.tsv statt zweimal in jeder Zeile
+#
+# Segmente: Datensätze landen in logs/anki_events/JJJJ-MM-TT.NNN.log.
+# Jeden Tag beginnt ein neues Segment, und wenn eines SEGMENT_MAX_BYTES
+# erreicht, geht es mit NNN+1 weiter. Geschrieben wird immer nur in das
+# kleine aktive Segment. Abgeschlossene Segmente packt ein Hintergrund-Thread
+# mit gzip ein; älter als AUFBEWAHRUNG_TAGE werden sie gelöscht.
+import gzip
+import mmap
+import shutil
+import sys
+import threading
 import time
-def count_calls():
+import zlib
+from contextlib import contextmanager
+
+try:
+    import fcntl   # Linux / macOS
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows
+
+zaehler_datei = os.path.join(logs_dir, "anki_logn.count")
+sperr_datei = os.path.join(logs_dir, "anki_logn.lock")
+ZAEHLER_BREITE = 20  # feste Breite -> Zähler wird immer an Ort und Stelle überschrieben
+
+SEGMENT_MAX_BYTES = 1024 * 1024  # ab dieser Größe beginnt ein neues Segment
+AUFBEWAHRUNG_TAGE = 365          # ältere Segmente werden gelöscht (die Tageszahlen im Index bleiben)
+
+_sperr_fd = None
+_zaehler_map = None
+_thread_sperre = threading.Lock()  # flock sperrt nur zwischen Prozessen, nicht zwischen Threads
+
+
+@contextmanager
+def log_sperre():
+    """Exklusive Sperre über alle Prozesse und Threads (nur für Zähler + eine Zeile)."""
+    with _thread_sperre:
+        with _datei_sperre():
+            yield
+
+
+@contextmanager
+def _datei_sperre():
+    global _sperr_fd
+    if _sperr_fd is None:
+        _sperr_fd = os.open(sperr_datei, os.O_RDWR | os.O_CREAT, 0o644)
+    if fcntl:
+        fcntl.flock(_sperr_fd, fcntl.LOCK_EX)
+    else:
+        os.lseek(_sperr_fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(_sperr_fd, msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                pass  # LK_LOCK gibt nach ~10 Sekunden auf -> weiter warten
     try:
-        # Versuche erst UTF-8, dann Windows-Encoding als Fallback
-        try:
-            with open(dateiname, "r", encoding='utf-8') as file:
-                lines = file.readlines()
-        except UnicodeDecodeError:
-            print("UTF-8 failed, trying Windows encoding...")
-            with open(dateiname, "r", encoding='cp1252') as file:
-                lines = file.readlines()
-        count = len(lines) - 2  # Subtract header lines
-    except FileNotFoundError:
-        print("Anki-Log-Datei nicht gefunden, erstelle neue...")
-        create_log_file()  # Erstelle die Datei erst jetzt
-        count = 0
-        lines = ["Anki log\n", "=====================\n"]
-    
-    count += 1
-    date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    ### 
-    # SICHERER Aufruf - verhindere Crash bei fehlendem f_back
+        yield
+    finally:
+        if fcntl:
+            fcntl.flock(_sperr_fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(_sperr_fd, 0, os.SEEK_SET)
+            msvcrt.locking(_sperr_fd, msvcrt.LK_UNLCK, 1)
+
+
+def lese_log_zeilen():
+    """Liest alle Zeilen der Log-Datei (UTF-8, Windows-Encoding als Fallback)."""
     try:
-        frame = inspect.currentframe()
-        if frame and frame.f_back and frame.f_back.f_back:
-            calling_script = inspect.getframeinfo(frame.f_back.f_back).filename
+        with open(dateiname, "r", encoding='utf-8') as file:
+            return file.readlines()
+    except UnicodeDecodeError:
+        print("UTF-8 failed, trying Windows encoding...")
+        with open(dateiname, "r", encoding='cp1252') as file:
+            return file.readlines()
+
+
+def migriere_altes_log():
+    """
+    Einmalige Umstellung des alten Formats (neueste Einträge oben).
+    Dreht die Einträge in zeitliche Reihenfolge und legt die Zähler-Datei an.
+    Läuft nur, solange es noch keine Zähler-Datei gibt.
+
+    Rückgabe:
+    - Anzahl der vorhandenen Einträge (= letzte vergebene call-Nummer)
+    """
+    try:
+        lines = lese_log_zeilen()
+    except FileNotFoundError:
+        lines = []
+
+    header = lines[:2]
+    old_entries = lines[2:]
+    if old_entries and call_nummer(old_entries[0]) > call_nummer(old_entries[-1]):
+        old_entries.reverse()  # alt: neueste oben -> neu: neueste unten
+        with open(dateiname, "w", encoding='utf-8') as file:
+            file.writelines(header + old_entries)
+
+    count = len(old_entries)
+    # Falls nur die Zähler-Datei verloren ging: bei der letzten neuen Nummer weitermachen
+    # (nur im anki-Log selbst - die übernommenen alten Logs sind eigens durchnummeriert)
+    for pfad in reversed([pfad for pfad in ereignis_dateien() if pfad != import_datei]):
+        for zeile in rueckwaerts_zeilen(pfad):
+            count = max(count, lese_datensatz(zeile)[0])
+            break
         else:
-            calling_script = "unknown"
-    except:
-        calling_script = "error_getting_caller"
-    
-    # Nur den Dateinamen extrahieren
-    what = os.path.basename(calling_script)
-    new_entry = f"call: {count} - date: {date} - what: {what} - Script: {calling_script}\n"
-
-    # Neue Einträge OBEN einfügen (nach Header)
-    if len(lines) >= 2:
-        # Header behalten, neuen Eintrag nach Header einfügen
-        header = lines[:2]  # "Anki log" und "============="
-        old_entries = lines[2:]  # Alte Einträge
-        new_content = header + [new_entry] + old_entries
-    else:
-        # Falls keine Header da sind
-        new_content = [new_entry]
-    
-    # Datei komplett neu schreiben MIT UTF-8 ENCODING
-    with open(dateiname, "w", encoding='utf-8') as file:
-        file.writelines(new_content)
-    
+            continue
+        break
+    schreibe_zaehler(count)
     return count
 
-def run():
+
+def call_nummer(zeile):
+    """Holt N aus 'call: N - date: ...' (0, falls die Zeile anders aussieht)."""
+    try:
+        return int(zeile.split(" - ", 1)[0].split(":", 1)[1])
+    except (IndexError, ValueError):
+        return 0
+
+
+def lese_zaehler():
+    """Liest die letzte vergebene call-Nummer aus der Zähler-Datei."""
+    with open(zaehler_datei, "r", encoding='ascii') as file:
+        return int(file.read(ZAEHLER_BREITE))
+
+
+def schreibe_zaehler(count):
+    """Überschreibt die Zähler-Datei (immer gleiche Länge)."""
+    with open(zaehler_datei, "w", encoding='ascii') as file:
+        file.write(str(count).zfill(ZAEHLER_BREITE))
+
+
+def zaehler_map():
+    """Öffnet die Zähler-Datei einmal pro Prozess als geteilten Speicher (mmap)."""
+    global _zaehler_map
+    if _zaehler_map is None:
+        try:
+            lese_zaehler()
+        except (FileNotFoundError, ValueError):
+            migriere_altes_log()
+        with open(zaehler_datei, "r+b") as file:
+            _zaehler_map = mmap.mmap(file.fileno(), ZAEHLER_BREITE)
+    return _zaehler_map
+
+
+def naechste_nummer(anzahl=1):
+    """
+    Reserviert `anzahl` call-Nummern am Stück und gibt die erste davon zurück.
+    Nur innerhalb von log_sperre() aufrufen!
+    """
+    zaehler = zaehler_map()
+    erste = int(zaehler[:ZAEHLER_BREITE]) + 1
+    zaehler[:ZAEHLER_BREITE] = str(erste + anzahl - 1).zfill(ZAEHLER_BREITE).encode("ascii")
+    return erste
+
+
+def haenge_an(text, pfad):
+    """Hängt Text mit O_APPEND in einem einzigen write() an eine Log-Datei an."""
+    fd = os.open(pfad, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+_skript_ids = {}         # Pfad -> skript-id (einmal pro Prozess berechnet)
+_bekannte_ids = None     # ids, die schon in anki_skripte.tsv stehen
+_letzte_zeit_ms = 0
+
+
+def skript_id(pfad):
+    """Kurze, stabile id für einen Skript-Pfad (interniert, pro Pfad nur einmal berechnet)."""
+    sid = _skript_ids.get(pfad)
+    if sid is None:
+        sid = sys.intern(format(zlib.crc32(pfad.encode("utf-8")), "08x"))
+        _skript_ids[pfad] = sid
+    return sid
+
+
+def lese_skript_tabelle():
+    """Liest anki_skripte.tsv als Wörterbuch {skript-id: pfad}."""
+    tabelle = {}
+    try:
+        with open(skript_tabelle, "r", encoding='utf-8') as file:
+            for zeile in file:
+                sid, _, pfad = zeile.rstrip("\n").partition("\t")
+                if pfad:
+                    tabelle[sid] = pfad
+    except FileNotFoundError:
+        pass
+    return tabelle
+
+
+def registriere_skripte(pfade):
+    """
+    Trägt noch unbekannte Skript-Pfade in die Tabelle ein.
+    Nur innerhalb von log_sperre() aufrufen!
+    """
+    global _bekannte_ids
+    if _bekannte_ids is None:
+        _bekannte_ids = set(lese_skript_tabelle())
+    neu = {}
+    for pfad in pfade:
+        sid = skript_id(pfad)
+        if sid not in _bekannte_ids:
+            neu[sid] = pfad
+    if neu:
+        haenge_an("".join(f"{sid}\t{pfad}\n" for sid, pfad in neu.items()), skript_tabelle)
+        _bekannte_ids.update(neu)
+
+
+def zeit_ms(zeitpunkt):
+    """Unix-Zeit in ms; nie kleiner als der vorige Wert dieses Prozesses."""
+    global _letzte_zeit_ms
+    ms = max(int(zeitpunkt * 1000), _letzte_zeit_ms)
+    _letzte_zeit_ms = ms
+    return ms
+
+
+def schreibe_ereignisse(ereignisse):
+    """
+    Schreibt Ereignisse als kompakte Datensätze: eine Sperre, ein Nummern-Block, ein write().
+
+    Parameter:
+    - ereignisse: Liste von (zeit_ms, skript-pfad, ereignis)
+
+    Rückgabe:
+    - call-Nummer des ersten Ereignisses
+    """
+    with log_sperre():
+        registriere_skripte({pfad for _, pfad, _ in ereignisse})
+        erste = naechste_nummer(len(ereignisse))
+        haenge_an("".join(
+            f"{count}\t{ms}\t{skript_id(pfad)}\t{ereignis}\n"
+            for count, (ms, pfad, ereignis) in enumerate(ereignisse, erste)
+        ), aktives_segment())
+    return erste
+
+
+########################################
+# SEGMENTE: Rotation, Packen, Aufbewahrung
+########################################
+
+_segment = [None, None, 1]  # [tag, pfad, nummer] des aktiven Segments in diesem Prozess
+_aufraeumer = None
+
+
+def segment_pfad(tag, nummer):
+    return os.path.join(segment_ordner, f"{tag}.{nummer:03d}.log")
+
+
+def aktives_segment():
+    """
+    Segment, in das jetzt geschrieben wird. Nur innerhalb von log_sperre() aufrufen!
+    Kostet normalerweise nur ein stat(); ist das Segment voll (oder schon gepackt),
+    geht es mit der nächsten Nummer weiter - das merken alle Prozesse von selbst.
+    """
+    tag = time.strftime("%Y-%m-%d")
+    if _segment[0] != tag:
+        os.makedirs(segment_ordner, exist_ok=True)
+        nummern = [int(name.split(".")[1]) for name in os.listdir(segment_ordner)
+                   if name.startswith(tag + ".")]
+        _segment[:] = [tag, None, max(nummern, default=1)]
+
+    while True:
+        pfad = segment_pfad(tag, _segment[2])
+        try:
+            voll = os.stat(pfad).st_size >= SEGMENT_MAX_BYTES
+        except FileNotFoundError:
+            voll = os.path.exists(pfad + ".gz")
+        if not voll:
+            break
+        _segment[2] += 1
+
+    if pfad != _segment[1]:
+        _segment[1] = pfad
+        starte_aufraeumen()  # neues Segment -> die alten können gepackt werden
+    return pfad
+
+
+def packe_segment(pfad):
+    """
+    Packt ein abgeschlossenes Segment mit gzip (Tauschen + Löschen unter der Sperre).
+
+    Gepackt wird ohne Sperre. Hat inzwischen doch noch ein Prozess angehängt
+    (z.B. einer mit anderem "heute", weil seine TZ anders ist), stimmt die Größe
+    unter der Sperre nicht mehr - dann wird neu gepackt statt Zeilen zu verlieren.
+    """
+    temp = pfad + ".gz.tmp"
+    while True:
+        with open(pfad, "rb") as quelle, gzip.open(temp, "wb") as ziel:
+            shutil.copyfileobj(quelle, ziel)
+            kopiert = quelle.tell()
+        with log_sperre():
+            if os.stat(pfad).st_size == kopiert:
+                os.replace(temp, pfad + ".gz")
+                os.remove(pfad)
+                return
+
+
+def raeume_auf():
+    """
+    Packt alle abgeschlossenen Segmente und löscht Segmente,
+    die älter als AUFBEWAHRUNG_TAGE sind. Das aktive Segment
+    (heute, höchste Nummer) wird nie angefasst.
+    """
+    heute = time.strftime("%Y-%m-%d")
+    grenze = time.strftime("%Y-%m-%d", time.localtime(time.time() - AUFBEWAHRUNG_TAGE * 86400))
+    try:
+        namen = sorted(os.listdir(segment_ordner))
+    except FileNotFoundError:
+        return
+    heute_nummern = [int(name.split(".")[1]) for name in namen
+                     if name.startswith(heute + ".") and not name.endswith(".tmp")]
+    aktiv = f"{heute}.{max(heute_nummern, default=1):03d}.log"
+
+    for name in namen:
+        pfad = os.path.join(segment_ordner, name)
+        try:
+            if name[:10] < grenze:
+                with log_sperre():
+                    os.remove(pfad)
+            elif name.endswith(".log") and name != aktiv:
+                packe_segment(pfad)
+        except FileNotFoundError:
+            pass  # ein anderer Prozess war schneller
+
+
+def starte_aufraeumen():
+    """Startet raeume_auf() im Hintergrund, falls es nicht schon läuft."""
+    global _aufraeumer
+    if _aufraeumer is not None and _aufraeumer.is_alive():
+        return
+    _aufraeumer = threading.Thread(target=raeume_auf, name="anki_log_aufraeumen", daemon=True)
+    _aufraeumer.start()
+
+
+def count_calls(ereignis="run"):
+    # Aufrufer = wer run() aufgerufen hat. Nur f_code.co_filename lesen -
+    # inspect.getframeinfo() würde dafür extra Quelltext-Zeilen laden.
+    try:
+        calling_script = sys._getframe(2).f_code.co_filename
+    except ValueError:
+        calling_script = "unknown"
+
+    # Neuen Eintrag nur ANHÄNGEN - kostet immer gleich viel, egal wie groß das Log ist.
+    # Unter der Sperre: Nummern bleiben eindeutig und stehen in der richtigen Reihenfolge.
+    return schreibe_ereignisse([(zeit_ms(time.time()), calling_script, ereignis)])
+
+
+def lese_datensatz(zeile):
+    """
+    Zerlegt eine Datensatz-Zeile.
+
+    Rückgabe:
+    - (call-nummer, zeit_ms, skript-id, ereignis)
+    """
+    if isinstance(zeile, bytes):
+        zeile = zeile.decode("utf-8")
+    count, ms, sid, ereignis = zeile.rstrip("\r\n").split("\t")
+    return int(count), int(ms), sid, ereignis
+
+
+def als_text(datensatz, tabelle):
+    """Macht aus einem Datensatz wieder die gewohnte Zeile 'call: N - date: ... - Script: ...'."""
+    count, ms, sid, ereignis = datensatz
+    date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ms / 1000))
+    calling_script = tabelle.get(sid, sid)
+    what = skript_name(calling_script)
+    text = f"call: {count} - date: {date} - what: {what} - Script: {calling_script}"
+    return text if ereignis == "run" else f"{text} - event: {ereignis}"
+
+
+def skript_name(pfad):
+    """Dateiname ohne Ordner - auch für Windows-Pfade, wenn das Log auf Linux gelesen wird."""
+    return pfad.replace("\\", "/").rsplit("/", 1)[-1]
+
+
+def ereignis_dateien():
+    """Alle Dateien mit Datensätzen, älteste zuerst (Segmente evtl. als .gz)."""
+    dateien = [pfad for pfad in (import_datei, ereignis_datei) if os.path.exists(pfad)]
+    try:
+        namen = set(os.listdir(segment_ordner))
+    except FileNotFoundError:
+        return dateien
+    for name in sorted(namen):
+        if name.endswith(".log") or (name.endswith(".log.gz") and name[:-3] not in namen):
+            dateien.append(os.path.join(segment_ordner, name))
+    return dateien
+
+
+def segment_schluessel(pfad):
+    """Name eines Segments - gleich, egal ob schon mit gzip gepackt oder nicht."""
+    name = os.path.basename(pfad)
+    return name[:-3] if name.endswith(".gz") else name
+
+
+def oeffne_segment(pfad):
+    """Öffnet eine Datensatz-Datei zum Lesen (gepackte Segmente transparent)."""
+    if pfad.endswith(".gz"):
+        return gzip.open(pfad, "rb")
+    return open(pfad, "rb")
+
+
+def lese_ereignisse(pfad, ab_byte=0):
+    """
+    Liest Datensätze vorwärts, Zeile für Zeile (nie die ganze Datei auf einmal).
+    Eine noch nicht fertig geschriebene letzte Zeile wird ausgelassen.
+
+    Parameter:
+    - pfad: Datensatz-Datei
+    - ab_byte: Ab dieser Byte-Position lesen (muss ein Zeilenanfang sein)
+
+    Liefert:
+    - (byte-position hinter der Zeile, (call-nummer, zeit_ms, skript-id, ereignis))
+    """
+    try:
+        file = oeffne_segment(pfad)
+    except FileNotFoundError:
+        return
+    with file:
+        file.seek(ab_byte)
+        position = ab_byte
+        for zeile in file:
+            if not zeile.endswith(b"\n"):
+                return
+            position += len(zeile)
+            if zeile.strip():
+                yield position, lese_datensatz(zeile)
+
+
+def rueckwaerts_zeilen(pfad, block_groesse=8192):
+    """
+    Liefert die Zeilen einer Datei von hinten nach vorne (als bytes, ohne Zeilenende).
+    Es werden nur so viele Blöcke gelesen, wie der Aufrufer wirklich abholt.
+    """
+    if pfad.endswith(".gz"):
+        # gepackte Segmente sind klein genug, um sie ganz auszupacken
+        try:
+            with gzip.open(pfad, "rb") as file:
+                zeilen = file.read().split(b"\n")
+        except FileNotFoundError:
+            return
+        for zeile in reversed(zeilen):
+            if zeile.strip():
+                yield zeile.rstrip(b"\r")
+        return
+
+    try:
+        file = open(pfad, "rb")
+    except FileNotFoundError:
+        return
+
+    with file:
+        position = file.seek(0, os.SEEK_END)
+        rest = b""
+        while position > 0:
+            schritt = min(block_groesse, position)
+            position -= schritt
+            file.seek(position)
+            block = file.read(schritt) + rest
+            zeilen = block.split(b"\n")
+            rest = zeilen.pop(0)  # evtl. unvollständige Zeile -> mit nächstem Block
+            for zeile in reversed(zeilen):
+                if zeile.strip():
+                    yield zeile.rstrip(b"\r")
+        if rest.strip():
+            yield rest.rstrip(b"\r")
+
+
+def lese_neueste(anzahl=None, block_groesse=8192):
+    """
+    Liefert die Einträge "neueste zuerst", indem die Dateien von hinten gelesen werden:
+    erst die neuen Datensätze, danach die übernommenen (bzw. das alte Text-Log).
+
+    Parameter:
+    - anzahl: Wie viele Einträge höchstens (None = alle)
+    - block_groesse: Wie viele Bytes pro Schritt von hinten gelesen werden
+    """
+    if anzahl is not None and anzahl <= 0:
+        return
+    tabelle = lese_skript_tabelle()
+    geliefert = 0
+
+    for pfad in reversed(ereignis_dateien()):
+        for zeile in rueckwaerts_zeilen(pfad, block_groesse):
+            yield als_text(lese_datensatz(zeile), tabelle)
+            geliefert += 1
+            if anzahl is not None and geliefert >= anzahl:
+                return
+
+    if os.path.exists(import_datei):
+        return  # alte Logs wurden schon übernommen (log_abfrage.py --importiere)
+
+    for zeile in rueckwaerts_zeilen(dateiname, block_groesse):
+        if zeile.startswith(b"call:"):
+            # errors="replace": alte Einträge können noch cp1252 sein
+            yield zeile.decode("utf-8", errors="replace")
+            geliefert += 1
+            if anzahl is not None and geliefert >= anzahl:
+                return
+
+
+def zeige_neueste(anzahl=10):
+    """Gibt die letzten Einträge (neueste oben) auf der Konsole aus."""
+    for eintrag in lese_neueste(anzahl):
+        print(eintrag)
+
+
+########################################
+# PUFFER: Schreiben im Hintergrund
+########################################
+# run() wird beim Import jedes Spiels aufgerufen. Damit das den Start nicht
+# bremst, legt run() nur (Zeit, Aufrufer) in eine Warteschlange. Ein
+# Hintergrund-Thread schreibt gesammelt:
+# - sobald PUFFER_GROESSE Einträge da sind,
+# - spätestens PUFFER_INTERVALL Sekunden nach dem ersten wartenden Eintrag,
+# - und beim Beenden des Programms (atexit).
+# Pro Eintrag merkt sich run() nur das Code-Objekt des Aufrufers; den
+# Dateinamen (co_filename) liest erst der Hintergrund-Thread.
+import atexit
+import queue
+
+GEPUFFERT = True         # False -> run() schreibt wie früher sofort
+PUFFER_GROESSE = 64      # so viele Einträge werden höchstens zusammen geschrieben
+PUFFER_INTERVALL = 0.5   # Sekunden, die ein Eintrag höchstens wartet
+
+_puffer = queue.SimpleQueue()
+_puffer_thread = None
+_puffer_start_sperre = threading.Lock()
+_ENDE = object()
+
+
+def schreibe_stapel(stapel):
+    """
+    Schreibt mehrere gepufferte Einträge auf einmal.
+
+    Parameter:
+    - stapel: Liste von (zeitpunkt, code-objekt des Aufrufers, ereignis)
+    """
+    schreibe_ereignisse([
+        (zeit_ms(zeitpunkt), code.co_filename if code else "unknown", ereignis)
+        for zeitpunkt, code, ereignis in stapel
+    ])
+
+
+def _puffer_schleife():
+    """Läuft im Hintergrund-Thread: sammelt Einträge und schreibt sie stapelweise."""
+    while True:
+        eintrag = _puffer.get()  # schläft, bis etwas zu tun ist
+        stapel = []
+        frist = time.monotonic() + PUFFER_INTERVALL
+        while True:
+            if eintrag is _ENDE:
+                if stapel:
+                    schreibe_stapel(stapel)
+                return
+            if isinstance(eintrag, threading.Event):
+                # puffer_leeren() wartet -> sofort schreiben
+                if stapel:
+                    schreibe_stapel(stapel)
+                    stapel = []
+                eintrag.set()
+            else:
+                stapel.append(eintrag)
+            rest = frist - time.monotonic()
+            if len(stapel) >= PUFFER_GROESSE or rest <= 0:
+                break
+            try:
+                eintrag = _puffer.get(timeout=rest)
+            except queue.Empty:
+                break
+        if stapel:
+            schreibe_stapel(stapel)
+
+
+def starte_puffer():
+    """Startet den Hintergrund-Thread (einmal pro Prozess, beim ersten Eintrag)."""
+    global _puffer_thread
+    with _puffer_start_sperre:
+        if _puffer_thread is None:
+            _puffer_thread = threading.Thread(target=_puffer_schleife, name="anki_log", daemon=True)
+            _puffer_thread.start()
+            atexit.register(stoppe_puffer)
+
+
+def puffer_leeren(timeout=5.0):
+    """Wartet, bis alle bisher eingereihten Einträge auf der Platte stehen."""
+    if _puffer_thread is None or not _puffer_thread.is_alive():
+        return
+    fertig = threading.Event()
+    _puffer.put(fertig)
+    fertig.wait(timeout)
+
+
+def stoppe_puffer(timeout=5.0):
+    """Schreibt den Rest und beendet den Hintergrund-Thread (läuft automatisch bei Programmende)."""
+    if _puffer_thread is None or not _puffer_thread.is_alive():
+        return
+    _puffer.put(_ENDE)
+    _puffer_thread.join(timeout)
+
+
+def run(ereignis="run"):
     """Hauptfunktion zum Starten des Logging"""
-    create_log_file()
-    count_calls()
+    if not GEPUFFERT:
+        count_calls(ereignis)
+        return
+
+    # Aufrufer jetzt merken (nur das Code-Objekt, der Dateiname wird im Thread gelesen)
+    _puffer.put((time.time(), sys._getframe(1).f_code, ereignis))
+    if _puffer_thread is None:
+        starte_puffer()
     
 # Nur ausführen wenn Datei direkt gestartet wird
+# (früher liefen print + sleep(3) bei JEDEM Import - das hat jeden Spielstart gebremst)
 if __name__ == "__main__":
     run()
-
-import time
-print("Anki task 2 check")
-time.sleep(3)
\ No newline at end of file
+    print("Anki task 2 check")
+    time.sleep(3)
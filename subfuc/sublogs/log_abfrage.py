@@ -0,0 +1,310 @@
+########################################
+# LOG-ABFRAGE 🔎
+########################################
+# Beantwortet Fragen wie "Wie oft wurde luh1a1 pro Tag gestartet?",
+# ohne jedes Mal alle Datensätze zu lesen:
+# - logs/anki_events.index.json zählt Ereignisse pro Tag, Skript und Art
+# - der Index merkt sich, bis zu welchem Byte jede Datei schon gezählt ist,
+#   und liest beim nächsten Aufruf nur das, was neu dazugekommen ist
+# - ganze Tage kommen direkt aus dem Index; nur angebrochene Tage
+#   (Zeitraum mit Uhrzeit) werden gelesen, ab der gemerkten Start-Position
+# - gelöschte alte Segmente (Aufbewahrung) bleiben im Index mitgezählt
+#
+# Beispiele:
+#   python log_abfrage.py --importiere            (alte Text-Logs einmalig übernehmen)
+#   python log_abfrage.py --skript luh1a1 --pro-tag
+#   python log_abfrage.py --von 2025-10-03 --bis "2025-10-06 01:00"
+#   python log_abfrage.py --neueste 20
+########################################
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import anki_log
+
+index_datei = os.path.join(anki_log.logs_dir, "anki_events.index.json")
+
+# Alte Text-Logs im Format "call: N - date: ... - what: ... - Script: ..."
+ALTE_LOGS = ["03.10.2025.txt", "anki_logn.txt"]
+ALTE_ZEILE = re.compile(r"call: (\d+) - date: (\d{4}-\d\d-\d\d \d\d:\d\d:\d\d) - what: .*? - Script: (.*)")
+
+
+########################################
+# TAGE
+########################################
+
+_tag = [0, 0, ""]  # [start_ms, ende_ms, "JJJJ-MM-TT"] des zuletzt gefragten Tages
+
+
+def tag_grenzen(tag):
+    """Start und Ende (ms, Ortszeit) eines Tages 'JJJJ-MM-TT'."""
+    jahr, monat, tag_nr = (int(teil) for teil in tag.split("-"))
+    start = time.mktime((jahr, monat, tag_nr, 0, 0, 0, 0, 0, -1))
+    ende = time.mktime((jahr, monat, tag_nr + 1, 0, 0, 0, 0, 0, -1))  # mktime rechnet den 32. richtig um
+    return int(start * 1000), int(ende * 1000)
+
+
+def tag_von(ms):
+    """Tag (Ortszeit) eines Zeitstempels - aufeinanderfolgende Datensätze treffen fast immer den Cache."""
+    if not (_tag[0] <= ms < _tag[1]):
+        tag = time.strftime("%Y-%m-%d", time.localtime(ms / 1000))
+        _tag[:] = [*tag_grenzen(tag), tag]
+    return _tag[2]
+
+
+def lies_zeitpunkt(text, bis=False):
+    """
+    Wandelt 'JJJJ-MM-TT' oder 'JJJJ-MM-TT HH:MM[:SS]' in ms um.
+    Ein reines Datum als Obergrenze zählt den ganzen Tag mit.
+    """
+    if len(text) == 10:
+        start, ende = tag_grenzen(text)
+        return ende if bis else start
+    format = "%Y-%m-%d %H:%M:%S" if text.count(":") == 2 else "%Y-%m-%d %H:%M"
+    return int(time.mktime(time.strptime(text, format)) * 1000)
+
+
+########################################
+# INDEX
+########################################
+
+def leerer_index():
+    return {"version": 1, "dateien": {}, "tag_start": {}, "tage": {}}
+
+
+def lade_index():
+    try:
+        with open(index_datei, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return leerer_index()
+
+
+def speichere_index(index):
+    """Schreibt den Index in eine Hilfsdatei und tauscht sie dann aus (nie halb geschrieben)."""
+    temp = index_datei + ".tmp"
+    with open(temp, "w", encoding="utf-8") as file:
+        json.dump(index, file, separators=(",", ":"))
+    os.replace(temp, index_datei)
+
+
+def aktualisiere_index(index):
+    """
+    Zählt alle Datensätze, die seit dem letzten Mal dazugekommen sind.
+
+    Index-Aufbau:
+    - dateien:   {datei: bis zu welchem Byte schon gezählt}
+    - tag_start: {datei: {tag: Byte-Position des ersten Datensatzes dieses Tages}}
+    - tage:      {tag: {skript-id: {ereignis: anzahl}}}
+
+    Rückgabe:
+    - True, wenn sich etwas geändert hat
+    """
+    geaendert = False
+    for pfad in anki_log.ereignis_dateien():
+        name = anki_log.segment_schluessel(pfad)
+        ab_byte = index["dateien"].get(name, 0)
+        if not pfad.endswith(".gz") and os.path.getsize(pfad) < ab_byte:
+            # Datei wurde ersetzt -> Index komplett neu aufbauen
+            index.clear()
+            index.update(leerer_index())
+            return aktualisiere_index(index) or True
+
+        starts = index["tag_start"].setdefault(name, {})
+        position = ab_byte
+        for ende, (_, ms, sid, ereignis) in anki_log.lese_ereignisse(pfad, ab_byte):
+            tag = tag_von(ms)
+            if tag not in starts:
+                starts[tag] = position
+            pro_skript = index["tage"].setdefault(tag, {}).setdefault(sid, {})
+            pro_skript[ereignis] = pro_skript.get(ereignis, 0) + 1
+            position = ende
+        if position != ab_byte:
+            index["dateien"][name] = position
+            geaendert = True
+    return geaendert
+
+
+########################################
+# ABFRAGE
+########################################
+
+def finde_skripte(name, tabelle):
+    """
+    Alle skript-ids, deren Skript zu `name` passt.
+    'luh1a1' findet luh1a1.py, sonst reicht ein Teil des Pfads.
+    """
+    name = name.lower()
+    gefunden = set()
+    for sid, pfad in tabelle.items():
+        datei = anki_log.skript_name(pfad).lower()
+        if name in (datei, datei.rsplit(".", 1)[0]):
+            gefunden.add(sid)
+    if not gefunden:
+        gefunden = {sid for sid, pfad in tabelle.items() if name in pfad.lower()}
+    return gefunden
+
+
+def zaehle_tag_teilweise(index, tag, von_ms, bis_ms, skripte, ereignis, ergebnis):
+    """Zählt einen angebrochenen Tag: liest nur die Datensätze ab dem Tagesbeginn."""
+    for pfad in anki_log.ereignis_dateien():
+        name = anki_log.segment_schluessel(pfad)
+        start = index["tag_start"].get(name, {}).get(tag)
+        if start is None:
+            continue
+        for ende, (_, ms, sid, art) in anki_log.lese_ereignisse(pfad, start):
+            if ende > index["dateien"][name] or tag_von(ms) > tag:
+                break
+            if not (von_ms <= ms < bis_ms) or tag_von(ms) != tag:
+                continue
+            if (skripte is None or sid in skripte) and (ereignis is None or art == ereignis):
+                ergebnis[(tag, sid)] = ergebnis.get((tag, sid), 0) + 1
+
+
+def abfrage(index, skripte=None, von_ms=None, bis_ms=None, ereignis=None):
+    """
+    Zählt Ereignisse pro (tag, skript-id).
+
+    Parameter:
+    - skripte: Menge von skript-ids (None = alle)
+    - von_ms / bis_ms: Zeitraum [von, bis) in ms (None = offen)
+    - ereignis: nur diese Ereignis-Art (None = alle)
+    """
+    von_ms = von_ms if von_ms is not None else 0
+    bis_ms = bis_ms if bis_ms is not None else 2 ** 62
+    ergebnis = {}
+    for tag, pro_skript in index["tage"].items():
+        start, ende = tag_grenzen(tag)
+        if ende <= von_ms or start >= bis_ms:
+            continue
+        if start < von_ms or ende > bis_ms:
+            zaehle_tag_teilweise(index, tag, von_ms, bis_ms, skripte, ereignis, ergebnis)
+            continue
+        for sid, pro_ereignis in pro_skript.items():
+            if skripte is not None and sid not in skripte:
+                continue
+            anzahl = sum(n for art, n in pro_ereignis.items() if ereignis is None or art == ereignis)
+            if anzahl:
+                ergebnis[(tag, sid)] = ergebnis.get((tag, sid), 0) + anzahl
+    return ergebnis
+
+
+########################################
+# ALTE TEXT-LOGS ÜBERNEHMEN
+########################################
+
+def importiere_alte_logs(dateien):
+    """
+    Übernimmt alte Text-Logs einmalig als Datensätze in anki_events.import.log.
+    Jede alte Datei hatte ihren eigenen Zähler - zusammen gäbe es doppelte call-Nummern.
+    Darum werden die Einträge nach Zeit sortiert und neu durchnummeriert (1, 2, 3, ...);
+    der laufende Zähler (anki_log) richtet sich nicht nach dieser Datei.
+    Die alten Dateien selbst bleiben unverändert liegen.
+
+    Rückgabe:
+    - Anzahl übernommener Einträge (0, wenn schon importiert)
+    """
+    if os.path.exists(anki_log.import_datei):
+        print("ℹ️  Alte Logs wurden schon übernommen.")
+        return 0
+
+    datensaetze = []
+    for pfad in dateien:
+        try:
+            file = open(pfad, "rb")
+        except FileNotFoundError:
+            print(f"⚠️  {pfad} nicht gefunden - übersprungen")
+            continue
+        with file:
+            for roh in file:
+                try:
+                    zeile = roh.decode("utf-8")
+                except UnicodeDecodeError:
+                    zeile = roh.decode("cp1252")  # ältere Einträge aus Windows
+                treffer = ALTE_ZEILE.match(zeile.strip())
+                if treffer:
+                    count, date, calling_script = treffer.groups()
+                    ms = int(time.mktime(time.strptime(date, "%Y-%m-%d %H:%M:%S")) * 1000)
+                    datensaetze.append((ms, int(count), calling_script))  # count nur als Gleichstand-Regel
+
+    datensaetze.sort()
+    with anki_log.log_sperre():
+        anki_log.registriere_skripte({calling_script for _, _, calling_script in datensaetze})
+        temp = anki_log.import_datei + ".tmp"
+        with open(temp, "w", encoding="utf-8", newline="\n") as file:
+            file.writelines(
+                f"{nummer}\t{ms}\t{anki_log.skript_id(calling_script)}\trun\n"
+                for nummer, (ms, _, calling_script) in enumerate(datensaetze, 1)
+            )
+        os.replace(temp, anki_log.import_datei)
+    return len(datensaetze)
+
+
+########################################
+# KOMMANDOZEILE
+########################################
+
+def main(argumente=None):
+    parser = argparse.ArgumentParser(description="Abfragen über das anki-Ereignis-Log")
+    parser.add_argument("--skript", action="append", help="nur dieses Skript (mehrfach möglich), z.B. luh1a1")
+    parser.add_argument("--von", help="ab JJJJ-MM-TT [HH:MM[:SS]]")
+    parser.add_argument("--bis", help="bis JJJJ-MM-TT [HH:MM[:SS]] (reines Datum: ganzer Tag)")
+    parser.add_argument("--ereignis", help="nur diese Ereignis-Art, z.B. run")
+    parser.add_argument("--pro-tag", action="store_true", help="Anzahl pro Tag statt Gesamtsumme")
+    parser.add_argument("--importiere", action="store_true", help="alte Text-Logs einmalig übernehmen")
+    parser.add_argument("--neueste", type=int, metavar="N", help="die letzten N Einträge zeigen")
+    args = parser.parse_args(argumente)
+
+    if args.importiere:
+        dateien = [os.path.join(anki_log.logs_dir, name) for name in ALTE_LOGS]
+        anzahl = importiere_alte_logs(dateien)
+        if anzahl:
+            print(f"✅ {anzahl} alte Einträge übernommen")
+
+    if args.neueste:
+        anki_log.zeige_neueste(args.neueste)
+        return
+
+    index = lade_index()
+    if aktualisiere_index(index):
+        speichere_index(index)
+
+    tabelle = anki_log.lese_skript_tabelle()
+    skripte = None
+    if args.skript:
+        skripte = set()
+        for name in args.skript:
+            skripte |= finde_skripte(name, tabelle)
+
+    ergebnis = abfrage(
+        index,
+        skripte=skripte,
+        von_ms=lies_zeitpunkt(args.von) if args.von else None,
+        bis_ms=lies_zeitpunkt(args.bis, bis=True) if args.bis else None,
+        ereignis=args.ereignis,
+    )
+
+    if args.pro_tag:
+        zeilen = {}
+        for (tag, sid), anzahl in ergebnis.items():
+            schluessel = (tag, anki_log.skript_name(tabelle.get(sid, sid)))
+            zeilen[schluessel] = zeilen.get(schluessel, 0) + anzahl
+        for (tag, skript), anzahl in sorted(zeilen.items()):
+            print(f"{tag}  {skript:<30} {anzahl:>6}")
+    else:
+        summen = {}
+        for (_, sid), anzahl in ergebnis.items():
+            skript = anki_log.skript_name(tabelle.get(sid, sid))
+            summen[skript] = summen.get(skript, 0) + anzahl
+        for skript, anzahl in sorted(summen.items(), key=lambda eintrag: -eintrag[1]):
+            print(f"{skript:<30} {anzahl:>6}")
+    print(f"{'Summe':<30} {sum(ergebnis.values()):>6}")
+
+
+if __name__ == "__main__":
+    main()
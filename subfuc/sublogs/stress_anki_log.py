@@ -0,0 +1,100 @@
+########################################
+# STRESSTEST FÜR anki_log
+########################################
+# Startet viele Prozesse gleichzeitig, die alle anki_log.run() aufrufen,
+# und prüft danach:
+# - geht kein Eintrag verloren?
+# - ist jede call-Nummer genau einmal vergeben?
+# - stimmt der Zähler am Ende?
+#
+# Aufruf:  python stress_anki_log.py [prozesse] [aufrufe_pro_prozess]
+# Das Log landet in einem temporären Ordner (AKADEMY_LOGS_DIR),
+# das echte logs/ wird nicht angefasst.
+########################################
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+
+def arbeiter(aufrufe, bereit, start_signal, ergebnisse):
+    """Ein Prozess: wartet auf das Startsignal und ruft dann anki_log.run() auf."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import anki_log
+
+    bereit.put(os.getpid())
+    start_signal.wait()
+    start = time.perf_counter()
+    for _ in range(aufrufe):
+        anki_log.run()
+    # multiprocessing-Kinder enden mit os._exit() -> atexit läuft nicht, also selbst leeren
+    anki_log.stoppe_puffer()
+    ergebnisse.put(time.perf_counter() - start)
+
+
+def pruefe_log(logs_dir, erwartet):
+    """Liest das fertige Log und prüft Vollständigkeit und Eindeutigkeit."""
+    segmente = os.path.join(logs_dir, "anki_events")
+    eintraege = []
+    for name in sorted(os.listdir(segmente)):
+        if name.endswith(".log"):
+            with open(os.path.join(segmente, name), encoding="utf-8") as file:
+                eintraege += [zeile for zeile in file if zeile.strip()]
+    nummern = [int(zeile.split("\t", 1)[0]) for zeile in eintraege]
+    with open(os.path.join(logs_dir, "anki_logn.count"), encoding="ascii") as file:
+        zaehler = int(file.read())
+
+    fehler = []
+    if len(eintraege) != erwartet:
+        fehler.append(f"{erwartet - len(eintraege)} Einträge verloren ({len(eintraege)}/{erwartet})")
+    if len(set(nummern)) != len(nummern):
+        fehler.append(f"{len(nummern) - len(set(nummern))} doppelte call-Nummern")
+    if sorted(nummern) != list(range(1, erwartet + 1)):
+        fehler.append("call-Nummern sind nicht lückenlos 1..N")
+    if nummern != sorted(nummern):
+        fehler.append("Einträge stehen nicht in Nummern-Reihenfolge")
+    if zaehler != erwartet:
+        fehler.append(f"Zähler steht auf {zaehler}, erwartet {erwartet}")
+    return fehler
+
+
+def main():
+    prozesse = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    aufrufe = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    erwartet = prozesse * aufrufe
+
+    with tempfile.TemporaryDirectory() as logs_dir:
+        os.environ["AKADEMY_LOGS_DIR"] = logs_dir  # wird an die Kind-Prozesse vererbt
+        print(f"🔧 {prozesse} Prozesse × {aufrufe} Aufrufe = {erwartet} Einträge")
+
+        bereit = multiprocessing.Queue()
+        start_signal = multiprocessing.Event()
+        ergebnisse = multiprocessing.Queue()
+        alle = [multiprocessing.Process(target=arbeiter, args=(aufrufe, bereit, start_signal, ergebnisse))
+                for _ in range(prozesse)]
+        for prozess in alle:
+            prozess.start()
+        for _ in alle:
+            bereit.get()  # erst loslegen, wenn alle Prozesse anki_log importiert haben
+        gesamt_start = time.perf_counter()
+        start_signal.set()
+        zeiten = [ergebnisse.get() for _ in alle]
+        for prozess in alle:
+            prozess.join()
+        gesamt = time.perf_counter() - gesamt_start
+
+        fehler = pruefe_log(logs_dir, erwartet)
+
+    print(f"⏱️  Gesamtzeit: {gesamt:.2f} s  ({erwartet / gesamt:,.0f} Einträge/s)")
+    print(f"⏱️  Langsamster Prozess: {max(zeiten):.2f} s, schnellster: {min(zeiten):.2f} s")
+    if fehler:
+        for text in fehler:
+            print(f"❌ {text}")
+        sys.exit(1)
+    print("✅ Keine Einträge verloren, alle call-Nummern eindeutig.")
+
+
+if __name__ == "__main__":
+    main()